@@ -1,7 +1,10 @@
 # api/dynamic_api.py
 
 from django.apps import apps
-from rest_framework import serializers, viewsets, routers
+from django.conf import settings
+from rest_framework import viewsets, routers
+from core.common.fast_serializer import FastListMixin
+from core.utils.dynamic_utils import build_serializer_class
 from django.urls import path, include
 from collections import defaultdict
 
@@ -29,22 +32,15 @@ def generate_api_for_app(app_name, category):
         if not model._meta.managed:
             continue
 
-        serializer_meta = type('Meta', (), {
-            'model': model,
-            'fields': '__all__'
-        })
-        serializer_class = type(
-            f'{model.__name__}Serializer',
-            (serializers.ModelSerializer,),
-            {'Meta': serializer_meta}
-        )
+        serializer_class = build_serializer_class(model)
 
         viewset_class = type(
             f'{model.__name__}ViewSet',
-            (viewsets.ModelViewSet,),
+            (FastListMixin, viewsets.ModelViewSet),
             {
                 'queryset': model.objects.all(),
                 'serializer_class': serializer_class,
+                'fast_list': getattr(settings, 'DYNAMIC_API_FAST_LIST', False),
                 'http_method_names': ['get', 'post', 'put', 'patch', 'delete'],
                 # 'permission_classes': [YourPermissionClass],
             }
@@ -1,21 +1,29 @@
 import logging
+from functools import lru_cache
 from openai import OpenAI
 from django.conf import settings
-from .pinecone_helper import PineconeHelper
-from sentence_transformers import SentenceTransformer
+from .embedding_service import get_embedding_service
+from .vector_index import get_vector_index
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key):
+    # One client per key per process, so its HTTP connection pool is reused
+    return OpenAI(api_key=api_key)
+
+
 class AIHelper:
     def __init__(self, api_key):
-        self.client = OpenAI(api_key=api_key)
-        self.pinecone_helper = PineconeHelper()
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.client = get_openai_client(api_key)
+        self.vector_index = get_vector_index()
+        self.embeddings = get_embedding_service()
 
     def query_pinecone(self, data_to_send):
-        query_vector = self.model.encode(data_to_send)
+        query_vector = self.embeddings.encode(data_to_send)
         logger.debug(f"Query vector: {query_vector}")  # Log the query vector
-        results = self.pinecone_helper.query_index(query_vector)
+        results = self.vector_index.query(query_vector)
         logger.debug(f"Pinecone query results: {results}")  # Log the results
         return results
 
@@ -54,11 +54,18 @@ def create_openai_client():
 
 import openai
 
+CLIENT_FACTORIES = {
+    "mistral": create_mistral_client,
+    "openai": create_openai_client,
+}
+
 class AIService:
-    def __init__(self):
+    def __init__(self, providers=None):
+        # Only the providers a caller needs are built, so e.g. OpenAI streaming works without a Mistral key
         self.clients = {
-            "mistral": create_mistral_client(),
-            "openai": create_openai_client(),
+            provider: factory()
+            for provider, factory in CLIENT_FACTORIES.items()
+            if providers is None or provider in providers
         }
         self.models_config = {
             provider: config["models"] for provider, config in AI_PROVIDERS.items()
@@ -81,7 +88,7 @@ class AIService:
 
     def _get_openai_chat_response(self, client, model_name, messages):
         # Correct method call for OpenAI
-        chat_response = client.ChatCompletion.create(
+        chat_response = client.chat.completions.create(
             model=model_name,
             messages=messages,
             max_tokens=150  # Set a reasonable default or derive from context
@@ -89,6 +96,38 @@ class AIService:
         response_content = chat_response.choices[0].message.content
         return response_content
 
+    def stream_chat_response(self, provider_name, model_name, messages, max_tokens=None):
+        """
+        Yield the completion text chunk by chunk as the provider produces it,
+        instead of waiting for the whole response like get_chat_response.
+        """
+        if provider_name not in self.clients:
+            raise ValueError(f"Unsupported provider: {provider_name}")
+        model_config = self.models_config[provider_name].get(model_name)
+        if not model_config:
+            raise ValueError(f"Model '{model_name}' is not configured for provider '{provider_name}'.")
+        if provider_name != "openai":
+            raise ValueError(f"Streaming is not supported for provider: {provider_name}")
+        return self._stream_openai_chat_response(
+            self.clients[provider_name], model_config['model'], messages, max_tokens
+        )
+
+    def _stream_openai_chat_response(self, client, model_name, messages, max_tokens=None):
+        params = {"model": model_name, "messages": messages, "stream": True}
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+        stream = client.chat.completions.create(**params)
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        finally:
+            # Release the HTTP connection if the consumer stops early
+            stream.close()
+
     def _get_mistral_chat_response(self, client, model_name, messages):
         # Implement Mistral-specific chat response logic here
         # Placeholder for actual implementation
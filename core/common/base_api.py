@@ -1,5 +1,6 @@
 # core/common/base_api.py
 import logging
+import time
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -10,6 +11,7 @@ from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
 from django.http import JsonResponse
 from rest_framework.pagination import PageNumberPagination
 from rest_framework import generics
+from .request_logging import log_api_call
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -98,6 +100,7 @@ class BaseApiView(generics.GenericAPIView, ApiResponseMixin):
     # Override dispatch method for additional logging and pre/post processing
 
     def dispatch(self, request, *args, **kwargs):
+        self._request_started_at = time.perf_counter()
         # Check if 'pre_process' is implemented in the current viewset instance
         if hasattr(self, 'pre_process'):
             self.pre_process(request)
@@ -105,12 +108,11 @@ class BaseApiView(generics.GenericAPIView, ApiResponseMixin):
         return super().dispatch(request, *args, **kwargs)
 
 
-    def log_request(self, request):
-        # Log the request method, path, and any other relevant information
-        logger.info(f"Received {request.method} request for {request.get_full_path()}")
-        # You can also log the body of the request, but be cautious with sensitive data
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            logger.debug(f"Request data: {request.data}")
+    def log_request(self, request, response):
+        # Sampled, size-capped and redacted; see core.common.request_logging and API_REQUEST_LOGGING
+        started_at = getattr(self, '_request_started_at', None)
+        if started_at is not None:
+            log_api_call(request, response, started_at)
 
     # Additional methods as needed for your application
 
@@ -137,14 +139,11 @@ class BaseApiView(generics.GenericAPIView, ApiResponseMixin):
             # or handle it here directly if you want to customize the response
             raise NotAuthenticated(detail=str(exc))
 
-    def log_request(self, request):
-        # Custom logging logic here
-        pass
-
   
     def finalize_response(self, request, response, *args, **kwargs):
         # Call the post_process method before the response is finalized
         response = self.post_process(response)
+        self.log_request(request, response)
         # Now call the parent class's finalize_response method to complete the process
         return super().finalize_response(request, response, *args, **kwargs)
 
@@ -153,15 +152,6 @@ class BaseApiView(generics.GenericAPIView, ApiResponseMixin):
         if isinstance(response, JsonResponse):
             response['X-Custom-Header'] = 'Custom Value'
 
-        # Log the response data for auditing (be careful with sensitive data)
-        # Make sure to log the data before creating the JsonResponse.
-        # You can access the data from the response content if it's a JsonResponse.
-        if isinstance(response, JsonResponse):
-            logger.info(f"Response content: {response.content}")
-        else:
-            # If it's not a JsonResponse, it might be a DRF Response object which does have a `data` attribute.
-            logger.info(f"Response data: {response.data}")
-
         # Perform any other response transformations or post-processing here
 
         # Return the modified response
@@ -6,16 +6,21 @@ from rest_framework import status
 from rest_framework import viewsets
 from rest_framework.response import Response
 from .base_api import BaseApiView
+from .fast_serializer import FastListMixin
 
 
 
-class BaseViewSet(viewsets.ModelViewSet, BaseApiView):
+class BaseViewSet(FastListMixin, viewsets.ModelViewSet, BaseApiView):
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
+        # fast_list = True on a subclass serves list rows straight from .values()
+        fast = self.get_fast_serializer()
+        if fast is not None:
+            queryset = fast.project(queryset)
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            paginated_data = self.get_paginated_response(serializer.data).data
+            page_data = fast.to_representation(page, request) if fast else self.get_serializer(page, many=True).data
+            paginated_data = self.get_paginated_response(page_data).data
             data = {
                 'status': 'success',
                 'message': 'Success',
@@ -23,11 +28,10 @@ class BaseViewSet(viewsets.ModelViewSet, BaseApiView):
             }
             return Response(data)
 
-        serializer = self.get_serializer(queryset, many=True)
         data = {
             'status': 'success',
             'message': 'Success',
-            'data': serializer.data
+            'data': fast.to_representation(queryset, request) if fast else self.get_serializer(queryset, many=True).data
         }
         return Response(data)
 
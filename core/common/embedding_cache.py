@@ -0,0 +1,82 @@
+# core/common/embedding_cache.py
+
+import hashlib
+import logging
+import time
+import numpy as np
+import redis
+from .redis_utils import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100000
+
+
+class EmbeddingCache:
+    """
+    Redis cache of embeddings keyed by (model name, sha256 of text). Vectors
+    are stored as raw float32 bytes, 1.5 KB for a 384-dim MiniLM vector. A
+    sorted set of last-access times per model gives LRU eviction once the
+    cache grows past max_entries.
+    """
+
+    def __init__(self, model_name, client=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.model_name = model_name
+        self.client = client or get_redis_connection()
+        self.max_entries = max_entries
+        self.lru_key = f"embeddings:{model_name}:lru"
+
+    @staticmethod
+    def text_hash(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _key(self, digest):
+        return f"embeddings:{self.model_name}:{digest}"
+
+    def get_many(self, texts):
+        """Return a list aligned with texts holding a vector or None for each miss."""
+        if not texts:
+            return []
+        digests = [self.text_hash(text) for text in texts]
+        try:
+            values = self.client.mget([self._key(digest) for digest in digests])
+            hits = {digest: time.time() for digest, value in zip(digests, values) if value is not None}
+            if hits:
+                self.client.zadd(self.lru_key, hits)
+        except redis.RedisError as e:
+            logger.error(f"Redis error reading embedding cache: {e}")
+            return [None] * len(texts)
+        return [
+            np.frombuffer(value, dtype=np.float32) if value is not None else None
+            for value in values
+        ]
+
+    def put_many(self, texts, vectors):
+        if not texts:
+            return
+        now = time.time()
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            access = {}
+            for text, vector in zip(texts, vectors):
+                digest = self.text_hash(text)
+                pipe.set(self._key(digest), np.asarray(vector, dtype=np.float32).tobytes())
+                access[digest] = now
+            pipe.zadd(self.lru_key, access)
+            pipe.zcard(self.lru_key)
+            size = pipe.execute()[-1]
+            if size > self.max_entries:
+                self._evict(size - self.max_entries)
+        except redis.RedisError as e:
+            logger.error(f"Redis error writing embedding cache: {e}")
+
+    def _evict(self, count):
+        oldest = self.client.zpopmin(self.lru_key, count)
+        if oldest:
+            self.client.delete(*[self._key(digest.decode()) for digest, _ in oldest])
+
+    def get(self, text):
+        return self.get_many([text])[0]
+
+    def put(self, text, vector):
+        self.put_many([text], [vector])
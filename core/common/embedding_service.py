@@ -0,0 +1,98 @@
+# core/common/embedding_service.py
+
+import logging
+import threading
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+DEFAULT_BATCH_SIZE = 64
+
+
+class EmbeddingService:
+    """
+    Process-wide SentenceTransformer holder. Each model is loaded once per
+    process on first use (or up front with preload() in a forking parent so
+    workers share its pages copy-on-write) instead of once per AIHelper.
+    """
+
+    _models = {}
+    _lock = threading.Lock()
+
+    def __init__(self, model_name=None, batch_size=None, cache=None):
+        self.model_name = model_name or getattr(settings, 'EMBEDDING_MODEL_NAME', DEFAULT_EMBEDDING_MODEL)
+        self.batch_size = batch_size or getattr(settings, 'EMBEDDING_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        if cache is None and getattr(settings, 'EMBEDDING_CACHE_ENABLED', False):
+            cache = self._build_cache()
+        self.cache = cache
+
+    def _build_cache(self):
+        from .embedding_cache import EmbeddingCache
+        from .redis_utils import get_redis_connection
+
+        client = get_redis_connection()
+        if client is None:
+            # Without Redis every text goes through the model
+            logger.debug("REDIS_URL is not set, embedding cache disabled")
+            return None
+        return EmbeddingCache(
+            self.model_name,
+            client=client,
+            max_entries=getattr(settings, 'EMBEDDING_CACHE_MAX_ENTRIES', 100000),
+        )
+
+    @property
+    def model(self):
+        model = self._models.get(self.model_name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(self.model_name)
+                if model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    logger.info(f"Loading embedding model {self.model_name}")
+                    model = SentenceTransformer(self.model_name)
+                    self._models[self.model_name] = model
+        return model
+
+    def encode(self, text):
+        return self.encode_many([text])[0]
+
+    def encode_many(self, texts, batch_size=None):
+        """
+        Encode a list of texts in one vectorized call. Returns a float32 array
+        of shape (len(texts), dimension). With a cache configured, only texts
+        missing from it are sent through the model.
+        """
+        texts = list(texts)
+        if self.cache is None or not texts:
+            return self._encode(texts, batch_size)
+        cached = self.cache.get_many(texts)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = self._encode(missing_texts, batch_size)
+            self.cache.put_many(missing_texts, encoded)
+            for i, vector in zip(missing, encoded):
+                cached[i] = vector
+        return np.vstack(cached).astype(np.float32, copy=False)
+
+    def _encode(self, texts, batch_size=None):
+        return self.model.encode(
+            texts,
+            batch_size=batch_size or self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+    @classmethod
+    def preload(cls, model_name=None):
+        service = cls(model_name)
+        service.model
+        return service
+
+
+def get_embedding_service(model_name=None):
+    return EmbeddingService(model_name)
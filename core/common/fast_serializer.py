@@ -0,0 +1,191 @@
+# core/common/fast_serializer.py
+
+import logging
+import threading
+from collections import defaultdict
+from django.db import models
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField, RelatedField
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+# DRF fields whose to_representation leaves a .values() result unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.FloatField,
+    serializers.BooleanField,
+    PrimaryKeyRelatedField,
+)
+
+
+class FastReadSerializer:
+    """
+    Read-only projection of a ModelSerializer. The serializer's fields are
+    compiled once into a .values() column list and a converter per column,
+    and rows are emitted as plain dicts, so a list response skips building
+    model instances and DRF's per-field dispatch. Output matches the
+    ModelSerializer's .data for the field types it supports; compile()
+    returns None for anything else so callers can fall back.
+    """
+
+    def __init__(self, model, columns, converters, file_columns, m2m_fields):
+        self.model = model
+        self.columns = columns
+        self.converters = converters
+        self.file_columns = file_columns
+        self.m2m_fields = m2m_fields
+
+    @classmethod
+    def compile(cls, serializer_class):
+        meta = getattr(serializer_class, 'Meta', None)
+        model = getattr(meta, 'model', None)
+        if model is None:
+            return None
+        columns, converters, file_columns, m2m_fields = [], [], {}, []
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if not field.source or field.source == '*' or '.' in field.source:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except Exception:
+                return None
+
+            if isinstance(field, ManyRelatedField):
+                if not cls._supports_m2m(field, model_field):
+                    return None
+                m2m_fields.append((name, model_field))
+                continue
+            if isinstance(field, serializers.Serializer):
+                # Nested serializers (depth > 0) need the full serializer
+                return None
+            if isinstance(field, serializers.ModelField):
+                # ModelField reads its value off a model instance, which a .values() row is not
+                return None
+            if isinstance(field, RelatedField) and not cls._is_plain_pk(field):
+                # Slug, string and hyperlinked relations read the related row
+                return None
+
+            if not model_field.concrete:
+                return None
+            # attname reads the raw FK column (author_id), which is what PrimaryKeyRelatedField emits
+            column = model_field.attname
+            columns.append(column)
+            if isinstance(field, serializers.FileField):
+                file_columns[column] = model_field
+                converters.append((name, column, None))
+            elif isinstance(field, PASSTHROUGH_FIELDS) and not isinstance(field, serializers.ChoiceField):
+                converters.append((name, column, None))
+            elif isinstance(field, serializers.JSONField) and not field.binary:
+                converters.append((name, column, None))
+            else:
+                # UUID, datetime, Decimal, choices: reuse the DRF field's own conversion
+                converters.append((name, column, field.to_representation))
+        pk_name = model._meta.pk.attname
+        if m2m_fields and pk_name not in columns:
+            columns.append(pk_name)
+        return cls(model, columns, converters, file_columns, m2m_fields)
+
+    @staticmethod
+    def _is_plain_pk(field):
+        return isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None
+
+    @classmethod
+    def _supports_m2m(cls, field, model_field):
+        # Only forward many-to-many fields are read from the join table; reverse relations are not
+        if not isinstance(model_field, models.ManyToManyField) or not cls._is_plain_pk(field.child_relation):
+            return False
+        # The serializer lists related ids in the target's default ordering, which the join table does not have
+        return not model_field.related_model._meta.ordering
+
+    def project(self, queryset):
+        """Turn a model queryset into the flat .values() projection this serializer reads."""
+        # Prefetches in get_queryset() are meant for the instance path; rows carry none of them
+        return queryset.prefetch_related(None).values(*self.columns)
+
+    def to_representation(self, rows, request=None):
+        rows = list(rows)
+        m2m_values = self._load_m2m(rows)
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in self.converters:
+                value = row[column]
+                if value is not None:
+                    if column in self.file_columns:
+                        value = self._file_url(column, value, request)
+                    elif convert is not None:
+                        value = convert(value)
+                item[name] = value
+            for name, _ in self.m2m_fields:
+                item[name] = m2m_values[name].get(row[self.model._meta.pk.attname], [])
+            data.append(item)
+        return data
+
+    def _file_url(self, column, name, request):
+        if not name:
+            return None
+        url = self.file_columns[column].storage.url(name)
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    def _load_m2m(self, rows):
+        # One query per many-to-many field for the whole page, through the join table
+        result = {}
+        if not self.m2m_fields or not rows:
+            return result
+        pk_name = self.model._meta.pk.attname
+        ids = [row[pk_name] for row in rows]
+        for name, model_field in self.m2m_fields:
+            through = model_field.remote_field.through
+            source = through._meta.get_field(model_field.m2m_field_name()).attname
+            target = through._meta.get_field(model_field.m2m_reverse_field_name()).attname
+            grouped = defaultdict(list)
+            for source_id, target_id in through.objects.filter(**{f'{source}__in': ids}).values_list(source, target):
+                grouped[source_id].append(target_id)
+            result[name] = grouped
+        return result
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+def get_fast_serializer(serializer_class):
+    """Compile (once) and return the fast path for serializer_class, or None if unsupported."""
+    if serializer_class in _compiled:
+        return _compiled[serializer_class]
+    with _compiled_lock:
+        if serializer_class not in _compiled:
+            fast = FastReadSerializer.compile(serializer_class)
+            if fast is None:
+                logger.debug(f"{serializer_class.__name__} is not supported by the fast read path")
+            _compiled[serializer_class] = fast
+    return _compiled[serializer_class]
+
+
+class FastListMixin:
+    """
+    Opt-in fast list path for ModelViewSets. Set fast_list = True on a viewset
+    whose list output is plain model fields; unsupported serializers fall
+    back to the normal serializer automatically.
+    """
+    fast_list = False
+
+    def get_fast_serializer(self):
+        if not self.fast_list:
+            return None
+        return get_fast_serializer(self.get_serializer_class())
+
+    def list(self, request, *args, **kwargs):
+        fast = self.get_fast_serializer()
+        if fast is None:
+            return super().list(request, *args, **kwargs)
+        queryset = fast.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(fast.to_representation(page, request))
+        return Response(fast.to_representation(queryset, request))
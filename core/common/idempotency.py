@@ -0,0 +1,216 @@
+# core/common/idempotency.py
+
+import functools
+import hashlib
+import json
+import logging
+import redis
+from datetime import timedelta
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from core.common.redis_utils import get_redis_connection
+from core.models.models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+IDEMPOTENCY_KEY = 'idempotency:{}'
+MAX_KEY_LENGTH = 255
+
+# Recovery points, as stored on IdempotencyKey
+STARTED = 'started'
+FINISHED = 'finished'
+
+
+def _lock_ttl():
+    # A request still "in progress" after this long is assumed dead and its key can be retried
+    return getattr(settings, 'IDEMPOTENCY_LOCK_TTL', 60)
+
+
+def _response_ttl():
+    return getattr(settings, 'IDEMPOTENCY_RESPONSE_TTL', 24 * 60 * 60)
+
+
+def _conflict(message):
+    return Response({"success": False, "error": message}, status=status.HTTP_409_CONFLICT)
+
+
+def _mismatch():
+    return Response(
+        {"success": False, "error": f"{IDEMPOTENCY_HEADER} was already used with a different request."},
+        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
+
+
+def _unavailable():
+    return Response(
+        {"success": False, "error": "The request could not be made safe to retry; try again shortly."},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+def _replay(stored):
+    return Response(stored['body'], status=stored['status'], headers={REPLAYED_HEADER: 'true'})
+
+
+class IdempotentRequest:
+    """
+    One keyed request: the key is scoped to the user and endpoint, and the
+    request body is fingerprinted so a key reused for a different request is
+    rejected instead of replaying the wrong response.
+    """
+
+    def __init__(self, request, key):
+        self.request = request
+        user_id = getattr(request.user, 'pk', None)
+        scope = f"{user_id}:{request.method}:{request.path}:{key}"
+        self.key = hashlib.sha256(scope.encode()).hexdigest()
+        self.fingerprint = hashlib.sha256(
+            json.dumps(request.data, sort_keys=True, cls=JSONEncoder).encode()
+        ).hexdigest()
+        self.view_started = False
+
+    def run(self, view):
+        # Store errors fall through to the next store; errors raised by the view itself never re-run it
+        client = get_redis_connection()
+        if client is not None:
+            try:
+                return self._run_with_redis(client, view)
+            except redis.RedisError as e:
+                if self.view_started:
+                    raise
+                logger.error(f"Redis error on idempotency key, falling back to the database: {e}")
+        try:
+            return self._run_with_database(view)
+        except DatabaseError as e:
+            if self.view_started:
+                raise
+            # Running the view without a key store could repeat a charge the client is retrying, so refuse instead
+            logger.error(f"Idempotency key store unavailable, refusing the request: {e}")
+            return _unavailable()
+
+    def _execute(self, view):
+        self.view_started = True
+        return view()
+
+    def _stored(self, response):
+        # Stored as rendered JSON types so a replay renders exactly like the original
+        return {
+            'fingerprint': self.fingerprint,
+            'status': response.status_code,
+            'body': json.loads(json.dumps(response.data, cls=JSONEncoder)),
+        }
+
+    def _should_store(self, response):
+        # Server errors are worth retrying for real, so the key is released instead
+        return isinstance(response, Response) and response.status_code < 500
+
+    def _run_with_redis(self, client, view):
+        redis_key = IDEMPOTENCY_KEY.format(self.key)
+        lock = json.dumps({'fingerprint': self.fingerprint, 'recovery_point': STARTED})
+        if not client.set(redis_key, lock, nx=True, ex=_lock_ttl()):
+            stored = client.get(redis_key)
+            if stored is None:
+                # Expired between the two calls; let the client retry rather than race for it here
+                return _conflict("A request with this idempotency key is in progress.")
+            stored = json.loads(stored)
+            if stored['fingerprint'] != self.fingerprint:
+                return _mismatch()
+            if stored['recovery_point'] != FINISHED:
+                return _conflict("A request with this idempotency key is in progress.")
+            return _replay(stored)
+
+        try:
+            response = self._execute(view)
+        except Exception:
+            self._forget(client, redis_key)
+            raise
+        if self._should_store(response):
+            stored = dict(self._stored(response), recovery_point=FINISHED)
+            try:
+                client.set(redis_key, json.dumps(stored), ex=_response_ttl())
+            except redis.RedisError as e:
+                # The work is done; a retry now reruns it once the lock expires, which is no worse than before
+                logger.error(f"Redis error storing idempotent response: {e}")
+        else:
+            self._forget(client, redis_key)
+        return response
+
+    def _forget(self, client, redis_key):
+        try:
+            client.delete(redis_key)
+        except redis.RedisError as e:
+            logger.error(f"Redis error releasing idempotency key, it frees itself when the lock expires: {e}")
+
+    def _run_with_database(self, view):
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    idempotency_key=self.key,
+                    locked_at=now,
+                    request_method=self.request.method,
+                    request_path=self.request.path[:MAX_KEY_LENGTH],
+                    request_params={'fingerprint': self.fingerprint},
+                    recovery_point=STARTED,
+                )
+        except IntegrityError:
+            record = IdempotencyKey.objects.filter(idempotency_key=self.key).first()
+            if record is None:
+                return _conflict("A request with this idempotency key is in progress.")
+            if (record.request_params or {}).get('fingerprint') != self.fingerprint:
+                return _mismatch()
+            if record.recovery_point == FINISHED:
+                return _replay({'status': record.response_code, 'body': record.response_body})
+            # Take over a lock whose holder died, but only if nobody else took it first
+            stale = record.locked_at is None or record.locked_at < now - timedelta(seconds=_lock_ttl())
+            if not stale or not IdempotencyKey.objects.filter(pk=record.pk, locked_at=record.locked_at).update(locked_at=now):
+                return _conflict("A request with this idempotency key is in progress.")
+
+        try:
+            response = self._execute(view)
+        except Exception:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+            raise
+        if self._should_store(response):
+            stored = self._stored(response)
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                response_code=stored['status'],
+                response_body=stored['body'],
+                recovery_point=FINISHED,
+                locked_at=None,
+            )
+        else:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+        return response
+
+
+def idempotent(view_method):
+    """
+    Make a viewset action safe to retry. A request carrying an
+    Idempotency-Key header runs once; retries with the same key get the
+    stored response back (marked Idempotent-Replayed) without running the
+    view again, and a retry that arrives while the first is still running
+    gets 409. If no key store can be reached the request is refused with
+    503 rather than run unprotected. Requests without the header are
+    handled as before.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"success": False, "error": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return IdempotentRequest(request, key).run(lambda: view_method(self, request, *args, **kwargs))
+
+    return wrapper
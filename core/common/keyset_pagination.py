@@ -0,0 +1,66 @@
+# core/common/keyset_pagination.py
+
+import base64
+import json
+import uuid
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ParseError
+
+
+class KeysetPagination:
+    """
+    Seek pagination over a descending (created_at, id) ordering. Each page is
+    an index range scan from the last row of the previous page, so the cost
+    stays flat however deep the client pages, unlike OFFSET pagination.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    timestamp_field = 'created_at'
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, row):
+        # Rows may be model instances or dicts from .values()
+        if isinstance(row, dict):
+            timestamp, pk = row[self.timestamp_field], row['id']
+        else:
+            timestamp, pk = getattr(row, self.timestamp_field), row.pk
+        raw = json.dumps([timestamp.isoformat(), str(pk)])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            timestamp, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            parsed = parse_datetime(timestamp)
+            if parsed is None:
+                raise ValueError(timestamp)
+            return parsed, uuid.UUID(pk)
+        except (ValueError, TypeError, json.JSONDecodeError):
+            raise ParseError("Invalid cursor.")
+
+    def paginate_queryset(self, queryset, request):
+        """
+        Return (rows, next_cursor). One extra row is fetched to detect whether
+        another page exists, so no COUNT query is issued.
+        """
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            timestamp, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f'{self.timestamp_field}__lt': timestamp})
+                | Q(**{self.timestamp_field: timestamp, 'id__lt': pk})
+            )
+        rows = list(queryset.order_by(f'-{self.timestamp_field}', '-id')[:page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            return rows, self.encode_cursor(rows[-1])
+        return rows, None
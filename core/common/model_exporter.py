@@ -0,0 +1,111 @@
+# core/common/model_exporter.py
+
+import json
+import logging
+import os
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MAX_SHARD_BYTES = 50 * 1024 * 1024
+
+_dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=str).encode
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def field_converter(field):
+    """
+    Pick the conversion for a field's .values() output once per field, so the
+    row loop never has to probe a value's type or trial-serialize it.
+    """
+    if isinstance(field, (models.UUIDField, models.DecimalField, models.GenericIPAddressField)):
+        return str
+    if isinstance(field, (models.DateTimeField, models.DateField, models.TimeField)):
+        return _isoformat
+    if isinstance(field, models.DurationField):
+        return lambda value: value.total_seconds()
+    if isinstance(field, models.BinaryField):
+        return lambda value: bytes(value).hex()
+    # Strings, numbers, booleans, JSON and file names are already JSON-native
+    return None
+
+
+class ShardedNDJSONWriter:
+    """
+    Write NDJSON lines to <prefix>.<n>.ndjson.txt files, starting a new shard
+    when the current one would exceed max_bytes. The .txt suffix keeps the
+    shards accepted by the OpenAI file_search uploader.
+    """
+
+    def __init__(self, directory, prefix, max_bytes=DEFAULT_MAX_SHARD_BYTES):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.paths = []
+        self._file = None
+        self._size = 0
+
+    def _open_next(self):
+        self.close()
+        path = os.path.join(self.directory, f"{self.prefix}.{len(self.paths) + 1:04d}.ndjson.txt")
+        self._file = open(path, 'wb')
+        self._size = 0
+        self.paths.append(path)
+
+    def write(self, line):
+        data = line.encode('utf-8') + b'\n'
+        if self._file is None or (self._size and self._size + len(data) > self.max_bytes):
+            self._open_next()
+        self._file.write(data)
+        self._size += len(data)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class StreamingModelExporter:
+    """
+    Export model rows as NDJSON in constant memory: rows come from
+    .values().iterator(chunk_size) and are encoded and written one at a time.
+    """
+
+    def __init__(self, directory, chunk_size=DEFAULT_CHUNK_SIZE, max_shard_bytes=DEFAULT_MAX_SHARD_BYTES):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.max_shard_bytes = max_shard_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def export_model(self, model, excluded_fields=(), queryset=None):
+        """Write every row of model (or of queryset) and return (shard paths, row count)."""
+        fields = [f for f in model._meta.concrete_fields if f.name not in excluded_fields or f.primary_key]
+        # attname gives the raw FK column (author_id) without a join
+        columns = [f.attname for f in fields]
+        converters = [(f.attname, field_converter(f)) for f in fields]
+        label = model._meta.label
+
+        if queryset is None:
+            queryset = model._default_manager.all()
+        rows = queryset.order_by('pk').values(*columns).iterator(chunk_size=self.chunk_size)
+
+        writer = ShardedNDJSONWriter(self.directory, label, self.max_shard_bytes)
+        count = 0
+        try:
+            for row in rows:
+                for name, convert in converters:
+                    if convert is not None:
+                        value = row[name]
+                        if value is not None:
+                            row[name] = convert(value)
+                row['_model'] = label
+                writer.write(_dumps(row))
+                count += 1
+        finally:
+            writer.close()
+        logger.info(f"Exported {count} rows of {label} into {len(writer.paths)} shard(s)")
+        return writer.paths, count
@@ -0,0 +1,37 @@
+# core/common/parsers.py
+
+import codecs
+import io
+import re
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from .renderers import ORJSONRenderer, orjson
+
+# orjson reads integers outside the 64-bit range as floats; any run of 19+ digits
+# (even inside a string, which only costs the fast path) goes through JSONParser
+_WIDE_NUMBER = re.compile(rb'\d{19,}')
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser backed by orjson, which reads the UTF-8 body directly instead
+    of through a text decoder. orjson rejects NaN/Infinity like DRF's strict
+    mode. Bodies orjson would read differently (integers wider than 64 bits)
+    or refuses (including malformed JSON, so errors read the same), non-UTF-8
+    bodies and a missing orjson go through JSONParser.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not _WIDE_NUMBER.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse(io.BytesIO(body), media_type, parser_context)
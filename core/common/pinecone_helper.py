@@ -4,14 +4,29 @@ from pinecone import Pinecone
 
 logger = logging.getLogger(__name__)
 
+_pinecone_client = None
+
+def get_pinecone_client():
+    global _pinecone_client
+    if _pinecone_client is None:
+        _pinecone_client = Pinecone(api_key=settings.PINECONE_API_KEY)
+    return _pinecone_client
+
 class PineconeHelper:
     def __init__(self):
-        self.pc = Pinecone(api_key=settings.PINECONE_API_KEY)
+        self.pc = get_pinecone_client()
         self.index_name = "aisurance"
+        self._index = None
+
+    def get_index(self):
+        # Reuse the index handle rather than building one per query
+        if self._index is None:
+            self._index = self.pc.Index(self.index_name)
+        return self._index
 
     def query_index(self, query_vector, top_k=10):
         try:
-            index = self.pc.Index(self.index_name)
+            index = self.get_index()
             # Convert query_vector to list
             query_vector = query_vector.tolist()
             results = index.query(vector=query_vector, top_k=top_k)
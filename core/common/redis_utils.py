@@ -17,4 +17,21 @@ def get_value_from_redis(key):
     value = client.get(key)
     if value:
         return value.decode('utf-8')  # Assuming the stored data is string encoded as utf-8
-    return None
\ No newline at end of file
+    return None
+
+_connection_pool = None
+
+def get_redis_connection():
+    """
+    Return a Redis client backed by a process-wide connection pool built from
+    settings.REDIS_URL, so callers on hot paths do not open a socket per call.
+    Returns None when REDIS_URL is not configured; callers fall back to the
+    database or skip their Redis bookkeeping.
+    """
+    global _connection_pool
+    if not getattr(settings, 'REDIS_URL', None):
+        return None
+    if _connection_pool is None:
+        _connection_pool = redis.ConnectionPool.from_url(settings.REDIS_URL)
+    return redis.Redis(connection_pool=_connection_pool)
+
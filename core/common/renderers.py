@@ -0,0 +1,53 @@
+# core/common/renderers.py
+
+import re
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# DRF's encoder still handles the types orjson has no native form for (Decimal, lazy strings, querysets)
+_drf_default = JSONEncoder().default
+
+# Float tokens orjson writes differently from json: exponent form (1e16 for 1e+16, 1e-7 for 1e-07)
+# and [1e-5, 1e-4) in plain notation (0.00001 for 1e-05). Anchored on JSON punctuation so digits
+# inside strings (UUIDs, text) rarely match; a match inside a string only costs a re-render.
+_STDLIB_FLOAT = re.compile(rb'(?:^|[:,\[])-?(?:[0-9]+(?:\.[0-9]+)?e-?[0-9]+|0\.0000[0-9]+)(?=[,\]}]|$)')
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson. UUIDs, datetimes, dicts and lists are
+    encoded natively in C; everything else goes through DRF's own encoder.
+    Output holding a float orjson writes differently from JSONRenderer
+    (found by scanning the rendered bytes, not the data) and data orjson
+    cannot write at all (integers wider than 64 bits) are rendered again by
+    JSONRenderer, as are indented output (the browsable API, ?indent=) and a
+    missing orjson.
+
+    One difference is accepted: NaN and Infinity are written as null, where
+    JSONRenderer raises ValueError and the request fails.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=self.options)
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        if _STDLIB_FLOAT.search(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same \u2028/\u2029 escaping as JSONRenderer, so output stays a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,155 @@
+# core/common/request_logging.py
+
+import functools
+import logging
+import random
+import re
+import time
+from django.conf import settings
+
+logger = logging.getLogger('api.requests')
+
+DEFAULTS = {
+    # Fraction of requests logged, overridable per URL name in ROUTE_SAMPLE_RATES
+    'SAMPLE_RATE': 0.05,
+    'ROUTE_SAMPLE_RATES': {},
+    # Server errors and slow requests are always logged
+    'SLOW_REQUEST_MS': 1000,
+    'LOG_PAYLOADS': False,
+    'MAX_PAYLOAD_CHARS': 1024,
+    'MAX_ITEMS': 10,
+    'MAX_DEPTH': 3,
+    # A key is redacted when its words contain one of these, in any case or separator style:
+    # password_confirmation, X-Api-Key, accessToken. Names set in settings are added to these.
+    'REDACT_FIELDS': (
+        'password', 'passwd', 'token', 'access', 'refresh', 'secret', 'authorization', 'api_key', 'apikey',
+        'private_key', 'session', 'cookie', 'card_number', 'cvv', 'cvc',
+    ),
+}
+
+REDACTED = '[REDACTED]'
+
+# Words of a key: runs split on case changes, digits and any separator (_, -, ., space)
+_WORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def key_words(key):
+    return tuple(word.lower() for word in _WORD.findall(str(key)))
+
+
+def get_config():
+    overrides = getattr(settings, 'API_REQUEST_LOGGING', {})
+    config = {**DEFAULTS, **overrides}
+    # Extra fields to redact never switch off the defaults
+    config['REDACT_FIELDS'] = DEFAULTS['REDACT_FIELDS'] + tuple(overrides.get('REDACT_FIELDS', ()))
+    return config
+
+
+class PayloadSummary:
+    """
+    Redacted, size-capped view of a request or response payload. Nothing is
+    walked or formatted until a handler actually emits the record, and then
+    only MAX_ITEMS entries per level down to MAX_DEPTH are visited, so a
+    large list response is never serialized a second time for the log.
+    """
+
+    def __init__(self, data, config):
+        self.data = data
+        self.config = config
+        self.redact = {key_words(name) for name in config['REDACT_FIELDS']}
+
+    def __str__(self):
+        text = repr(self._trim(self.data, self.config['MAX_DEPTH']))
+        limit = self.config['MAX_PAYLOAD_CHARS']
+        if len(text) > limit:
+            return f"{text[:limit]}... ({len(text)} chars)"
+        return text
+
+    def _is_sensitive(self, key):
+        words = key_words(key)
+        return any(
+            words[start:start + len(name)] == name
+            for name in self.redact
+            for start in range(len(words) - len(name) + 1)
+        )
+
+    def _trim(self, value, depth):
+        max_items = self.config['MAX_ITEMS']
+        if isinstance(value, dict):
+            if depth <= 0:
+                return f"<dict of {len(value)}>"
+            trimmed = {}
+            for index, (key, item) in enumerate(value.items()):
+                if index >= max_items:
+                    trimmed['...'] = f"{len(value) - max_items} more keys"
+                    break
+                trimmed[key] = REDACTED if self._is_sensitive(key) else self._trim(item, depth - 1)
+            return trimmed
+        if isinstance(value, (list, tuple)):
+            if depth <= 0:
+                return f"<list of {len(value)}>"
+            trimmed = [self._trim(item, depth - 1) for item in value[:max_items]]
+            if len(value) > max_items:
+                trimmed.append(f"... {len(value) - max_items} more items")
+            return trimmed
+        if isinstance(value, str) and len(value) > self.config['MAX_PAYLOAD_CHARS']:
+            return f"{value[:self.config['MAX_PAYLOAD_CHARS']]}..."
+        return value
+
+
+def route_name(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is not None and match.view_name:
+        return match.view_name
+    return request.path
+
+
+def should_log(route, status_code, duration_ms, config):
+    if status_code >= 500 or duration_ms >= config['SLOW_REQUEST_MS']:
+        return True
+    rate = config['ROUTE_SAMPLE_RATES'].get(route, config['SAMPLE_RATE'])
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def log_api_call(request, response, started_at):
+    """
+    Emit one structured record for a finished API call if it is sampled.
+    Fields go both into the message and, as `http`, into the record's extra
+    for handlers that ship structured logs.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    config = get_config()
+    duration_ms = (time.perf_counter() - started_at) * 1000
+    status_code = getattr(response, 'status_code', 0)
+    route = route_name(request)
+    if not should_log(route, status_code, duration_ms, config):
+        return
+
+    user = getattr(request, 'user', None)
+    fields = {
+        'method': request.method,
+        'path': request.path,
+        'route': route,
+        'status': status_code,
+        'duration_ms': round(duration_ms, 1),
+        'user_id': getattr(user, 'pk', None),
+    }
+    if config['LOG_PAYLOADS']:
+        if request.method in ('POST', 'PUT', 'PATCH'):
+            try:
+                fields['request_data'] = PayloadSummary(request.data, config)
+            except Exception:
+                # The body may be unparseable; that is already reported as the response
+                fields['request_data'] = None
+        # Streaming and plain Django responses have no .data
+        fields['response_data'] = PayloadSummary(getattr(response, 'data', None), config)
+
+    level = logging.ERROR if status_code >= 500 else logging.INFO
+    logger.log(
+        level, "%s %s %s %.1fms route=%s user=%s request=%s response=%s",
+        fields['method'], fields['path'], fields['status'], fields['duration_ms'], fields['route'],
+        fields['user_id'], fields.get('request_data', '-'), fields.get('response_data', '-'),
+        extra={'http': fields}
+    )
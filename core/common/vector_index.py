@@ -0,0 +1,336 @@
+# core/common/vector_index.py
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_VERSION_KEY = "vector_index:version"
+# Rows preallocated on the first write; capacity doubles from there
+MIN_CAPACITY = 1024
+SIDECAR_NAME = "index.json"
+
+
+class VectorIndex(ABC):
+    """
+    Common interface for top-k vector search. query() returns a dict shaped
+    like a Pinecone response: {"matches": [{"id", "score", "metadata"}]}.
+    """
+
+    @abstractmethod
+    def query(self, vector, top_k=10):
+        ...
+
+    @abstractmethod
+    def upsert(self, ids, vectors, metadata=None):
+        ...
+
+    def refresh(self):
+        """Pick up changes made outside this process; returns True if anything was reloaded."""
+        return False
+
+
+class PineconeVectorIndex(VectorIndex):
+    def __init__(self, helper=None):
+        from .pinecone_helper import PineconeHelper
+
+        self.helper = helper or PineconeHelper()
+
+    def query(self, vector, top_k=10):
+        return self.helper.query_index(np.asarray(vector), top_k=top_k)
+
+    def upsert(self, ids, vectors, metadata=None):
+        metadata = metadata or [{} for _ in ids]
+        items = [
+            {"id": str(id_), "values": np.asarray(vector).tolist(), "metadata": meta}
+            for id_, vector, meta in zip(ids, vectors, metadata)
+        ]
+        return self.helper.get_index().upsert(vectors=items)
+
+
+class LocalVectorIndex(VectorIndex):
+    """
+    Brute-force cosine search over an in-memory float32 matrix. save() writes
+    the matrix as .npy next to a JSON sidecar, and load() memory-maps it, so
+    large indexes open instantly and are shared by processes via the page cache.
+    The build_vector_index command fills one from Pinecone and saves it;
+    refresh() reloads an index loaded from disk once a newer one is saved there.
+
+    The matrix keeps spare rows, so upserts write in place and the matrix is
+    only copied when it fills up, not on every call.
+    """
+
+    def __init__(self, dimension=None):
+        self.dimension = dimension
+        self._vectors = np.empty((0, dimension or 0), dtype=np.float32)
+        self._ids = []
+        self._metadata = []
+        self._positions = {}
+        self._lock = threading.Lock()
+        # Where load() read the index from, and the sidecar's mtime at the time
+        self.path = None
+        self._loaded_mtime = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _reserve(self, required):
+        matrix = self._vectors
+        if matrix.flags.writeable and required <= matrix.shape[0]:
+            return
+        # A memory-mapped matrix is read-only, so the first write copies it as well
+        capacity = max(required, 2 * matrix.shape[0], MIN_CAPACITY)
+        grown = np.empty((capacity, self.dimension), dtype=np.float32)
+        size = len(self._ids)
+        grown[:size] = matrix[:size]
+        self._vectors = grown
+
+    def upsert(self, ids, vectors, metadata=None):
+        vectors = self._normalize(vectors)
+        metadata = metadata or [{} for _ in ids]
+        with self._lock:
+            if self.dimension is None or not len(self._ids):
+                self.dimension = vectors.shape[1]
+                self._vectors = np.empty((0, self.dimension), dtype=np.float32)
+            if vectors.shape[1] != self.dimension:
+                raise ValueError(f"Expected vectors of dimension {self.dimension}, got {vectors.shape[1]}")
+            size = len(self._ids)
+            self._reserve(size + len(vectors))
+            new_ids, new_metadata = [], []
+            for id_, vector, meta in zip(ids, vectors, metadata):
+                id_ = str(id_)
+                position = self._positions.get(id_)
+                if position is None:
+                    position = size + len(new_ids)
+                    self._positions[id_] = position
+                    new_ids.append(id_)
+                    new_metadata.append(meta)
+                elif position < size:
+                    self._metadata[position] = meta
+                else:
+                    new_metadata[position - size] = meta
+                self._vectors[position] = vector
+            # Rows are written before the ids that make them visible to query()
+            self._metadata.extend(new_metadata)
+            self._ids.extend(new_ids)
+
+    def query(self, vector, top_k=10):
+        with self._lock:
+            # refresh() swaps all three, so take them together
+            ids, vectors, metadata = self._ids, self._vectors, self._metadata
+            size = len(ids)
+        if not size:
+            return {"matches": []}
+        scores = vectors[:size] @ self._normalize(vector)[0]
+        top_k = min(top_k, len(scores))
+        # argpartition finds the top k in O(n); only those k are sorted
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        return {
+            "matches": [
+                {"id": ids[i], "score": float(scores[i]), "metadata": metadata[i]}
+                for i in top
+            ]
+        }
+
+    def save(self, path):
+        """
+        Write the index to path. The matrix goes to a new file and the sidecar
+        naming it is swapped in last, so a process loading meanwhile sees
+        either the old index or the new one, never half of each.
+        """
+        os.makedirs(path, exist_ok=True)
+        sidecar_path = os.path.join(path, SIDECAR_NAME)
+        previous = None
+        if os.path.exists(sidecar_path):
+            with open(sidecar_path) as f:
+                previous = json.load(f).get("vectors", "vectors.npy")
+        vectors_name = f"vectors-{uuid.uuid4().hex}.npy"
+        with self._lock:
+            np.save(os.path.join(path, vectors_name), np.asarray(self._vectors[:len(self._ids)], dtype=np.float32))
+            sidecar = {"dimension": self.dimension, "vectors": vectors_name, "ids": self._ids, "metadata": self._metadata}
+            with open(f"{sidecar_path}.tmp", "w") as f:
+                json.dump(sidecar, f)
+            os.replace(f"{sidecar_path}.tmp", sidecar_path)
+        if previous is not None and previous != vectors_name:
+            # Processes still mapping the old matrix keep it until they reload
+            try:
+                os.remove(os.path.join(path, previous))
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def load(cls, path):
+        sidecar_path = os.path.join(path, SIDECAR_NAME)
+        mtime = os.stat(sidecar_path).st_mtime_ns
+        with open(sidecar_path) as f:
+            sidecar = json.load(f)
+        index = cls(dimension=sidecar["dimension"])
+        index._vectors = np.load(os.path.join(path, sidecar.get("vectors", "vectors.npy")), mmap_mode="r")
+        index._ids = sidecar["ids"]
+        index._metadata = sidecar["metadata"]
+        index._positions = {id_: i for i, id_ in enumerate(index._ids)}
+        index.path = path
+        index._loaded_mtime = mtime
+        return index
+
+    def refresh(self):
+        """Reload from self.path if a newer index was saved there since it was loaded."""
+        if self.path is None:
+            return False
+        try:
+            mtime = os.stat(os.path.join(self.path, SIDECAR_NAME)).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._loaded_mtime:
+            return False
+        fresh = self.load(self.path)
+        with self._lock:
+            self.dimension = fresh.dimension
+            self._vectors, self._ids, self._metadata = fresh._vectors, fresh._ids, fresh._metadata
+            self._positions = fresh._positions
+            self._loaded_mtime = fresh._loaded_mtime
+        logger.info(f"Reloaded local vector index from {self.path} with {len(fresh)} vectors")
+        return True
+
+
+class CachedVectorIndex(VectorIndex):
+    """
+    LRU cache of query results keyed by the exact query vector bytes and
+    top_k. An upsert through this process clears the cache at once and bumps
+    a version in the shared cache; other processes compare that version at
+    most every check_interval seconds rather than on every query, so they may
+    serve results up to that old. A new version also makes the backend
+    refresh(), which is how a rebuilt local index reaches every worker.
+    """
+
+    def __init__(self, backend, maxsize=1024, check_interval=5):
+        self.backend = backend
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self._cache = OrderedDict()
+        self._version = None
+        self._next_check = 0.0
+        # Bumped on every clear, so a result computed before it is not cached after it
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def current_version():
+        version = cache.get(VECTOR_INDEX_VERSION_KEY)
+        if version is None:
+            fresh = time.time_ns()
+            cache.add(VECTOR_INDEX_VERSION_KEY, fresh, timeout=None)
+            version = cache.get(VECTOR_INDEX_VERSION_KEY, fresh)
+        return version
+
+    @staticmethod
+    def invalidate():
+        try:
+            cache.incr(VECTOR_INDEX_VERSION_KEY)
+        except ValueError:
+            # A lost counter restarts from the clock, never from a version a worker still holds
+            cache.set(VECTOR_INDEX_VERSION_KEY, time.time_ns(), timeout=None)
+
+    def _key(self, vector, top_k):
+        data = np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+        return hashlib.blake2b(data, digest_size=16).hexdigest(), top_k
+
+    def _clear(self):
+        self._cache.clear()
+        self._generation += 1
+
+    def _check_version(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        version = self.current_version()
+        with self._lock:
+            self._next_check = now + self.check_interval
+            if version == self._version:
+                return
+            first_check = self._version is None
+            self._version = version
+            self._clear()
+        if not first_check:
+            self.backend.refresh()
+
+    def query(self, vector, top_k=10):
+        self._check_version()
+        key = self._key(vector, top_k)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                # Callers get their own copy, so changing it cannot change what later callers see
+                return copy.deepcopy(self._cache[key])
+            generation = self._generation
+        results = self.backend.query(vector, top_k=top_k)
+        if results is not None:
+            cached = copy.deepcopy(results)
+            with self._lock:
+                if generation == self._generation:
+                    self._cache[key] = cached
+                    if len(self._cache) > self.maxsize:
+                        self._cache.popitem(last=False)
+        return results
+
+    def upsert(self, ids, vectors, metadata=None):
+        result = self.backend.upsert(ids, vectors, metadata)
+        with self._lock:
+            self._clear()
+        self.invalidate()
+        return result
+
+    def refresh(self):
+        with self._lock:
+            self._clear()
+        return self.backend.refresh()
+
+
+_vector_index = None
+_vector_index_lock = threading.Lock()
+
+def get_vector_index():
+    """
+    Return the process-wide index chosen by settings.VECTOR_INDEX_BACKEND
+    ('pinecone' or 'local'), wrapped in a query result cache.
+    """
+    global _vector_index
+    if _vector_index is None:
+        with _vector_index_lock:
+            if _vector_index is None:
+                backend_name = getattr(settings, 'VECTOR_INDEX_BACKEND', 'pinecone')
+                if backend_name == 'local':
+                    path = getattr(settings, 'VECTOR_INDEX_PATH', None)
+                    if path and os.path.exists(os.path.join(path, SIDECAR_NAME)):
+                        backend = LocalVectorIndex.load(path)
+                    else:
+                        backend = LocalVectorIndex()
+                elif backend_name == 'pinecone':
+                    backend = PineconeVectorIndex()
+                else:
+                    raise ValueError(f"Unsupported vector index backend: {backend_name}")
+                _vector_index = CachedVectorIndex(
+                    backend,
+                    maxsize=getattr(settings, 'VECTOR_QUERY_CACHE_SIZE', 1024),
+                    check_interval=getattr(settings, 'VECTOR_INDEX_CHECK_SECONDS', 5),
+                )
+    return _vector_index
@@ -0,0 +1,71 @@
+import logging
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from core.common.fast_serializer import FastReadSerializer
+from core.utils.dynamic_utils import build_serializer_class
+from magazines.models import MagazineType, Template
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Compare list serialization through ModelSerializer and the fast .values() path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Fixture rows to serialize')
+        parser.add_argument('--repeat', type=int, default=3, help='Timed runs per serializer; the best one is reported')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        serializer_class = build_serializer_class(Template)
+        fast = FastReadSerializer.compile(serializer_class)
+        if fast is None:
+            self.stdout.write(self.style.ERROR(f'{serializer_class.__name__} is not supported by the fast path'))
+            return
+
+        # Fixtures live only inside this transaction and are rolled back at the end
+        with transaction.atomic():
+            self.create_fixtures(rows)
+            queryset = Template.objects.order_by('pk')
+
+            slow_data = self.serialize_model(serializer_class, queryset)
+            fast_data = fast.to_representation(fast.project(queryset))
+            if slow_data != fast_data:
+                self.stdout.write(self.style.ERROR('Fast path output differs from ModelSerializer output'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'Outputs match for {len(fast_data)} rows'))
+
+            slow = self.best_of(options['repeat'], lambda: self.serialize_model(serializer_class, queryset))
+            quick = self.best_of(options['repeat'], lambda: fast.to_representation(fast.project(queryset)))
+            transaction.set_rollback(True)
+
+        self.stdout.write(f'ModelSerializer: {slow * 1000:.1f} ms')
+        self.stdout.write(f'Fast path:       {quick * 1000:.1f} ms ({slow / quick:.1f}x)')
+        logger.info(f"List serializer benchmark on {rows} rows: {slow:.3f}s vs {quick:.3f}s")
+
+    def create_fixtures(self, rows):
+        magazine_type = MagazineType.objects.create(name='Benchmark', description='Benchmark fixtures')
+        Template.objects.bulk_create([
+            Template(
+                id=uuid.uuid4(),
+                name=f'Template {i}',
+                description='Benchmark template',
+                magazine_type=magazine_type,
+                thumbnail_image=f'templates/thumbnails/{i}.png',
+                image=f'templates/images/{i}.png',
+                structure={'pages': i % 12, 'sections': ['cover', 'body', 'back']},
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+
+    def serialize_model(self, serializer_class, queryset):
+        return serializer_class(queryset, many=True).data
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
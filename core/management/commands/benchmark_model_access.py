@@ -0,0 +1,87 @@
+import json
+import logging
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import models, transaction
+from core.utils.dynamic_utils import build_serializer_class
+from magazines.models import Magazine, Page
+
+logger = logging.getLogger(__name__)
+
+class LegacyAttributeAccessMixin:
+    """The per-attribute hook BaseModel used to carry, kept here only to measure its cost."""
+
+    def __getattribute__(self, name):
+        attr = super().__getattribute__(name)
+        if isinstance(attr, models.JSONField):
+            if isinstance(attr, str):
+                try:
+                    return json.loads(attr)
+                except json.JSONDecodeError:
+                    return attr
+        return attr
+
+
+def legacy_proxy(model):
+    # Proxy so the same rows load into a class with the old hook
+    meta = type('Meta', (), {'proxy': True, 'app_label': model._meta.app_label})
+    return type(f'Legacy{model.__name__}', (LegacyAttributeAccessMixin, model), {'Meta': meta, '__module__': __name__})
+
+
+class Command(BaseCommand):
+    help = 'Measure Magazine/Page serializer throughput with and without the old BaseModel.__getattribute__ hook'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--magazines', type=int, default=200, help='Magazines to create as fixtures')
+        parser.add_argument('--pages', type=int, default=10, help='Pages per magazine')
+        parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case; the best one is reported')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.first()
+        if user is None:
+            self.stdout.write(self.style.ERROR('At least one user is required to own the fixture magazines'))
+            return
+
+        legacy_magazine, legacy_page = legacy_proxy(Magazine), legacy_proxy(Page)
+        cases = [
+            ('Magazine', Magazine, legacy_magazine),
+            ('Page', Page, legacy_page),
+        ]
+
+        # Fixtures live only inside this transaction and are rolled back at the end
+        with transaction.atomic():
+            self.create_fixtures(user, options['magazines'], options['pages'])
+            for label, model, legacy in cases:
+                before = self.best_of(options['repeat'], lambda: self.serialize(legacy))
+                after = self.best_of(options['repeat'], lambda: self.serialize(model))
+                rows = model.objects.count()
+                self.stdout.write(
+                    f'{label}: {rows} rows, with hook {rows / before:,.0f} rows/s, '
+                    f'without {rows / after:,.0f} rows/s ({before / after:.2f}x)'
+                )
+                logger.info(f"{label} serializer benchmark: {before:.3f}s before, {after:.3f}s after")
+            transaction.set_rollback(True)
+
+    def create_fixtures(self, user, magazine_count, page_count):
+        magazines = Magazine.objects.bulk_create([
+            Magazine(user=user, title=f'Benchmark magazine {i}') for i in range(magazine_count)
+        ])
+        Page.objects.bulk_create([
+            Page(magazine=magazine, content={'title': f'Page {n}', 'blocks': [{'type': 'paragraph', 'text': 'Lorem ipsum'}] * 5})
+            for magazine in magazines
+            for n in range(page_count)
+        ], batch_size=1000)
+
+    def serialize(self, model):
+        # The concrete model's serializer reads the proxy instances the same way
+        serializer_class = build_serializer_class(model._meta.concrete_model)
+        return serializer_class(model.objects.all(), many=True).data
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
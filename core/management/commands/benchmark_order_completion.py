@@ -0,0 +1,104 @@
+import logging
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import connection
+from core.models.models import (
+    Cart,
+    CartGiftCard,
+    Customer,
+    GiftCard,
+    LineItem,
+    Order,
+    Product,
+    ProductVariant,
+    Region,
+)
+from core.services.order_completion import OrderCompletionService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Measure cart-to-order completion throughput with concurrent workers completing batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--carts', type=int, default=2000, help='Carts to create and complete')
+        parser.add_argument('--items', type=int, default=3, help='Line items per cart')
+        parser.add_argument('--batch-size', type=int, default=100, help='Carts per complete() call')
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent completion workers')
+        parser.add_argument('--overlap', action='store_true',
+                            help='Give every worker every batch, to check each cart is still completed only once')
+
+    def handle(self, *args, **options):
+        # Workers use their own connections, so fixtures are committed and removed at the end
+        region, customer, product, cart_ids = self.create_fixtures(options['carts'], options['items'])
+        try:
+            size = options['batch_size']
+            batches = [cart_ids[start:start + size] for start in range(0, len(cart_ids), size)]
+            if options['overlap']:
+                work = [random.sample(batches, len(batches)) for _ in range(options['workers'])]
+            else:
+                work = [batches[worker::options['workers']] for worker in range(options['workers'])]
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+                rejected = sum(pool.map(self.run_worker, work))
+            elapsed = time.perf_counter() - started
+
+            orders = Order.objects.filter(cart_id__in=cart_ids)
+            completed = orders.count()
+            self.report(f'{completed} of {len(cart_ids)} carts completed', completed == len(cart_ids))
+            self.report('no cart completed twice', orders.values('cart_id').distinct().count() == completed)
+            self.report('every line item moved to its order',
+                        not LineItem.objects.filter(cart_id__in=cart_ids, order__isnull=True).exists())
+            self.stdout.write(
+                f"{completed} orders in {elapsed:.2f}s with {options['workers']} workers, batches of {size}: "
+                f"{completed / elapsed:,.0f} orders/s ({rejected} rejections)"
+            )
+            logger.info(f"Order completion benchmark: {completed / elapsed:.1f} orders/s")
+        finally:
+            LineItem.objects.filter(cart_id__in=cart_ids).delete()
+            region.delete()
+            product.delete()
+            customer.delete()
+
+    def run_worker(self, batches):
+        service = OrderCompletionService()
+        rejected = 0
+        try:
+            for batch in batches:
+                rejected += len(service.complete(batch).rejected)
+        finally:
+            connection.close()
+        return rejected
+
+    def create_fixtures(self, cart_count, item_count):
+        region = Region.objects.create(name='Benchmark region', currency_code='eur', tax_rate=20)
+        customer = Customer.objects.create(email=f'benchmark-{uuid.uuid4()}@example.com')
+        product = Product.objects.create(title='Benchmark product', status='draft')
+        variants = ProductVariant.objects.bulk_create([
+            ProductVariant(product=product, title=f'Variant {i}', inventory_quantity=1000) for i in range(item_count)
+        ])
+        carts = Cart.objects.bulk_create([
+            Cart(region=region, customer=customer, email=customer.email, type='type1') for _ in range(cart_count)
+        ])
+        LineItem.objects.bulk_create([
+            LineItem(cart=cart, variant=variant, title=variant.title, unit_price=1000 + i * 250, quantity=i + 1)
+            for cart in carts
+            for i, variant in enumerate(variants)
+        ], batch_size=1000)
+        # Every tenth cart pays partly with its own gift card
+        gift_carts = carts[::10]
+        gift_cards = GiftCard.objects.bulk_create([
+            GiftCard(code=f'BENCH-{uuid.uuid4().hex[:12]}', value=1500, balance=1500, region=region) for _ in gift_carts
+        ])
+        CartGiftCard.objects.bulk_create([
+            CartGiftCard(cart=cart, gift_card=card) for cart, card in zip(gift_carts, gift_cards)
+        ])
+        return region, customer, product, [cart.id for cart in carts]
+
+    def report(self, label, ok):
+        style = self.style.SUCCESS if ok else self.style.ERROR
+        self.stdout.write(style(f"{'OK  ' if ok else 'FAIL'} {label}"))
@@ -0,0 +1,34 @@
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.common.vector_index import CachedVectorIndex, LocalVectorIndex
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Copy the Pinecone index into a local vector index and save it for VECTOR_INDEX_BACKEND=local'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', help='Directory to save the index to (defaults to VECTOR_INDEX_PATH)')
+        parser.add_argument('--namespace', default='', help='Pinecone namespace to copy')
+        parser.add_argument('--batch-size', type=int, default=100, help='Vectors fetched from Pinecone per request')
+
+    def handle(self, *args, **options):
+        from core.common.pinecone_helper import PineconeHelper
+
+        path = options['path'] or settings.VECTOR_INDEX_PATH
+        source = PineconeHelper().get_index()
+        index = LocalVectorIndex()
+        for ids in source.list(namespace=options['namespace'], limit=options['batch_size']):
+            vectors = source.fetch(ids=ids, namespace=options['namespace']).vectors
+            if vectors:
+                index.upsert(
+                    list(vectors),
+                    [vector.values for vector in vectors.values()],
+                    [vector.metadata or {} for vector in vectors.values()],
+                )
+        index.save(path)
+        # Workers see the new version on their next check and reload the saved index
+        CachedVectorIndex.invalidate()
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(index)} vectors to {path}'))
+        logger.info(f"Built local vector index with {len(index)} vectors at {path}")
@@ -0,0 +1,113 @@
+import io
+import logging
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from core.common.parsers import ORJSONParser
+from core.common.renderers import ORJSONRenderer, orjson
+from core.utils.dynamic_utils import build_serializer_class
+
+logger = logging.getLogger(__name__)
+
+def sample_payloads():
+    """Values covering every type DRF's encoder special-cases, plus a large page-content-sized document."""
+    now = timezone.now()
+    large_content = {
+        'blocks': [
+            {'id': str(uuid.uuid4()), 'type': 'paragraph', 'text': f'Paragraph {i} – café ☕ \u2028 line', 'order': i}
+            for i in range(5000)
+        ],
+        'meta': {'version': 3, 'layout': None, 'ratio': 1.5}
+    }
+    return {
+        'scalars': {'status': 'success', 'count': 3, 'ratio': 0.25, 'flag': True, 'empty': None},
+        'uuid': {'id': uuid.uuid4(), 'ids': [uuid.uuid4() for _ in range(3)]},
+        'aware_datetime': {'created_at': now, 'no_micro': now.replace(microsecond=0)},
+        'naive_datetime': {'at': datetime(2024, 1, 2, 3, 4, 5, 678901)},
+        'date_time': {'day': date(2024, 2, 29), 'time': dt_time(13, 30, 15, 250)},
+        'timedelta_decimal': {'elapsed': timedelta(minutes=3, seconds=1.5), 'price': Decimal('19.90')},
+        'lazy_string': {'message': gettext_lazy('Success')},
+        'non_str_keys': {1: 'one', 2: 'two'},
+        'unicode': {'text': 'naïve – 漢字 – \u2028\u2029 – emoji 🎉'},
+        'exponent_floats': {'big': 1e16, 'small': 1e-5, 'tiny': 5e-324, 'decimal': Decimal('1E+20')},
+        'wide_ints': {'above_u64': 2 ** 64, 'below_i64': -2 ** 63 - 1},
+        'large_content': large_content,
+    }
+
+
+class Command(BaseCommand):
+    help = 'Check ORJSONRenderer/ORJSONParser output against DRF\'s JSONRenderer/JSONParser and time both'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--models', nargs='*', default=['magazines.Template', 'magazines.Page'],
+                            help='Models whose first rows are serialized and compared as well')
+        parser.add_argument('--rows', type=int, default=500, help='Rows per model to compare')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed renders per payload; the best one is reported')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; the renderer and parser fall back to DRF'))
+            return
+
+        payloads = sample_payloads()
+        for label in options['models']:
+            model = apps.get_model(label)
+            serializer_class = build_serializer_class(model)
+            payloads[label] = serializer_class(model._default_manager.all()[:options['rows']], many=True).data
+
+        failures = 0
+        for name, data in payloads.items():
+            if not self.compare(name, data, options['repeat']):
+                failures += 1
+        for value in (float('nan'), float('inf'), -float('inf')):
+            if not self.check_non_finite(value):
+                failures += 1
+
+        if failures:
+            self.stdout.write(self.style.ERROR(f'{failures} payload(s) differ between the renderers'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'All {len(payloads)} payloads render and parse identically'))
+
+    def compare(self, name, data, repeat):
+        expected = JSONRenderer().render(data)
+        rendered = ORJSONRenderer().render(data)
+        if rendered != expected:
+            self.stdout.write(self.style.ERROR(f'{name}: rendered bytes differ'))
+            logger.error(f"{name}: expected {expected[:200]!r}, got {rendered[:200]!r}")
+            return False
+
+        parsed = ORJSONParser().parse(io.BytesIO(expected))
+        if parsed != JSONParser().parse(io.BytesIO(expected)):
+            self.stdout.write(self.style.ERROR(f'{name}: parsed data differs'))
+            return False
+
+        stdlib = self.best_of(repeat, lambda: JSONRenderer().render(data))
+        fast = self.best_of(repeat, lambda: ORJSONRenderer().render(data))
+        self.stdout.write(
+            f'{name}: {len(expected)} bytes, JSONRenderer {stdlib * 1000:.2f} ms, '
+            f'ORJSONRenderer {fast * 1000:.2f} ms ({stdlib / fast:.1f}x)'
+        )
+        return True
+
+    def check_non_finite(self, value):
+        # The one accepted difference: JSONRenderer refuses non-finite floats, ORJSONRenderer writes null
+        rendered = ORJSONRenderer().render({'value': value})
+        if rendered != b'{"value":null}':
+            self.stdout.write(self.style.ERROR(f'ORJSONRenderer rendered {value} as {rendered!r} instead of null'))
+            return False
+        return True
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
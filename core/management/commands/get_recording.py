@@ -1,9 +1,13 @@
 import os
-import base64
+import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
 from datetime import datetime, timedelta
 from department.models import CallLog, CallRecording, PhoneNumber
 from agency.models import Agency
@@ -17,11 +21,57 @@ from django.db.utils import IntegrityError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CALLLOG_PATH = '/Users/pc/Dropbox/ablelabs/aisurance/calllog'
+RECORDING_STORAGE_PREFIX = 'call_recordings'
+
+class RecordingIndex:
+    """
+    Scan the directory once and map every token of each MP3 file stem to its
+    path, so most CSV rows are matched with a dict lookup instead of a listdir.
+
+    A recording id that is a whole token of a file name (split on anything
+    but letters and digits) matches that file. Otherwise the first file whose
+    name contains the id, in directory order, matches, as it always has.
+    """
+
+    def __init__(self, calllog_path):
+        self.tokens = {}
+        self.files = []
+        with os.scandir(calllog_path) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith('.mp3'):
+                    continue
+                self.files.append((entry.name, entry.path))
+                stem = entry.name[:-len('.mp3')]
+                self.tokens.setdefault(stem, entry.path)
+                for token in re.split(r'[^0-9A-Za-z]+', stem):
+                    if token:
+                        self.tokens.setdefault(token, entry.path)
+
+    def __len__(self):
+        return len(self.files)
+
+    def match(self, recording_id):
+        path = self.tokens.get(recording_id)
+        if path is not None:
+            return path
+        # Ids embedded in a longer token, e.g. rec123abc.mp3 for 123
+        for name, path in self.files:
+            if recording_id in name:
+                return path
+        return None
+
 class Command(BaseCommand):
-    help = 'Import call logs and recordings from CSV and MP3 files'
+    help = (
+        'Import call logs and recordings from CSV and MP3 files. A row\'s recording_id matches an MP3 '
+        'whose name has it as a whole token, or else the first MP3 whose name contains it.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument('agency_id', type=UUID, help='UUID of the agency')
+        parser.add_argument('--path', default=DEFAULT_CALLLOG_PATH, help='Directory holding the CSV and MP3 files')
+        parser.add_argument('--batch-size', type=int, default=500, help='CSV rows written per bulk insert')
+        parser.add_argument('--workers', type=int, default=1, help='Parallel recording uploads per batch')
 
     def handle(self, *args, **kwargs):
         logger = logging.getLogger(__name__)
@@ -30,8 +80,9 @@ class Command(BaseCommand):
         if not agency:
             return
 
-        # Correct the path to the calllog directory
-        calllog_path = '/Users/pc/Dropbox/ablelabs/aisurance/calllog'
+        calllog_path = kwargs['path']
+        self.batch_size = kwargs['batch_size']
+        self.workers = kwargs['workers']
         logger.info(f'Looking for call logs in: {calllog_path}')
 
         # Check if the directory exists before proceeding
@@ -44,6 +95,9 @@ class Command(BaseCommand):
         if not csv_file:
             return
 
+        self.recording_index = RecordingIndex(calllog_path)
+        logger.info(f'Indexed {len(self.recording_index)} recordings in {calllog_path}')
+
         if not self.process_csv_file(csv_file, agency, calllog_path, logger):
             return
 
@@ -76,24 +130,45 @@ class Command(BaseCommand):
                 headers = reader.fieldnames
                 logger.info(f'CSV Headers: {headers}')
 
-                for row in reader:
-                    self.process_csv_row(row, agency, calllog_path, logger)
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    while True:
+                        batch = list(islice(reader, self.batch_size))
+                        if not batch:
+                            break
+                        self.process_batch(batch, agency, executor, logger)
             return True
         except Exception as e:
             logger.exception('Failed to process the CSV file: %s', str(e))
             self.stdout.write(self.style.ERROR('Failed to process the CSV file'))
             return False
 
+    def process_batch(self, rows, agency, executor, logger):
+        # Uploads run before the transaction so no database connection is held open during network I/O
+        matched_files = [self.match_mp3_file(row) for row in rows]
+        recording_urls = list(executor.map(
+            lambda path: self.upload_recording(path, agency, logger) if path else None,
+            matched_files
+        ))
 
-
-    def process_csv_row(self, row, agency, calllog_path, logger):
         with transaction.atomic():
-            start_time, end_time = self.parse_times(row)
-            from_phone_number, to_phone_number = self.get_phone_numbers(row)
-            call_log = self.create_call_log(row, agency, start_time, end_time, from_phone_number, to_phone_number)
-            if not self.match_mp3_files(row, call_log, calllog_path, agency, logger):
-                logger.warning(f'Processing row for call log {call_log.id} completed, but MP3 file not found.')
-        return True
+            phone_numbers = self.get_phone_numbers(rows)
+            call_logs = []
+            for row, recording_url in zip(rows, recording_urls):
+                start_time, end_time = self.parse_times(row)
+                call_logs.append(self.build_call_log(
+                    row, agency, start_time, end_time,
+                    phone_numbers[row['From']], phone_numbers[row['To']], recording_url
+                ))
+            CallLog.objects.bulk_create(call_logs, batch_size=self.batch_size)
+
+            recordings = []
+            for row, call_log, recording_url in zip(rows, call_logs, recording_urls):
+                if recording_url is None:
+                    logger.warning(f'Processing row for call log {call_log.id} completed, but MP3 file not found.')
+                    continue
+                recordings.append(self.build_call_recording(row, call_log, agency))
+            CallRecording.objects.bulk_create(recordings, batch_size=self.batch_size)
+        logger.info(f'Imported {len(call_logs)} call logs with {len(recordings)} recordings')
 
 
 
@@ -107,13 +182,18 @@ class Command(BaseCommand):
 
 
 
-    def get_phone_numbers(self, row):
-        from_phone_number, _ = PhoneNumber.objects.get_or_create(number=row['From'])
-        to_phone_number, _ = PhoneNumber.objects.get_or_create(number=row['To'])
-        return from_phone_number, to_phone_number
+    def get_phone_numbers(self, rows):
+        """Resolve every number in the batch with one select and one bulk insert."""
+        numbers = {row['From'] for row in rows} | {row['To'] for row in rows}
+        existing = {p.number: p for p in PhoneNumber.objects.filter(number__in=numbers)}
+        missing = [PhoneNumber(number=number) for number in numbers if number not in existing]
+        if missing:
+            PhoneNumber.objects.bulk_create(missing, ignore_conflicts=True)
+            existing.update({p.number: p for p in PhoneNumber.objects.filter(number__in=[p.number for p in missing])})
+        return existing
 
-    def create_call_log(self, row, agency, start_time, end_time, from_phone_number, to_phone_number):
-        return CallLog.objects.create(
+    def build_call_log(self, row, agency, start_time, end_time, from_phone_number, to_phone_number, recording_url=None):
+        return CallLog(
             agency=agency,
             call_id=row.get('call_id', str(uuid.uuid4())),  # Generate a UUID if call_id is not present
             session_id=row.get('session_id', None),
@@ -131,7 +211,7 @@ class Command(BaseCommand):
             recording_id=row.get('recording_id', None),
             recording_status=row.get('recording_status', None),
             recording_duration=row.get('recording_duration', None),
-            recording_url=row.get('recording_url', None),
+            recording_url=recording_url or row.get('recording_url', None),
             recording_content_type=row.get('recording_content_type', None),
             recording_size=row.get('recording_size', None),
             status_code=row.get('status_code', None),
@@ -144,45 +224,45 @@ class Command(BaseCommand):
             call_direction=row.get('call_direction', None)
         )
 
+    def build_call_recording(self, row, call_log, agency):
+        return CallRecording(
+            agency=agency,
+            call_analysis_agent=None,
+            call_log=call_log,
+            recording_id=row.get('recording_id') or str(uuid.uuid4()),  # Use existing or generate a new UUID
+            recording_type=row.get('recording_type', 'unknown'),
+            # The audio lives in object storage; call_log.recording_url points at it
+            recording_content=None,
+            is_ai_processed=False,
+            ai_response=None,
+            ai_meta_data=None,
+            ismeta_data_processed=False,
+            recording_context_agent=None,
+            extracted_intent=None
+        )
 
-    def match_mp3_files(self, row, call_log, calllog_path, agency, logger):
-        recording_id = row.get('recording_id') or str(uuid.uuid4())  # Use existing or generate a new UUID
-
-        matched_file = None
-        for file in os.listdir(calllog_path):
-            if file.endswith('.mp3'):
-                # Check for a match using the recording_id if it exists
-                if row.get('recording_id') and row['recording_id'] in file:
-                    matched_file = file
-                    break
-                # Fallback: match based on other criteria if recording_id is not provided
-                elif self.is_potential_match(row, file):
-                    matched_file = file
-                    break
-
-        if matched_file:
-            with open(os.path.join(calllog_path, matched_file), 'rb') as mp3_file:
-                recording_content = base64.b64encode(mp3_file.read()).decode('utf-8')
-                CallRecording.objects.create(
-                    agency=agency,
-                    call_analysis_agent=None,
-                    call_log=call_log,
-                    recording_id=recording_id,
-                    recording_type=row.get('recording_type', 'unknown'),
-                    recording_content=recording_content,
-                    is_ai_processed=False,
-                    ai_response=None,
-                    ai_meta_data=None,
-                    ismeta_data_processed=False,
-                    recording_context_agent=None,
-                    extracted_intent=None
-                )
-            logger.info(f'MP3 file {matched_file} matched and processed for recording ID {recording_id}')
-            return True
 
-        logger.error(f'MP3 file matching recording ID {recording_id} not found for call log {call_log.id}')
-        return False
+    def match_mp3_file(self, row):
+        recording_id = row.get('recording_id')
+        if recording_id:
+            matched_file = self.recording_index.match(recording_id)
+            if matched_file:
+                return matched_file
+        # Fallback: match based on other criteria if recording_id is not provided
+        return self.find_potential_match(row)
 
-    def is_potential_match(self, row, file):
+    def upload_recording(self, path, agency, logger):
+        name = f'{RECORDING_STORAGE_PREFIX}/{agency.id}/{os.path.basename(path)}'
+        # File() lets the storage backend read the MP3 in chunks rather than loading it whole
+        try:
+            with open(path, 'rb') as mp3_file:
+                stored_name = default_storage.save(name, File(mp3_file))
+        except Exception as e:
+            logger.error(f'Failed to upload MP3 file {path}: {str(e)}')
+            return None
+        logger.info(f'MP3 file {path} uploaded to {stored_name}')
+        return default_storage.url(stored_name)
+
+    def find_potential_match(self, row):
         # Implement additional matching logic if needed
-        return False
+        return None
@@ -0,0 +1,68 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import connection
+from core.models.models import Product, ProductVariant
+from core.services.inventory import InsufficientInventory, InventoryService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Hammer one variant with concurrent reservations and check no stock is oversold or lost'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=32, help='Concurrent workers')
+        parser.add_argument('--attempts', type=int, default=500, help='Reservations attempted in total')
+        parser.add_argument('--stock', type=int, default=200, help='Starting inventory_quantity of the fixture variant')
+        parser.add_argument('--quantity', type=int, default=1, help='Units per reservation')
+        parser.add_argument('--counter', action='store_true', help='Put the Redis front counter in front of the database')
+
+    def handle(self, *args, **options):
+        service = InventoryService(use_counter=options['counter'])
+        stock, quantity = options['stock'], options['quantity']
+
+        # Worker threads use their own connections, so the fixture has to be committed; it is deleted at the end
+        product = Product.objects.create(title='Inventory concurrency check', status='draft')
+        variant = ProductVariant.objects.create(product=product, title='Hot SKU', inventory_quantity=stock)
+        try:
+            if options['counter']:
+                service.reconcile([variant.id])
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['threads']) as pool:
+                results = list(pool.map(lambda _: self.attempt(service, variant.id, quantity), range(options['attempts'])))
+            elapsed = time.perf_counter() - started
+
+            reservations = [result for result in results if result is not None]
+            remaining = ProductVariant.objects.get(id=variant.id).inventory_quantity
+            expected = min(options['attempts'], stock // quantity)
+            self.report('no stock oversold or lost', remaining == stock - len(reservations) * quantity)
+            self.report(f'{len(reservations)} of {expected} possible reservations succeeded', len(reservations) == expected)
+
+            for reservation in reservations[::2]:
+                service.release(reservation.id)
+            for reservation in reservations[1::2]:
+                service.confirm(reservation.id)
+            released = len(reservations[::2])
+            remaining_after = ProductVariant.objects.get(id=variant.id).inventory_quantity
+            self.report(f'releasing {released} reservations restocked them', remaining_after == remaining + released * quantity)
+            self.report('a second release is a no-op', not any(service.release(r.id) for r in reservations))
+
+            self.stdout.write(f"{options['attempts']} attempts on {options['threads']} threads in {elapsed:.2f}s "
+                              f"({options['attempts'] / elapsed:,.0f} reservations/s)")
+            logger.info(f"Inventory concurrency check: {len(reservations)} reserved in {elapsed:.3f}s")
+        finally:
+            product.delete()
+
+    def attempt(self, service, variant_id, quantity):
+        try:
+            return service.reserve(variant_id, quantity)
+        except InsufficientInventory:
+            return None
+        finally:
+            connection.close()
+
+    def report(self, label, ok):
+        style = self.style.SUCCESS if ok else self.style.ERROR
+        self.stdout.write(style(f"{'OK  ' if ok else 'FAIL'} {label}"))
@@ -2,11 +2,18 @@ import json
 import os
 import logging
 import traceback
-from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
 from django.apps import apps
 from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from core.common.ai_helper import get_openai_client
+from core.common.model_exporter import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_SHARD_BYTES,
+    StreamingModelExporter
+)
 from hellogpt.openai_storage import OpenAiStorage
 from hellogpt.openai_vector_store import OpenAiVectorStore
 
@@ -26,25 +33,113 @@ EXCLUDED_FIELDS = {
 
 logger = logging.getLogger(__name__)
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        try:
-            if isinstance(obj, UUID):
-                return str(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            return super().default(obj)
-        except TypeError:
-            return str(obj)
+MANIFEST_NAME = 'manifest.json'
+
+class ExportManifest:
+    """
+    Tracks the shards of one export run and the OpenAI file id of each shard
+    once uploaded, so an interrupted upload can be resumed with --resume.
+    """
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.data = {'shards': [], 'vector_store_id': None}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.data = json.load(f)
+
+    @property
+    def shards(self):
+        return self.data['shards']
+
+    def add_shards(self, paths):
+        self.shards.extend({'path': path, 'file_id': None} for path in paths)
+        self.save()
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+class ExportState:
+    """
+    Persistent state for --incremental runs: the target vector store and, per
+    model, the high-water mark of the last export, the files of its last full
+    export and the delta files written since.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {'vector_store_id': None, 'models': {}}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+
+    @property
+    def vector_store_id(self):
+        return self.data['vector_store_id']
+
+    def model_state(self, label):
+        model_state = self.data['models'].setdefault(
+            label, {'high_water_mark': None, 'base_files': [], 'delta_files': []}
+        )
+        if 'base_files' not in model_state:
+            # Written by an earlier version; its files still hold current rows and go at the next compaction
+            model_state['delta_files'] = list(model_state.pop('files', {})) + model_state.pop('file_ids', [])
+            model_state['base_files'] = []
+        return model_state
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+def change_tracking_field(model):
+    field_names = {f.name for f in model._meta.concrete_fields}
+    for name in ('updated_at', 'created_at'):
+        if name in field_names:
+            return name
+    return None
+
+def soft_delete_field(model):
+    return 'deleted_at' if 'deleted_at' in {f.name for f in model._meta.concrete_fields} else None
 
 class Command(BaseCommand):
-    help = 'Export data to JSON and upload to OpenAI Vector Store'
+    help = 'Export data to NDJSON shards and upload them to an OpenAI Vector Store'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--apps', nargs='+', default=DJANGO_APPS, help='App labels to export')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help='Rows fetched per database round trip')
+        parser.add_argument('--max-shard-mb', type=int, default=DEFAULT_MAX_SHARD_BYTES // (1024 * 1024),
+                            help='Start a new output file once a shard reaches this size')
+        parser.add_argument('--output-dir', help='Directory for the export (defaults to MEDIA_ROOT/export_<timestamp>)')
+        parser.add_argument('--resume', action='store_true',
+                            help='Reuse a completed export in --output-dir and upload only shards not yet uploaded')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Export only rows changed since the last incremental run into the same vector store')
+        parser.add_argument('--state-file', help='State file for --incremental (defaults to MEDIA_ROOT/vector_export_state.json)')
+        parser.add_argument('--compact-after', type=int, default=10,
+                            help='Re-export a model in full, replacing its files, once it has this many delta files')
+        parser.add_argument('--overlap-seconds', type=int, default=300,
+                            help='Re-check rows changed this long before the last high-water mark')
 
-    def handle(self, *args, **kwargs):
+    def handle(self, *args, **options):
         try:
-            data = self.gather_data()
-            file_path = self.create_json_file(data)
-            vector_store_id = self.upload_to_vector_store(file_path)
+            export_dir = options['output_dir'] or os.path.join(
+                settings.MEDIA_ROOT, f"export_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            )
+            if options['incremental']:
+                vector_store_id = self.incremental_export(export_dir, options)
+                self.stdout.write(self.style.SUCCESS(f'Successfully synced changes to OpenAI Vector Store: {vector_store_id}'))
+                logger.info(f'Successfully synced changes to OpenAI Vector Store: {vector_store_id}')
+                return
+            manifest = ExportManifest(export_dir) if options['resume'] else None
+            if manifest is None or not manifest.data.get('export_complete'):
+                manifest = self.export_data(export_dir, options)
+            vector_store_id = self.upload_to_vector_store(manifest)
 
             self.stdout.write(self.style.SUCCESS(f'Successfully exported and uploaded to OpenAI Vector Store: {vector_store_id}'))
             logger.info(f'Successfully exported and uploaded to OpenAI Vector Store: {vector_store_id}')
@@ -55,54 +150,125 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(f'Error occurred: {e}'))
             self.stderr.write(self.style.ERROR(traceback.format_exc()))
 
-    def gather_data(self):
-        data = {}
-        for app_name in DJANGO_APPS:
+    def export_data(self, export_dir, options):
+        exporter = StreamingModelExporter(
+            export_dir,
+            chunk_size=options['chunk_size'],
+            max_shard_bytes=options['max_shard_mb'] * 1024 * 1024,
+        )
+        manifest = ExportManifest(export_dir)
+        manifest.data = {'shards': [], 'vector_store_id': None}
+        for app_name in options['apps']:
             app_config = apps.get_app_config(app_name)
-            for model_name, model in app_config.models.items():
-                excluded_fields = EXCLUDED_FIELDS.get(app_name, {}).get(model_name, [])
-                queryset = model.objects.all()
-                model_data = []
-                for obj in queryset:
-                    obj_data = {}
-                    for field in obj._meta.fields:
-                        if field.name not in excluded_fields:
-                            value = getattr(obj, field.name)
-                            if isinstance(value, UUID):
-                                value = str(value)
-                            elif isinstance(value, datetime):
-                                value = value.isoformat()
-                            else:
-                                try:
-                                    json.dumps(value)  # Check if serializable
-                                except TypeError:
-                                    value = str(value)  # Convert to string if not serializable
-                            obj_data[field.name] = value
-                    model_data.append(obj_data)
-
-                if app_name not in data:
-                    data[app_name] = {}
-                data[app_name][model_name] = model_data
-        return data
-
-    def create_json_file(self, data):
-        file_name = f"export_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-        file_path = os.path.join(settings.MEDIA_ROOT, file_name)
-        with open(file_path, 'w') as json_file:
-            json.dump(data, json_file, indent=4, cls=CustomJSONEncoder)
-        logger.info(f"JSON file created at {file_path}")
-        return file_path
-
-    def upload_to_vector_store(self, file_path):
+            for model in app_config.get_models():
+                excluded_fields = EXCLUDED_FIELDS.get(app_name, {}).get(model.__name__, [])
+                paths, count = exporter.export_model(model, excluded_fields)
+                manifest.add_shards(paths)
+                self.stdout.write(f"Exported {count} {model._meta.label} rows")
+        manifest.data['export_complete'] = True
+        manifest.save()
+        logger.info(f"Export written to {export_dir}")
+        return manifest
+
+    def upload_to_vector_store(self, manifest):
         vector_store = OpenAiVectorStore()
         storage = OpenAiStorage()
 
-        # First, upload the file to OpenAI using OpenAiStorage
-        with open(file_path, 'rb') as file:
-            file_id = storage._save(file.name, file)
-        
-        # Then, create a vector store with the uploaded file using OpenAiVectorStore
-        vector_store_response = vector_store.create_vector_store(name='Export Data', file_ids=[file_id])
-        vector_store_id = vector_store_response['id']
+        # Upload shard by shard, recording each file id so a rerun skips finished shards
+        for shard in manifest.shards:
+            if shard['file_id']:
+                continue
+            with open(shard['path'], 'rb') as file:
+                shard['file_id'] = storage._save(os.path.basename(file.name), file)
+            manifest.save()
+
+        if not manifest.data['vector_store_id']:
+            file_ids = [shard['file_id'] for shard in manifest.shards]
+            vector_store_response = vector_store.create_vector_store(name='Export Data', file_ids=file_ids)
+            manifest.data['vector_store_id'] = vector_store_response['id']
+            manifest.save()
+
+        return manifest.data['vector_store_id']
+
+    def incremental_export(self, export_dir, options):
+        state = ExportState(options['state_file'] or os.path.join(settings.MEDIA_ROOT, 'vector_export_state.json'))
+        exporter = StreamingModelExporter(
+            export_dir,
+            chunk_size=options['chunk_size'],
+            max_shard_bytes=options['max_shard_mb'] * 1024 * 1024,
+        )
+        storage = OpenAiStorage()
+        client = get_openai_client(settings.OPENAI_API_KEY)
+        if state.vector_store_id is None:
+            state.data['vector_store_id'] = client.beta.vector_stores.create(name='Export Data').id
+            state.save()
+
+        for app_name in options['apps']:
+            for model in apps.get_app_config(app_name).get_models():
+                excluded_fields = EXCLUDED_FIELDS.get(app_name, {}).get(model.__name__, [])
+                self.sync_model(client, storage, exporter, state, model, excluded_fields, options)
+                # Saved per model, so a failure later in the run does not repeat or lose this model's work
+                state.save()
+        return state.vector_store_id
+
+    def sync_model(self, client, storage, exporter, state, model, excluded_fields, options):
+        """
+        Bring one model's files in the vector store up to date. Rows changed
+        since the last run are written to a new delta file beside the existing
+        ones, so a run costs what changed rather than what the table holds.
+        Until the next compaction a changed row can be found in several files;
+        every record carries its primary key and change timestamp, and the
+        newest copy is the current one. Soft-deleted rows reach the delta with
+        deleted_at set, as tombstones. Once compact_after deltas pile up the
+        model is re-exported in full and every older file is dropped, which is
+        also when hard-deleted rows leave the store.
+        """
+        label = model._meta.label
+        model_state = state.model_state(label)
+        field = change_tracking_field(model)
+        deleted_field = soft_delete_field(model)
+        manager = model._default_manager
+        run_started = timezone.now()
+
+        full = (
+            field is None
+            or model_state['high_water_mark'] is None
+            or len(model_state['delta_files']) >= options['compact_after']
+        )
+        if full:
+            queryset = manager.all()
+            if deleted_field is not None:
+                queryset = queryset.filter(**{f'{deleted_field}__isnull': True})
+        else:
+            # Rows committed late with an older timestamp are still caught by the overlap
+            since = parse_datetime(model_state['high_water_mark']) - timedelta(seconds=options['overlap_seconds'])
+            queryset = manager.filter(**{f'{field}__gt': since})
+
+        paths, count = exporter.export_model(model, excluded_fields, queryset=queryset)
+        if not full and not count:
+            model_state['high_water_mark'] = run_started.isoformat()
+            self.stdout.write(f"No changes for {label}")
+            return
+
+        file_ids = []
+        for path in paths:
+            with open(path, 'rb') as file:
+                file_ids.append(storage._save(os.path.basename(file.name), file))
+        if file_ids:
+            client.beta.vector_stores.file_batches.create_and_poll(
+                vector_store_id=state.vector_store_id, file_ids=file_ids
+            )
 
-        return vector_store_id
+        if full:
+            # The files of the previous export are removed only after their replacements are indexed
+            for file_id in model_state['base_files'] + model_state['delta_files']:
+                client.beta.vector_stores.files.delete(vector_store_id=state.vector_store_id, file_id=file_id)
+                client.files.delete(file_id)
+            model_state['base_files'], model_state['delta_files'] = file_ids, []
+        else:
+            model_state['delta_files'].extend(file_ids)
+        if field is not None:
+            model_state['high_water_mark'] = run_started.isoformat()
+        self.stdout.write(
+            f"{'Exported' if full else 'Exported changes for'} {count} {label} rows into {len(file_ids)} file(s)"
+        )
@@ -0,0 +1,21 @@
+import logging
+from django.core.management.base import BaseCommand
+from core.services.inventory import InventoryService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Restock expired inventory reservations and optionally reset the Redis stock counters from the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=1000, help='Most reservations released per run')
+        parser.add_argument('--reconcile', action='store_true', help='Also reset every Redis stock counter from the database')
+
+    def handle(self, *args, **options):
+        service = InventoryService()
+        released = service.release_expired(limit=options['limit'])
+        self.stdout.write(f'Released {released} expired reservations')
+        if options['reconcile']:
+            counters = service.reconcile()
+            self.stdout.write(f'Reconciled {counters} stock counters')
+        logger.info(f"Inventory sweep released {released} reservations")
@@ -0,0 +1,2029 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:34
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Address',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('company', models.CharField(blank=True, max_length=255, null=True)),
+                ('first_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('last_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('address_1', models.CharField(blank=True, max_length=255, null=True)),
+                ('address_2', models.CharField(blank=True, max_length=255, null=True)),
+                ('city', models.CharField(blank=True, max_length=255, null=True)),
+                ('country_code', models.CharField(blank=True, max_length=10, null=True)),
+                ('province', models.CharField(blank=True, max_length=255, null=True)),
+                ('postal_code', models.CharField(blank=True, max_length=20, null=True)),
+                ('phone', models.CharField(blank=True, max_length=20, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Cart',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('type', models.CharField(choices=[('type1', 'Type 1'), ('type2', 'Type 2')], max_length=50)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('context', models.JSONField(blank=True, null=True)),
+                ('payment_authorized_at', models.DateTimeField(blank=True, null=True)),
+                ('billing_address', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='billing_carts', to='core.address')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaimOrder',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('payment_status', models.CharField(choices=[('paid', 'Paid'), ('pending', 'Pending'), ('refunded', 'Refunded')], max_length=50)),
+                ('fulfillment_status', models.CharField(choices=[('fulfilled', 'Fulfilled'), ('unfulfilled', 'Unfulfilled')], max_length=50)),
+                ('type', models.CharField(choices=[('type1', 'Type 1'), ('type2', 'Type 2')], max_length=50)),
+                ('refund_amount', models.PositiveIntegerField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_notification', models.BooleanField(default=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaimTag',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Currency',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('code', models.CharField(max_length=10, primary_key=True, serialize=False)),
+                ('symbol', models.CharField(max_length=10)),
+                ('symbol_native', models.CharField(max_length=10)),
+                ('name', models.CharField(max_length=50)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Customer',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('first_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('last_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('password_hash', models.CharField(blank=True, max_length=255, null=True)),
+                ('phone', models.CharField(blank=True, max_length=20, null=True)),
+                ('has_account', models.BooleanField(default=False)),
+                ('billing_address', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='billing_customers', to='core.address')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CustomerGroup',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Discount',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('code', models.CharField(max_length=50, unique=True)),
+                ('is_dynamic', models.BooleanField(default=False)),
+                ('is_disabled', models.BooleanField(default=False)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField(blank=True, null=True)),
+                ('usage_limit', models.PositiveIntegerField(blank=True, null=True)),
+                ('usage_count', models.PositiveIntegerField(default=0)),
+                ('valid_duration', models.CharField(blank=True, max_length=50, null=True)),
+                ('parent_discount', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.discount')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountRule',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('type', models.CharField(choices=[('fixed', 'Fixed'), ('percentage', 'Percentage')], max_length=50)),
+                ('value', models.PositiveIntegerField()),
+                ('allocation', models.CharField(blank=True, choices=[('each', 'Each'), ('total', 'Total')], max_length=50, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DraftOrder',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('completed', 'Completed'), ('canceled', 'Canceled')], max_length=50)),
+                ('display_id', models.PositiveIntegerField(unique=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_notification_order', models.BooleanField(default=False)),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.cart')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Fulfillment',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tracking_numbers', models.JSONField()),
+                ('data', models.JSONField()),
+                ('shipped_at', models.DateTimeField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('no_notification', models.BooleanField(default=False)),
+                ('claim_order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.claimorder')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='FulfillmentProvider',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_installed', models.BooleanField(default=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='GiftCard',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('code', models.CharField(max_length=50, unique=True)),
+                ('value', models.PositiveIntegerField()),
+                ('balance', models.PositiveIntegerField()),
+                ('is_disabled', models.BooleanField(default=False)),
+                ('ends_at', models.DateTimeField(blank=True, null=True)),
+                ('tax_rate', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('idempotency_key', models.CharField(max_length=255, unique=True)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('request_method', models.CharField(blank=True, max_length=10, null=True)),
+                ('request_params', models.JSONField(blank=True, null=True)),
+                ('request_path', models.CharField(blank=True, max_length=255, null=True)),
+                ('response_code', models.IntegerField(blank=True, null=True)),
+                ('response_body', models.JSONField(blank=True, null=True)),
+                ('recovery_point', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Image',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('url', models.URLField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Invite',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('user_email', models.EmailField(max_length=254)),
+                ('role', models.CharField(blank=True, choices=[('admin', 'Admin'), ('customer', 'Customer'), ('supplier', 'Supplier')], max_length=50, null=True)),
+                ('accepted', models.BooleanField(default=False)),
+                ('token', models.CharField(max_length=255, unique=True)),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='LineItem',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('thumbnail', models.URLField(blank=True, null=True)),
+                ('is_giftcard', models.BooleanField(default=False)),
+                ('should_merge', models.BooleanField(default=False)),
+                ('allow_discounts', models.BooleanField(default=True)),
+                ('has_shipping', models.BooleanField(blank=True, null=True)),
+                ('unit_price', models.PositiveIntegerField()),
+                ('quantity', models.PositiveIntegerField()),
+                ('fulfilled_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('returned_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('shipped_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_return', models.BooleanField(default=False)),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.cart')),
+                ('claim_order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.claimorder')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('address', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.address')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Migration',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('timestamp', models.BigIntegerField()),
+                ('name', models.CharField(max_length=255)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MoneyAmount',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('currency_code', models.CharField(max_length=10)),
+                ('amount', models.PositiveIntegerField()),
+                ('min_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('max_quantity', models.PositiveIntegerField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='NotificationProvider',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_installed', models.BooleanField(default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OAuth',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('display_name', models.CharField(max_length=255)),
+                ('application_name', models.CharField(max_length=255)),
+                ('install_url', models.URLField(blank=True, null=True)),
+                ('uninstall_url', models.URLField(blank=True, null=True)),
+                ('data', models.JSONField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('canceled', 'Canceled')], max_length=50)),
+                ('fulfillment_status', models.CharField(choices=[('fulfilled', 'Fulfilled'), ('unfulfilled', 'Unfulfilled')], max_length=50)),
+                ('payment_status', models.CharField(choices=[('paid', 'Paid'), ('pending', 'Pending'), ('refunded', 'Refunded')], max_length=50)),
+                ('display_id', models.PositiveIntegerField(unique=True)),
+                ('email', models.EmailField(max_length=254)),
+                ('currency_code', models.CharField(max_length=10)),
+                ('tax_rate', models.FloatField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_notification', models.BooleanField(default=False)),
+                ('external_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('billing_address', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='billing_orders', to='core.address')),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.cart')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.customer')),
+                ('draft_order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='core.draftorder')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderEdit',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('internal_note', models.TextField(blank=True, null=True)),
+                ('requested_at', models.DateTimeField(blank=True, null=True)),
+                ('confirmed_at', models.DateTimeField(blank=True, null=True)),
+                ('declined_reason', models.TextField(blank=True, null=True)),
+                ('declined_at', models.DateTimeField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('currency_code', models.CharField(max_length=10)),
+                ('amount_refunded', models.PositiveIntegerField(default=0)),
+                ('data', models.JSONField()),
+                ('captured_at', models.DateTimeField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payments', to='core.cart')),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentProvider',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_installed', models.BooleanField(default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PriceList',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('type', models.CharField(choices=[('static', 'Static'), ('dynamic', 'Dynamic')], max_length=50)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive')], max_length=50)),
+                ('starts_at', models.DateTimeField(blank=True, null=True)),
+                ('ends_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('subtitle', models.CharField(blank=True, max_length=255, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('handle', models.SlugField(blank=True, max_length=255, null=True, unique=True)),
+                ('is_giftcard', models.BooleanField(default=False)),
+                ('thumbnail', models.ImageField(blank=True, null=True, upload_to='product_images/')),
+                ('weight', models.PositiveIntegerField(blank=True, null=True)),
+                ('length', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('hs_code', models.CharField(blank=True, max_length=50, null=True)),
+                ('origin_country', models.CharField(blank=True, max_length=10, null=True)),
+                ('mid_code', models.CharField(blank=True, max_length=50, null=True)),
+                ('material', models.CharField(blank=True, max_length=255, null=True)),
+                ('discountable', models.BooleanField(default=True)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive')], max_length=50)),
+                ('external_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('ai_generated_content', models.TextField(blank=True, null=True)),
+                ('is_ai_generated', models.BooleanField(default=False)),
+                ('amazon_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('amazon_review_star', models.DecimalField(blank=True, decimal_places=2, max_digits=3, null=True)),
+                ('amazon_review_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('hashtags', models.JSONField(blank=True, null=True)),
+                ('emojis', models.JSONField(blank=True, null=True)),
+                ('features', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCategory',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('handle', models.SlugField(max_length=255, unique=True)),
+                ('mpath', models.TextField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_internal', models.BooleanField(default=False)),
+                ('rank', models.PositiveIntegerField()),
+                ('description', models.TextField()),
+                ('parent_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subcategories', to='core.productcategory')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCollection',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('handle', models.SlugField(blank=True, max_length=255, null=True, unique=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductOption',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.product')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTag',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductType',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductVariant',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('sku', models.CharField(blank=True, max_length=255, null=True)),
+                ('barcode', models.CharField(blank=True, max_length=255, null=True)),
+                ('ean', models.CharField(blank=True, max_length=255, null=True)),
+                ('upc', models.CharField(blank=True, max_length=255, null=True)),
+                ('inventory_quantity', models.PositiveIntegerField(default=0)),
+                ('allow_backorder', models.BooleanField(default=False)),
+                ('manage_inventory', models.BooleanField(default=True)),
+                ('hs_code', models.CharField(blank=True, max_length=50, null=True)),
+                ('origin_country', models.CharField(blank=True, max_length=10, null=True)),
+                ('mid_code', models.CharField(blank=True, max_length=50, null=True)),
+                ('material', models.CharField(blank=True, max_length=255, null=True)),
+                ('weight', models.PositiveIntegerField(blank=True, null=True)),
+                ('length', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('variant_rank', models.PositiveIntegerField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PublishableApiKey',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('revoked_at', models.DateTimeField(blank=True, null=True)),
+                ('title', models.CharField(max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Region',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('currency_code', models.CharField(max_length=10)),
+                ('tax_rate', models.FloatField()),
+                ('tax_code', models.CharField(blank=True, max_length=50, null=True)),
+                ('gift_cards_taxable', models.BooleanField(default=False)),
+                ('automatic_taxes', models.BooleanField(default=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Return',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('received', 'Received')], max_length=50)),
+                ('shipping_data', models.JSONField(blank=True, null=True)),
+                ('refund_amount', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('received_at', models.DateTimeField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_notification', models.BooleanField(default=False)),
+                ('claim_order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.claimorder')),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.location')),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='SalesChannel',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('is_disabled', models.BooleanField(default=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Sequence',
+            fields=[
+                ('name', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('value', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ShippingMethod',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('price', models.IntegerField()),
+                ('data', models.JSONField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.cart')),
+                ('claim_order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.claimorder')),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.order')),
+                ('return_ref', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.return')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ShippingOption',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('price_type', models.CharField(choices=[('FIXED', 'Fixed'), ('VARIABLE', 'Variable')], max_length=50)),
+                ('amount', models.IntegerField(blank=True, null=True)),
+                ('is_return', models.BooleanField()),
+                ('data', models.JSONField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('admin_only', models.BooleanField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ShippingProfile',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('type', models.CharField(choices=[('STANDARD', 'Standard'), ('EXPRESS', 'Express')], max_length=50)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='StagedJob',
+            fields=[
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('event_name', models.CharField(max_length=255)),
+                ('data', models.JSONField()),
+                ('options', models.JSONField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Store',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('swap_link_template', models.CharField(blank=True, max_length=255, null=True)),
+                ('payment_link_template', models.CharField(blank=True, max_length=255, null=True)),
+                ('invite_link_template', models.CharField(blank=True, max_length=255, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('default_currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stores', to='core.currency')),
+                ('default_location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='default_for_stores', to='core.location')),
+                ('default_sales_channel', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='default_for_stores', to='core.saleschannel')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TaxProvider',
+            fields=[
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('is_installed', models.BooleanField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('first_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('last_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('password_hash', models.CharField(blank=True, max_length=255, null=True)),
+                ('api_token', models.CharField(blank=True, max_length=255, null=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('role', models.CharField(blank=True, choices=[('ADMIN', 'Admin'), ('CUSTOMER', 'Customer'), ('SUPPLIER', 'Supplier')], max_length=50, null=True)),
+                ('is_supplier', models.BooleanField(default=False)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TrackingLink',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('url', models.CharField(blank=True, max_length=255, null=True)),
+                ('tracking_number', models.CharField(max_length=255)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('fulfillment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tracking_links', to='core.fulfillment')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TaxRate',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('rate', models.FloatField(blank=True, null=True)),
+                ('code', models.CharField(blank=True, max_length=255, null=True)),
+                ('name', models.CharField(max_length=255)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tax_rates', to='core.region')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Swap',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('fulfillment_status', models.CharField(choices=[('PENDING', 'Pending'), ('FULFILLED', 'Fulfilled'), ('CANCELED', 'Canceled')], max_length=50)),
+                ('payment_status', models.CharField(choices=[('PENDING', 'Pending'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], max_length=50)),
+                ('difference_due', models.IntegerField(blank=True, null=True)),
+                ('confirmed_at', models.DateTimeField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_notification', models.BooleanField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('allow_backorder', models.BooleanField()),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='swaps', to='core.cart')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='swaps', to='core.order')),
+                ('shipping_address', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='swaps', to='core.address')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ShippingOptionRequirement',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('MIN', 'Minimum'), ('MAX', 'Maximum')], max_length=50)),
+                ('amount', models.IntegerField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('shipping_option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='requirements', to='core.shippingoption')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='shippingoption',
+            name='profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_options', to='core.shippingprofile'),
+        ),
+        migrations.AddField(
+            model_name='shippingoption',
+            name='provider',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_options', to='core.fulfillmentprovider'),
+        ),
+        migrations.AddField(
+            model_name='shippingoption',
+            name='region',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_options', to='core.region'),
+        ),
+        migrations.CreateModel(
+            name='ShippingMethodTaxLine',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('rate', models.FloatField()),
+                ('name', models.CharField(max_length=255)),
+                ('code', models.CharField(blank=True, max_length=255, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('shipping_method', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tax_lines', to='core.shippingmethod')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='shippingmethod',
+            name='shipping_option',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.shippingoption'),
+        ),
+        migrations.AddField(
+            model_name='shippingmethod',
+            name='swap',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='shipping_methods', to='core.swap'),
+        ),
+        migrations.CreateModel(
+            name='ReturnReason',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.CharField(max_length=255)),
+                ('label', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('parent_return_reason', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sub_reasons', to='core.returnreason')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ReturnItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('quantity', models.PositiveIntegerField()),
+                ('is_requested', models.BooleanField(default=False)),
+                ('requested_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('received_quantity', models.PositiveIntegerField(blank=True, null=True)),
+                ('note', models.TextField(blank=True, null=True)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.lineitem')),
+                ('reason', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.returnreason')),
+                ('return_instance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='return_items', to='core.return')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='return',
+            name='swap',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.swap'),
+        ),
+        migrations.AddField(
+            model_name='region',
+            name='tax_provider',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.taxprovider'),
+        ),
+        migrations.CreateModel(
+            name='Refund',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('note', models.TextField(blank=True, null=True)),
+                ('reason', models.CharField(choices=[('customer_request', 'Customer Request'), ('damage', 'Damage')], max_length=50)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order')),
+                ('payment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.payment')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PublishableApiKeySalesChannel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('identifier', models.CharField(max_length=255, unique=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('publishable_key', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.publishableapikey')),
+                ('sales_channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.saleschannel')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='publishableapikey',
+            name='created_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='api_keys_created', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='publishableapikey',
+            name='revoked_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='api_keys_revoked', to='core.user'),
+        ),
+        migrations.CreateModel(
+            name='ProductVariantMoneyAmount',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('money_amount', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.moneyamount')),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productvariant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductVariantInventoryItem',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('inventory_item_id', models.CharField(max_length=255)),
+                ('required_quantity', models.PositiveIntegerField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productvariant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSupplier',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('company_name', models.CharField(max_length=255)),
+                ('contact_email', models.EmailField(max_length=254)),
+                ('contact_phone', models.CharField(max_length=20)),
+                ('address', models.TextField()),
+                ('is_approved', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.user')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductOptionValue',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.CharField(max_length=255)),
+                ('option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productoption')),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productvariant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='collection',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.productcollection'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='supplier',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.productsupplier'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='type',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.producttype'),
+        ),
+        migrations.CreateModel(
+            name='PaymentSession',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('is_selected', models.BooleanField(default=False)),
+                ('status', models.CharField(choices=[('initiated', 'Initiated'), ('completed', 'Completed'), ('failed', 'Failed')], max_length=50)),
+                ('data', models.JSONField()),
+                ('idempotency_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('payment_authorized_at', models.DateTimeField(blank=True, null=True)),
+                ('amount', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_initiated', models.BooleanField(default=False)),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.cart')),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentprovider')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentCollection',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('type1', 'Type 1'), ('type2', 'Type 2')], max_length=50)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('closed', 'Closed')], max_length=50)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('amount', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('authorized_amount', models.PositiveIntegerField(blank=True, null=True)),
+                ('currency_code', models.CharField(max_length=10)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.user')),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='provider',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentprovider'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='swap',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.swap'),
+        ),
+        migrations.CreateModel(
+            name='OrderItemChange',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('addition', 'Addition'), ('removal', 'Removal')], max_length=50)),
+                ('line_item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='changes', to='core.lineitem')),
+                ('order_edit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.orderedit')),
+                ('original_line_item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='original_changes', to='core.lineitem')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='canceled_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_edits_canceled', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='confirmed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_edits_confirmed', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='created_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_edits_created', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='declined_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_edits_declined', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='order',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.order'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='payment_collection',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.paymentcollection'),
+        ),
+        migrations.AddField(
+            model_name='orderedit',
+            name='requested_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_edits_requested', to='core.user'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='region',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='sales_channel',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.saleschannel'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='shipping_address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='shipping_orders', to='core.address'),
+        ),
+        migrations.CreateModel(
+            name='OnboardingState',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('current_step', models.CharField(blank=True, max_length=255, null=True)),
+                ('is_complete', models.BooleanField(default=False)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.product')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('event_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('resource_type', models.CharField(max_length=50)),
+                ('resource_id', models.UUIDField()),
+                ('to', models.CharField(max_length=255)),
+                ('data', models.JSONField()),
+                ('customer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.customer')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='child_notifications', to='core.notification')),
+                ('provider', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.notificationprovider')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Note',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('resource_type', models.CharField(max_length=50)),
+                ('resource_id', models.UUIDField()),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.user')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='moneyamount',
+            name='price_list',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.pricelist'),
+        ),
+        migrations.AddField(
+            model_name='moneyamount',
+            name='region',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.region'),
+        ),
+        migrations.CreateModel(
+            name='LineItemTaxLine',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('rate', models.FloatField()),
+                ('name', models.CharField(max_length=255)),
+                ('code', models.CharField(blank=True, max_length=50, null=True)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.lineitem')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='LineItemAdjustment',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('description', models.CharField(max_length=255)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('discount', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.discount')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.lineitem')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='lineitem',
+            name='order',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order'),
+        ),
+        migrations.AddField(
+            model_name='lineitem',
+            name='order_edit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.orderedit'),
+        ),
+        migrations.AddField(
+            model_name='lineitem',
+            name='original_item',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='original_items', to='core.lineitem'),
+        ),
+        migrations.AddField(
+            model_name='lineitem',
+            name='swap',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.swap'),
+        ),
+        migrations.AddField(
+            model_name='lineitem',
+            name='variant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.productvariant'),
+        ),
+        migrations.CreateModel(
+            name='InventoryReservation',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('quantity', models.PositiveIntegerField()),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productvariant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='GiftCardTransaction',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.PositiveIntegerField()),
+                ('is_taxable', models.BooleanField(blank=True, null=True)),
+                ('tax_rate', models.FloatField(blank=True, null=True)),
+                ('gift_card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.giftcard')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.order')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='giftcard',
+            name='order',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order'),
+        ),
+        migrations.AddField(
+            model_name='giftcard',
+            name='region',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region'),
+        ),
+        migrations.AddField(
+            model_name='fulfillment',
+            name='location',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.location'),
+        ),
+        migrations.AddField(
+            model_name='fulfillment',
+            name='order',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order'),
+        ),
+        migrations.AddField(
+            model_name='fulfillment',
+            name='provider',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.fulfillmentprovider'),
+        ),
+        migrations.AddField(
+            model_name='fulfillment',
+            name='swap',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.swap'),
+        ),
+        migrations.AddField(
+            model_name='draftorder',
+            name='order',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.order'),
+        ),
+        migrations.CreateModel(
+            name='DiscountCondition',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('type_a', 'Type A'), ('type_b', 'Type B')], max_length=50)),
+                ('operator', models.CharField(choices=[('equal', 'Equal'), ('not_equal', 'Not Equal')], max_length=50)),
+                ('discount_rule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountrule')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='discount',
+            name='rule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.discountrule'),
+        ),
+        migrations.CreateModel(
+            name='CustomShippingOption',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('price', models.PositiveIntegerField()),
+                ('cart', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.cart')),
+                ('shipping_option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.shippingoption')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Country',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('iso_2', models.CharField(max_length=2)),
+                ('iso_3', models.CharField(max_length=3)),
+                ('num_code', models.IntegerField()),
+                ('name', models.CharField(max_length=255)),
+                ('display_name', models.CharField(max_length=255)),
+                ('region', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.region')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='claimorder',
+            name='order',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.order'),
+        ),
+        migrations.AddField(
+            model_name='claimorder',
+            name='shipping_address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.address'),
+        ),
+        migrations.CreateModel(
+            name='ClaimItem',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('reason', models.CharField(choices=[('damage', 'Damage'), ('wrong_item', 'Wrong Item')], max_length=50)),
+                ('note', models.TextField(blank=True, null=True)),
+                ('quantity', models.PositiveIntegerField()),
+                ('claim_order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.claimorder')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.lineitem')),
+                ('variant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productvariant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaimImage',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('url', models.URLField()),
+                ('claim_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.claimitem')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='customer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.customer'),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='payment',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='paid_carts', to='core.payment'),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='region',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region'),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='sales_channel',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.saleschannel'),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='shipping_address',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='shipping_carts', to='core.address'),
+        ),
+        migrations.CreateModel(
+            name='BatchJob',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('type', models.TextField()),
+                ('context', models.JSONField(blank=True, null=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('dry_run', models.BooleanField(default=False)),
+                ('pre_processed_at', models.DateTimeField(blank=True, null=True)),
+                ('confirmed_at', models.DateTimeField(blank=True, null=True)),
+                ('processing_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('failed_at', models.DateTimeField(blank=True, null=True)),
+                ('canceled_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='batch_jobs_created', to='core.user')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AnalyticsConfig',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('opt_out', models.BooleanField(default=False)),
+                ('anonymize', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.user')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='address',
+            name='customer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.customer'),
+        ),
+        migrations.CreateModel(
+            name='StoreCurrencies',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='store_currencies', to='core.currency')),
+                ('store', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='currencies', to='core.store')),
+            ],
+            options={
+                'unique_together': {('store', 'currency')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ShippingTaxRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('rate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_tax_rates', to='core.taxrate')),
+                ('shipping_option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shipping_tax_rates', to='core.shippingoption')),
+            ],
+            options={
+                'unique_together': {('shipping_option', 'rate')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SalesChannelLocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.location')),
+                ('sales_channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.saleschannel')),
+            ],
+            options={
+                'unique_together': {('sales_channel', 'location')},
+            },
+        ),
+        migrations.CreateModel(
+            name='RegionPaymentProvider',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentprovider')),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region')),
+            ],
+            options={
+                'unique_together': {('region', 'provider')},
+            },
+        ),
+        migrations.CreateModel(
+            name='RegionFulfillmentProvider',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.fulfillmentprovider')),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region')),
+            ],
+            options={
+                'unique_together': {('region', 'provider')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTypeTaxRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.producttype')),
+                ('tax_rate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.taxrate')),
+            ],
+            options={
+                'unique_together': {('product_type', 'tax_rate')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTaxRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+                ('tax_rate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.taxrate')),
+            ],
+            options={
+                'unique_together': {('product', 'tax_rate')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTags',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+                ('product_tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.producttag')),
+            ],
+            options={
+                'unique_together': {('product', 'product_tag')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductShippingProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.shippingprofile')),
+            ],
+            options={
+                'unique_together': {('profile', 'product')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSalesChannel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+                ('sales_channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.saleschannel')),
+            ],
+            options={
+                'unique_together': {('product', 'sales_channel')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImages',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('image', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.image')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+            ],
+            options={
+                'unique_together': {('product', 'image')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCategoryProduct',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+                ('product_category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productcategory')),
+            ],
+            options={
+                'unique_together': {('product_category', 'product')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PriceListCustomerGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('customer_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.customergroup')),
+                ('price_list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.pricelist')),
+            ],
+            options={
+                'unique_together': {('price_list', 'customer_group')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentCollectionSessions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('payment_collection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentcollection')),
+                ('payment_session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentsession')),
+            ],
+            options={
+                'unique_together': {('payment_collection', 'payment_session')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentCollectionPayments',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('payment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.payment')),
+                ('payment_collection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.paymentcollection')),
+            ],
+            options={
+                'unique_together': {('payment_collection', 'payment')},
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderGiftCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('gift_card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.giftcard')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.order')),
+            ],
+            options={
+                'unique_together': {('order', 'gift_card')},
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderDiscount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('discount', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discount')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.order')),
+            ],
+            options={
+                'unique_together': {('order', 'discount')},
+            },
+        ),
+        migrations.CreateModel(
+            name='FulfillmentItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('quantity', models.PositiveIntegerField()),
+                ('fulfillment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.fulfillment')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.lineitem')),
+            ],
+            options={
+                'unique_together': {('fulfillment', 'item')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountRuleProducts',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('discount_rule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountrule')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+            ],
+            options={
+                'unique_together': {('discount_rule', 'product')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountRegions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('discount', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discount')),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.region')),
+            ],
+            options={
+                'unique_together': {('discount', 'region')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountConditionProductType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('condition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountcondition')),
+                ('product_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.producttype')),
+            ],
+            options={
+                'unique_together': {('product_type', 'condition')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountConditionProductTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('condition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountcondition')),
+                ('product_tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.producttag')),
+            ],
+            options={
+                'unique_together': {('product_tag', 'condition')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountConditionProductCollection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('condition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountcondition')),
+                ('product_collection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.productcollection')),
+            ],
+            options={
+                'unique_together': {('product_collection', 'condition')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountConditionProduct',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('condition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountcondition')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.product')),
+            ],
+            options={
+                'unique_together': {('product', 'condition')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountConditionCustomerGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('condition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discountcondition')),
+                ('customer_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.customergroup')),
+            ],
+            options={
+                'unique_together': {('customer_group', 'condition')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CustomerGroupCustomers',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.customer')),
+                ('customer_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.customergroup')),
+            ],
+            options={
+                'unique_together': {('customer_group', 'customer')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ClaimItemTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.claimitem')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.claimtag')),
+            ],
+            options={
+                'unique_together': {('item', 'tag')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CartGiftCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('cart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.cart')),
+                ('gift_card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.giftcard')),
+            ],
+            options={
+                'unique_together': {('cart', 'gift_card')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CartDiscount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('cart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.cart')),
+                ('discount', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.discount')),
+            ],
+            options={
+                'unique_together': {('cart', 'discount')},
+            },
+        ),
+    ]
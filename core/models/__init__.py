@@ -1,3 +1,4 @@
 from .base_model import BaseModel, SupabaseAuth
 
-from .tiktok import *
\ No newline at end of file
+from .tiktok import *
+from .models import *
@@ -61,16 +61,6 @@ class BaseModel(JSONSerializableMixin, models.Model):
     def get_valid_fields(cls):
         return [f.name for f in cls._meta.get_fields() if not f.is_relation]
 
-    def __getattribute__(self, name):
-        attr = super().__getattribute__(name)
-        if isinstance(attr, models.JSONField):
-            if isinstance(attr, str):
-                try:
-                    return json.loads(attr)
-                except json.JSONDecodeError:
-                    return attr
-        return attr
-
 
 
 from django.db import models
@@ -0,0 +1,28 @@
+# core/models/fields.py
+
+import json
+from django.db import models
+
+
+class JSONField(models.JSONField):
+    """
+    JSONField that also decodes documents stored as a JSON-encoded string
+    (rows written by clients that json.dumps'd before saving). The decoding
+    runs once in from_db_value when the row is loaded, so attribute access on
+    the instance stays plain Python.
+
+    Deconstructs as models.JSONField, so swapping it in needs no migration.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        value = super().from_db_value(value, expression, connection)
+        if isinstance(value, str) and value[:1] in ('{', '['):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                return value
+        return value
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        return name, 'django.db.models.JSONField', args, kwargs
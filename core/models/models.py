@@ -2,10 +2,8 @@ import uuid
 from django.db import models
 from django.utils import timezone
 from django.core.validators import MinValueValidator
-from django.contrib.postgres.fields import JSONField  # Use if Django < 3.1
-
-# For Django 3.1 and above, you can use the built-in JSONField
-# from django.db.models import JSONField
+# The built-in JSONField (Django 3.1+) replaces django.contrib.postgres.fields.JSONField, removed in 4.0
+from django.db.models import JSONField
 
 # ==========================
 # Enumerations
@@ -152,7 +150,7 @@ class Cart(TimeStampedModel):
     shipping_address = models.ForeignKey(Address, related_name='shipping_carts', null=True, blank=True, on_delete=models.SET_NULL)
     region = models.ForeignKey('Region', on_delete=models.CASCADE)
     customer = models.ForeignKey('Customer', null=True, blank=True, on_delete=models.SET_NULL)
-    payment = models.ForeignKey('Payment', null=True, blank=True, on_delete=models.SET_NULL)
+    payment = models.ForeignKey('Payment', related_name='paid_carts', null=True, blank=True, on_delete=models.SET_NULL)
     type = models.CharField(max_length=50, choices=CartTypeEnum.choices)
     completed_at = models.DateTimeField(null=True, blank=True)
     idempotency_key = models.CharField(max_length=255, null=True, blank=True)
@@ -521,6 +519,15 @@ class Image(TimeStampedModel):
     def __str__(self):
         return self.url
 
+class InventoryReservation(TimeStampedModel):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    variant = models.ForeignKey('ProductVariant', on_delete=models.CASCADE)
+    quantity = models.PositiveIntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Reservation {self.id} of {self.quantity} x {self.variant_id}"
+
 class Invite(TimeStampedModel):
     ROLE_CHOICES = [
         ('admin', 'Admin'),
@@ -585,6 +592,14 @@ class LineItemTaxLine(TimeStampedModel):
     def __str__(self):
         return f"TaxLine {self.id} for LineItem {self.item.id}"
 
+class Location(TimeStampedModel):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255)
+    address = models.ForeignKey(Address, null=True, blank=True, on_delete=models.SET_NULL)
+
+    def __str__(self):
+        return self.name
+
 class Migration(models.Model):
     id = models.AutoField(primary_key=True)
     timestamp = models.BigIntegerField()
@@ -681,7 +696,7 @@ class Order(TimeStampedModel):
     tax_rate = models.FloatField(null=True, blank=True)
     canceled_at = models.DateTimeField(null=True, blank=True)
     idempotency_key = models.CharField(max_length=255, null=True, blank=True)
-    draft_order = models.ForeignKey(DraftOrder, null=True, blank=True, on_delete=models.SET_NULL)
+    draft_order = models.ForeignKey(DraftOrder, related_name='orders', null=True, blank=True, on_delete=models.SET_NULL)
     no_notification = models.BooleanField(default=False)
     external_id = models.CharField(max_length=255, null=True, blank=True)
     sales_channel = models.ForeignKey('SalesChannel', null=True, blank=True, on_delete=models.SET_NULL)
@@ -747,7 +762,7 @@ class OrderItemChange(TimeStampedModel):
 class Payment(TimeStampedModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     swap = models.ForeignKey('Swap', null=True, blank=True, on_delete=models.SET_NULL)
-    cart = models.ForeignKey(Cart, null=True, blank=True, on_delete=models.SET_NULL)
+    cart = models.ForeignKey(Cart, related_name='payments', null=True, blank=True, on_delete=models.SET_NULL)
     order = models.ForeignKey(Order, null=True, blank=True, on_delete=models.SET_NULL)
     amount = models.PositiveIntegerField(validators=[MinValueValidator(0)])
     currency_code = models.CharField(max_length=10)
@@ -1199,6 +1214,13 @@ class SalesChannelLocation(TimeStampedModel):
     def __str__(self):
         return f"SalesChannel {self.sales_channel.name} - Location {self.location.id}"
 
+class Sequence(models.Model):
+    name = models.CharField(max_length=255, primary_key=True)
+    value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
+
 
 from django.db import models
 
@@ -1213,7 +1235,7 @@ class ShippingOption(TimeStampedModel):
     name = models.CharField(max_length=255)
     region = models.ForeignKey('Region', on_delete=models.CASCADE, related_name='shipping_options')
     profile = models.ForeignKey('ShippingProfile', on_delete=models.CASCADE, related_name='shipping_options')
-    provider = models.ForeignKey('ShippingProvider', on_delete=models.CASCADE, related_name='shipping_options')
+    provider = models.ForeignKey('FulfillmentProvider', on_delete=models.CASCADE, related_name='shipping_options')
     price_type = models.CharField(max_length=50, choices=PRICE_TYPE_CHOICES)
     amount = models.IntegerField(null=True, blank=True)
     is_return = models.BooleanField()
@@ -0,0 +1,275 @@
+# core/services/discount_engine.py
+
+import logging
+from collections import defaultdict, namedtuple
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from core.models.models import (
+    Discount,
+    DiscountCondition,
+    DiscountConditionCustomerGroup,
+    DiscountConditionOperatorEnum,
+    DiscountConditionProduct,
+    DiscountConditionProductCollection,
+    DiscountConditionProductTag,
+    DiscountConditionProductType,
+    DiscountRegions,
+    DiscountRule,
+    DiscountRuleAllocationEnum,
+    DiscountRuleProducts,
+    DiscountRuleTypeEnum,
+    CustomerGroupCustomers,
+    LineItem,
+    ProductTags,
+)
+from .snapshot_cache import VersionedSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Condition kinds, one per join table a DiscountCondition can point into
+PRODUCT = 'product'
+PRODUCT_TYPE = 'product_type'
+PRODUCT_COLLECTION = 'product_collection'
+PRODUCT_TAG = 'product_tag'
+CUSTOMER_GROUP = 'customer_group'
+
+CONDITION_TABLES = (
+    (PRODUCT, DiscountConditionProduct, 'product_id'),
+    (PRODUCT_TYPE, DiscountConditionProductType, 'product_type_id'),
+    (PRODUCT_COLLECTION, DiscountConditionProductCollection, 'product_collection_id'),
+    (PRODUCT_TAG, DiscountConditionProductTag, 'product_tag_id'),
+    (CUSTOMER_GROUP, DiscountConditionCustomerGroup, 'customer_group_id'),
+)
+
+CompiledCondition = namedtuple('CompiledCondition', ['kind', 'exclude', 'ids'])
+
+DiscountItem = namedtuple(
+    'DiscountItem',
+    ['id', 'product_id', 'product_type_id', 'collection_id', 'tag_ids', 'unit_price', 'quantity', 'allow_discounts'],
+)
+
+CartContext = namedtuple('CartContext', ['region_id', 'customer_group_ids', 'items'])
+
+DiscountResult = namedtuple('DiscountResult', ['discount_id', 'code', 'total', 'item_amounts'])
+
+
+class CompiledDiscount:
+    """
+    One discount with its rule and every condition flattened into frozensets
+    of eligible ids, so matching an item is a handful of set lookups.
+    """
+
+    __slots__ = (
+        'id', 'code', 'rule_type', 'value', 'allocation', 'starts_at', 'ends_at',
+        'usage_limit', 'usage_count', 'region_ids', 'item_conditions', 'group_conditions',
+    )
+
+    def __init__(self, row, region_ids, conditions):
+        (self.id, self.code, self.rule_type, self.value, self.allocation,
+         self.starts_at, self.ends_at, self.usage_limit, self.usage_count) = row
+        self.region_ids = region_ids
+        self.item_conditions = tuple(c for c in conditions if c.kind != CUSTOMER_GROUP)
+        self.group_conditions = tuple(c for c in conditions if c.kind == CUSTOMER_GROUP)
+
+    def is_active(self, now):
+        # usage_count is as of the snapshot; redemption must still increment it with a conditional UPDATE
+        if self.starts_at > now or (self.ends_at is not None and self.ends_at <= now):
+            return False
+        return self.usage_limit is None or self.usage_count < self.usage_limit
+
+    def applies_to_cart(self, cart):
+        if self.region_ids and cart.region_id not in self.region_ids:
+            return False
+        for condition in self.group_conditions:
+            if bool(condition.ids & cart.customer_group_ids) == condition.exclude:
+                return False
+        return True
+
+    def applies_to_item(self, item):
+        if not item.allow_discounts:
+            return False
+        for condition in self.item_conditions:
+            if condition.kind == PRODUCT:
+                matched = item.product_id in condition.ids
+            elif condition.kind == PRODUCT_TYPE:
+                matched = item.product_type_id in condition.ids
+            elif condition.kind == PRODUCT_COLLECTION:
+                matched = item.collection_id in condition.ids
+            else:
+                matched = bool(condition.ids & item.tag_ids)
+            if matched == condition.exclude:
+                return False
+        return True
+
+    def amounts(self, items):
+        """Discount per eligible item id, in the items' integer minor units."""
+        eligible = [item for item in items if self.applies_to_item(item)]
+        if not eligible:
+            return {}
+        if self.rule_type == DiscountRuleTypeEnum.PERCENTAGE:
+            return {item.id: round(item.unit_price * item.quantity * self.value / 100) for item in eligible}
+        if self.allocation == DiscountRuleAllocationEnum.EACH:
+            return {item.id: min(self.value * item.quantity, item.unit_price * item.quantity) for item in eligible}
+
+        # Fixed amount over the whole cart: split across eligible lines by line total
+        line_totals = [item.unit_price * item.quantity for item in eligible]
+        subtotal = sum(line_totals)
+        if subtotal == 0:
+            return {}
+        total = min(self.value, subtotal)
+        amounts, allocated = {}, 0
+        for item, line_total in zip(eligible[:-1], line_totals[:-1]):
+            share = total * line_total // subtotal
+            amounts[item.id] = share
+            allocated += share
+        # The last line takes the rounding remainder so the shares add up exactly
+        amounts[eligible[-1].id] = total - allocated
+        return amounts
+
+
+class DiscountSnapshot:
+    def __init__(self, discounts):
+        self.discounts = discounts
+        self.by_code = {discount.code.upper(): discount for discount in discounts}
+
+
+def build_discount_snapshot():
+    """Compile every enabled, unexpired discount in a fixed number of queries."""
+    now = timezone.now()
+    rows = list(
+        Discount.objects.filter(is_disabled=False, deleted_at__isnull=True, rule__isnull=False)
+        .exclude(ends_at__lte=now)
+        .values_list(
+            'id', 'code', 'rule__type', 'rule__value', 'rule__allocation',
+            'starts_at', 'ends_at', 'usage_limit', 'usage_count', 'rule_id',
+        )
+    )
+    rule_ids = {row[-1] for row in rows}
+    discount_ids = [row[0] for row in rows]
+
+    regions = defaultdict(set)
+    for discount_id, region_id in DiscountRegions.objects.filter(discount_id__in=discount_ids).values_list('discount_id', 'region_id'):
+        regions[discount_id].add(region_id)
+
+    condition_rows = DiscountCondition.objects.filter(
+        discount_rule_id__in=rule_ids, deleted_at__isnull=True
+    ).values_list('id', 'discount_rule_id', 'operator')
+    condition_meta = {cid: (rule_id, operator) for cid, rule_id, operator in condition_rows}
+
+    condition_ids = defaultdict(lambda: defaultdict(set))
+    for kind, model, column in CONDITION_TABLES:
+        for condition_id, target_id in model.objects.filter(condition_id__in=list(condition_meta)).values_list('condition_id', column):
+            condition_ids[condition_id][kind].add(target_id)
+
+    rule_conditions = defaultdict(list)
+    for condition_id, (rule_id, operator) in condition_meta.items():
+        exclude = operator == DiscountConditionOperatorEnum.NOT_EQUAL
+        for kind, ids in condition_ids[condition_id].items():
+            rule_conditions[rule_id].append(CompiledCondition(kind, exclude, frozenset(ids)))
+
+    # Products attached straight to the rule behave as an inclusive product condition
+    rule_products = defaultdict(set)
+    for rule_id, product_id in DiscountRuleProducts.objects.filter(discount_rule_id__in=rule_ids).values_list('discount_rule_id', 'product_id'):
+        rule_products[rule_id].add(product_id)
+    for rule_id, product_ids in rule_products.items():
+        rule_conditions[rule_id].append(CompiledCondition(PRODUCT, False, frozenset(product_ids)))
+
+    discounts = [
+        CompiledDiscount(row[:-1], frozenset(regions[row[0]]), rule_conditions[row[-1]])
+        for row in rows
+    ]
+    logger.info(f"Compiled {len(discounts)} discounts with {len(condition_meta)} conditions")
+    return DiscountSnapshot(discounts)
+
+
+class DiscountEngine:
+    """
+    Evaluates carts against the compiled discounts. Only building the
+    snapshot touches the database; evaluation is set lookups and integer
+    arithmetic, for one cart or a batch.
+    """
+
+    snapshot = VersionedSnapshot('discounts', build_discount_snapshot)
+
+    @classmethod
+    def invalidate(cls):
+        cls.snapshot.invalidate()
+
+    @classmethod
+    def candidates(cls, codes=None):
+        snapshot = cls.snapshot.get()
+        if codes is None:
+            return snapshot.discounts
+        return [snapshot.by_code[code.upper()] for code in codes if code.upper() in snapshot.by_code]
+
+    @classmethod
+    def evaluate(cls, cart, codes=None, now=None):
+        """
+        Return a DiscountResult for every discount that applies to cart.
+        With codes, only those discounts are considered (the codes entered on
+        the cart); otherwise every active discount is, e.g. for automatic ones.
+        """
+        now = now or timezone.now()
+        results = []
+        for discount in cls.candidates(codes):
+            if not discount.is_active(now) or not discount.applies_to_cart(cart):
+                continue
+            item_amounts = discount.amounts(cart.items)
+            if item_amounts:
+                results.append(DiscountResult(discount.id, discount.code, sum(item_amounts.values()), item_amounts))
+        return results
+
+    @classmethod
+    def evaluate_many(cls, carts, codes=None):
+        """Evaluate many carts against one snapshot; codes is a parallel list of code lists (or None)."""
+        now = timezone.now()
+        codes = codes or [None] * len(carts)
+        return [cls.evaluate(cart, cart_codes, now) for cart, cart_codes in zip(carts, codes)]
+
+
+def load_cart_contexts(carts):
+    """
+    Build CartContexts for a batch of Cart instances with at most three queries
+    in total: line items with their product attributes, product tags, and the
+    customers' groups.
+    """
+    cart_ids = [cart.id for cart in carts]
+    item_rows = LineItem.objects.filter(cart_id__in=cart_ids).values_list(
+        'id', 'cart_id', 'variant__product_id', 'variant__product__type_id',
+        'variant__product__collection_id', 'unit_price', 'quantity', 'allow_discounts',
+    )
+    item_rows = list(item_rows)
+
+    product_ids = {row[2] for row in item_rows if row[2] is not None}
+    tags = defaultdict(set)
+    for product_id, tag_id in ProductTags.objects.filter(product_id__in=product_ids).values_list('product_id', 'product_tag_id'):
+        tags[product_id].add(tag_id)
+
+    customer_ids = {cart.customer_id for cart in carts if cart.customer_id}
+    groups = defaultdict(set)
+    for customer_id, group_id in CustomerGroupCustomers.objects.filter(customer_id__in=customer_ids).values_list('customer_id', 'customer_group_id'):
+        groups[customer_id].add(group_id)
+
+    items_by_cart = defaultdict(list)
+    for item_id, cart_id, product_id, type_id, collection_id, unit_price, quantity, allow_discounts in item_rows:
+        items_by_cart[cart_id].append(DiscountItem(
+            item_id, product_id, type_id, collection_id, frozenset(tags[product_id]),
+            unit_price, quantity, allow_discounts,
+        ))
+    return [
+        CartContext(cart.region_id, frozenset(groups[cart.customer_id]), items_by_cart[cart.id])
+        for cart in carts
+    ]
+
+
+def _invalidate_discounts(sender, **kwargs):
+    # Bump after commit so no worker recompiles from the pre-change rows
+    transaction.on_commit(DiscountEngine.invalidate)
+
+
+for _model in (Discount, DiscountRule, DiscountCondition, DiscountRegions, DiscountRuleProducts) + tuple(
+    model for _, model, _ in CONDITION_TABLES
+):
+    post_save.connect(_invalidate_discounts, sender=_model, dispatch_uid=f'discount_engine_{_model.__name__}')
+    post_delete.connect(_invalidate_discounts, sender=_model, dispatch_uid=f'discount_engine_delete_{_model.__name__}')
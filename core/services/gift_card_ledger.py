@@ -0,0 +1,125 @@
+# core/services/gift_card_ledger.py
+
+import logging
+from collections import defaultdict, namedtuple
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from core.models.models import GiftCard, GiftCardTransaction
+
+logger = logging.getLogger(__name__)
+
+GiftCardDebit = namedtuple('GiftCardDebit', ['gift_card_id', 'order_id', 'amount'])
+GiftCardApplyResult = namedtuple('GiftCardApplyResult', ['applied', 'rejected'])
+
+
+class InsufficientGiftCardBalance(Exception):
+    def __init__(self, gift_card_id, amount):
+        super().__init__(f"Gift card {gift_card_id} cannot cover {amount}")
+        self.gift_card_id = gift_card_id
+        self.amount = amount
+
+
+class GiftCardLedger:
+    """
+    Gift card redemption without read-modify-write. A debit is one
+    conditional UPDATE (balance >= amount, card usable) with F(), so two
+    orders spending the same card can never overdraw it, and the matching
+    GiftCardTransaction rows are written with bulk_create in the same
+    transaction as their debits.
+    """
+
+    def __init__(self, chunk_size=500):
+        # Each chunk commits on its own so row locks on hot cards are held briefly
+        self.chunk_size = chunk_size
+
+    def debit(self, gift_card_id, order_id, amount):
+        result = self.apply([GiftCardDebit(gift_card_id, order_id, amount)])
+        if result.rejected:
+            raise InsufficientGiftCardBalance(gift_card_id, amount)
+        return result.applied[0]
+
+    def apply(self, debits):
+        """
+        Apply many (gift_card_id, order_id, amount) debits, e.g. a promotional
+        run over thousands of orders. Debits a card cannot cover are returned
+        as rejected rather than failing the batch.
+        """
+        applied, rejected = [], []
+        # Card order is fixed so concurrent batches lock rows in the same order and cannot deadlock
+        debits = sorted((GiftCardDebit(*debit) for debit in debits), key=lambda debit: str(debit.gift_card_id))
+        for start in range(0, len(debits), self.chunk_size):
+            chunk_applied, chunk_rejected = self._apply_chunk(debits[start:start + self.chunk_size])
+            applied.extend(chunk_applied)
+            rejected.extend(chunk_rejected)
+        if rejected:
+            logger.info(f"Applied {len(applied)} gift card debits, rejected {len(rejected)}")
+        return GiftCardApplyResult(applied, rejected)
+
+    def _usable(self, gift_card_id, amount, now):
+        return GiftCard.objects.filter(
+            Q(ends_at__isnull=True) | Q(ends_at__gt=now),
+            id=gift_card_id, is_disabled=False, deleted_at__isnull=True, balance__gte=amount,
+        )
+
+    def _take(self, gift_card_id, amount, now):
+        return self._usable(gift_card_id, amount, now).update(balance=F('balance') - amount) == 1
+
+    @transaction.atomic
+    def _apply_chunk(self, debits):
+        applied, rejected = self.take(debits)
+        self.record(applied)
+        return applied, rejected
+
+    def take(self, debits, now=None):
+        """
+        Take the balances for debits without writing their transactions, for
+        callers that record them later in the same transaction (as order
+        completion does once its orders exist). Returns (applied, rejected).
+        """
+        now = now or timezone.now()
+        by_card = defaultdict(list)
+        for debit in debits:
+            if debit.amount <= 0:
+                raise ValueError(f"Gift card debit must be positive, got {debit.amount}")
+            by_card[debit.gift_card_id].append(debit)
+
+        applied, rejected = [], []
+        for gift_card_id, card_debits in by_card.items():
+            # One UPDATE covers every debit on the card when the balance allows it
+            if self._take(gift_card_id, sum(debit.amount for debit in card_debits), now):
+                applied.extend(card_debits)
+                continue
+            for debit in card_debits:
+                (applied if self._take(gift_card_id, debit.amount, now) else rejected).append(debit)
+        return applied, rejected
+
+    def restore(self, debits):
+        """Put back balances taken by take() for debits that will not be recorded."""
+        by_card = defaultdict(int)
+        for debit in debits:
+            by_card[debit.gift_card_id] += debit.amount
+        for gift_card_id, amount in by_card.items():
+            GiftCard.objects.filter(id=gift_card_id).update(balance=F('balance') + amount)
+
+    def record(self, debits):
+        """Write the GiftCardTransaction rows for debits already taken."""
+        if not debits:
+            return []
+        taxes = {
+            str(card_id): (taxable, rate if rate is not None else region_rate)
+            for card_id, rate, taxable, region_rate in GiftCard.objects.filter(
+                id__in={debit.gift_card_id for debit in debits}
+            ).values_list('id', 'tax_rate', 'region__gift_cards_taxable', 'region__tax_rate')
+        }
+        transactions = []
+        for debit in debits:
+            is_taxable, tax_rate = taxes[str(debit.gift_card_id)]
+            transactions.append(GiftCardTransaction(
+                gift_card_id=debit.gift_card_id,
+                order_id=debit.order_id,
+                amount=debit.amount,
+                is_taxable=is_taxable,
+                tax_rate=tax_rate if is_taxable else None,
+            ))
+        return GiftCardTransaction.objects.bulk_create(transactions)
@@ -0,0 +1,256 @@
+# core/services/inventory.py
+
+import json
+import logging
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from core.common.redis_utils import get_redis_connection
+from core.models.models import InventoryReservation, ProductVariant
+
+logger = logging.getLogger(__name__)
+
+# Reservation ids scored by expiry time, plus one hash per reservation with what to restock
+LEDGER_KEY = 'inventory:reservations'
+RESERVATION_KEY = 'inventory:reservation:{}'
+STOCK_KEY = 'inventory:stock:{}'
+# Front counters expire so drift from admin edits or a lost release heals on its own
+STOCK_TTL_SECONDS = 5 * 60
+
+Reservation = namedtuple('Reservation', ['id', 'variant_id', 'quantity', 'expires_at'])
+
+# Take quantity from the front counter only if it covers the request; nil means the counter is cold
+_TAKE_IF_AVAILABLE = """
+local stock = redis.call('GET', KEYS[1])
+if not stock then
+    return nil
+end
+if tonumber(stock) < tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DECRBY', KEYS[1], ARGV[1])
+return 1
+"""
+
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+
+class InsufficientInventory(Exception):
+    def __init__(self, variant_id, quantity):
+        super().__init__(f"Not enough stock of variant {variant_id} to reserve {quantity}")
+        self.variant_id = variant_id
+        self.quantity = quantity
+
+
+class InventoryService:
+    """
+    Stock reservations without row locks. Stock is taken with a conditional
+    UPDATE (inventory_quantity >= n) so concurrent checkouts on a hot SKU
+    never wait on each other, and each reservation is written to a short-TTL
+    ledger in Redis: confirm() keeps the stock taken, release() or the expiry
+    sweep puts it back. Without Redis, or when writing to it fails, the
+    reservation is kept as an InventoryReservation row instead, and confirm,
+    release and the sweep read both ledgers.
+
+    With INVENTORY_REDIS_COUNTER on, a Redis counter per variant turns away
+    requests that cannot be met before they reach the database. The database
+    stays authoritative and reconcile() resets the counters from it.
+    """
+
+    def __init__(self, client=None, ttl=None, use_counter=None):
+        self.client = client or get_redis_connection()
+        self.ttl = ttl or getattr(settings, 'INVENTORY_RESERVATION_TTL', 15 * 60)
+        use_counter = getattr(settings, 'INVENTORY_REDIS_COUNTER', False) if use_counter is None else use_counter
+        self.use_counter = use_counter and self.client is not None
+
+    def reserve(self, variant_id, quantity):
+        """
+        Take quantity of a variant and return a Reservation. Variants that do
+        not manage inventory, or that allow backorders and are out of stock,
+        reserve nothing (quantity 0) instead of failing.
+        """
+        if quantity <= 0:
+            raise ValueError(f"Reservation quantity must be positive, got {quantity}")
+
+        if self.use_counter and not self._take_from_counter(variant_id, quantity):
+            return self._unreserved(variant_id, quantity)
+
+        with transaction.atomic():
+            taken = ProductVariant.objects.filter(
+                id=variant_id, manage_inventory=True, inventory_quantity__gte=quantity,
+            ).update(inventory_quantity=F('inventory_quantity') - quantity)
+            if not taken:
+                if self.use_counter:
+                    # The counter let this through but the database disagreed, so it has drifted
+                    self.client.delete(STOCK_KEY.format(variant_id))
+                return self._unreserved(variant_id, quantity)
+
+            reservation = Reservation(str(uuid.uuid4()), str(variant_id), quantity, time.time() + self.ttl)
+            if self.client is None:
+                # The database ledger commits or rolls back with the stock it records
+                self._record_in_database(reservation)
+            else:
+                # Only ledger stock that was really taken; a rolled-back reserve must not be restocked by the sweep
+                transaction.on_commit(lambda: self._record(reservation))
+        return reservation
+
+    def reserve_many(self, lines):
+        """Reserve every (variant_id, quantity) in lines, or none of them."""
+        reservations = []
+        try:
+            for variant_id, quantity in lines:
+                reservations.append(self.reserve(variant_id, quantity))
+        except Exception:
+            for reservation in reservations:
+                self.release(reservation.id)
+            raise
+        return reservations
+
+    def confirm(self, reservation_id):
+        """The order went through: drop the reservation and keep the stock taken."""
+        return self._claim(reservation_id) is not None
+
+    def release(self, reservation_id):
+        """Put a reservation's stock back. Returns False if it was already confirmed, released or swept."""
+        entry = self._claim(reservation_id)
+        if entry is None:
+            return False
+        self._restock(entry['variant_id'], entry['quantity'])
+        return True
+
+    def release_expired(self, now=None, limit=1000):
+        """Restock reservations past their TTL; run periodically (release_inventory_reservations)."""
+        now = now or time.time()
+        expired = []
+        if self.client is not None:
+            try:
+                expired = [r.decode() for r in self.client.zrangebyscore(LEDGER_KEY, '-inf', now, start=0, num=limit)]
+            except redis.RedisError as e:
+                logger.error(f"Redis error reading expired inventory reservations: {e}")
+        expired += [
+            str(reservation_id) for reservation_id in InventoryReservation.objects.filter(
+                expires_at__lte=datetime.fromtimestamp(now, timezone.utc),
+            ).order_by('expires_at').values_list('id', flat=True)[:max(limit - len(expired), 0)]
+        ]
+        released = 0
+        for reservation_id in expired:
+            if self.release(reservation_id):
+                released += 1
+        if released:
+            logger.info(f"Released {released} expired inventory reservations")
+        return released
+
+    def reconcile(self, variant_ids=None):
+        """Reset front counters from the database: the given variants, or every one that has a counter."""
+        if self.client is None:
+            return 0
+        if variant_ids is None:
+            prefix = STOCK_KEY.format('')
+            variant_ids = [key.decode()[len(prefix):] for key in self.client.scan_iter(match=STOCK_KEY.format('*'))]
+        stock = dict(ProductVariant.objects.filter(id__in=variant_ids).values_list('id', 'inventory_quantity'))
+        pipe = self.client.pipeline(transaction=False)
+        for variant_id in variant_ids:
+            key = STOCK_KEY.format(variant_id)
+            quantity = stock.get(uuid.UUID(str(variant_id)))
+            if quantity is None:
+                pipe.delete(key)
+            else:
+                pipe.set(key, quantity, ex=STOCK_TTL_SECONDS)
+        pipe.execute()
+        return len(variant_ids)
+
+    def _unreserved(self, variant_id, quantity):
+        variant = ProductVariant.objects.filter(id=variant_id).values('manage_inventory', 'allow_backorder').first()
+        if variant is not None and (not variant['manage_inventory'] or variant['allow_backorder']):
+            return Reservation(None, str(variant_id), 0, None)
+        raise InsufficientInventory(variant_id, quantity)
+
+    def _take_from_counter(self, variant_id, quantity):
+        key = STOCK_KEY.format(variant_id)
+        try:
+            taken = self.client.eval(_TAKE_IF_AVAILABLE, 1, key, quantity)
+            if taken is None:
+                stock = ProductVariant.objects.filter(id=variant_id).values_list('inventory_quantity', flat=True).first()
+                self.client.set(key, stock or 0, ex=STOCK_TTL_SECONDS, nx=True)
+                taken = self.client.eval(_TAKE_IF_AVAILABLE, 1, key, quantity)
+            return bool(taken)
+        except redis.RedisError as e:
+            # The counter is only a filter; without it the conditional UPDATE still decides
+            logger.error(f"Redis error on inventory counter for variant {variant_id}: {e}")
+            return True
+
+    def _record(self, reservation):
+        # Runs after commit, where an exception would be lost and the stock never come back
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.set(
+                RESERVATION_KEY.format(reservation.id),
+                json.dumps({'variant_id': reservation.variant_id, 'quantity': reservation.quantity}),
+                # Outlive the ledger score so the sweep always finds what to restock
+                ex=self.ttl * 2,
+            )
+            pipe.zadd(LEDGER_KEY, {reservation.id: reservation.expires_at})
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Redis error recording inventory reservation {reservation.id}, keeping it in the database: {e}")
+            self._record_in_database(reservation)
+
+    def _record_in_database(self, reservation):
+        InventoryReservation.objects.create(
+            id=reservation.id,
+            variant_id=reservation.variant_id,
+            quantity=reservation.quantity,
+            expires_at=datetime.fromtimestamp(reservation.expires_at, timezone.utc),
+        )
+
+    def _claim(self, reservation_id):
+        if reservation_id is None:
+            return None
+        # Whoever removes the ledger entry owns it, so confirm, release and the sweep never both act
+        if self.client is not None:
+            try:
+                entry = self._claim_from_redis(reservation_id)
+            except redis.RedisError as e:
+                # Still in the Redis ledger; the sweep restocks it once Redis is back
+                logger.error(f"Redis error claiming inventory reservation {reservation_id}: {e}")
+                return None
+            if entry is not None:
+                return entry
+        return self._claim_from_database(reservation_id)
+
+    def _claim_from_redis(self, reservation_id):
+        if not self.client.zrem(LEDGER_KEY, reservation_id):
+            return None
+        key = RESERVATION_KEY.format(reservation_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(key)
+        pipe.delete(key)
+        entry, _ = pipe.execute()
+        if entry is None:
+            logger.error(f"Inventory reservation {reservation_id} had no ledger entry; its stock was not restocked")
+            return None
+        return json.loads(entry)
+
+    def _claim_from_database(self, reservation_id):
+        entry = InventoryReservation.objects.filter(id=reservation_id).values('variant_id', 'quantity').first()
+        if entry is None or not InventoryReservation.objects.filter(id=reservation_id).delete()[0]:
+            return None
+        return {'variant_id': str(entry['variant_id']), 'quantity': entry['quantity']}
+
+    def _restock(self, variant_id, quantity):
+        ProductVariant.objects.filter(id=variant_id).update(inventory_quantity=F('inventory_quantity') + quantity)
+        if self.use_counter:
+            try:
+                self.client.eval(_INCR_IF_EXISTS, 1, STOCK_KEY.format(variant_id), quantity)
+            except redis.RedisError as e:
+                logger.error(f"Redis error restocking inventory counter for variant {variant_id}: {e}")
@@ -0,0 +1,233 @@
+# core/services/order_completion.py
+
+import logging
+import uuid
+from collections import defaultdict, namedtuple
+from django.db import transaction
+from django.db.models import F, Max, OuterRef, Q, Subquery
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    CartDiscount,
+    Discount,
+    LineItem,
+    Order,
+    OrderDiscount,
+    OrderGiftCard,
+    OrderStatusEnum,
+    Payment,
+    Sequence,
+    ShippingMethod,
+)
+from .cart_totals import CartTotalsCalculator
+from .gift_card_ledger import GiftCardDebit, GiftCardLedger
+from .inventory import InventoryService
+
+logger = logging.getLogger(__name__)
+
+DISPLAY_ID_SEQUENCE = 'order_display_id'
+
+OrderCompletionResult = namedtuple('OrderCompletionResult', ['orders', 'totals', 'rejected'])
+
+
+@transaction.atomic
+def allocate_display_ids(count):
+    """
+    Reserve count consecutive display ids from a counter row, seeded from the
+    highest id in the database on first use. The row stays locked until the
+    caller's transaction ends, so concurrent completions never hand out the
+    same id, and ids of a rolled-back batch are given out again.
+    """
+    counter = Sequence.objects.select_for_update().filter(name=DISPLAY_ID_SEQUENCE).first()
+    if counter is None:
+        seed = Order.objects.aggregate(highest=Max('display_id'))['highest'] or 0
+        counter, _ = Sequence.objects.select_for_update().get_or_create(name=DISPLAY_ID_SEQUENCE, defaults={'value': seed})
+    first = counter.value + 1
+    counter.value += count
+    counter.save(update_fields=['value'])
+    return range(first, counter.value + 1)
+
+
+class OrderCompletionService:
+    """
+    Turns carts into orders in batches. Every row is built in memory and
+    written with bulk_create, or with one UPDATE per table keyed by cart, in a
+    single transaction, so a batch costs a fixed couple of dozen statements
+    rather than a few per cart.
+
+    Carts are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent
+    workers given overlapping batches each complete a cart at most once. A
+    cart whose gift cards no longer cover their share, or whose discount has
+    run out of uses, is left open and reported in rejected; the rest of the
+    batch completes. Stock is taken at checkout through InventoryService;
+    the reservations passed for a cart are confirmed once its order is
+    committed, and those of rejected carts are left to be released or to
+    expire.
+    """
+
+    def __init__(self, ledger=None, inventory=None):
+        self.ledger = ledger or GiftCardLedger()
+        self.inventory = inventory or InventoryService()
+
+    @transaction.atomic
+    def complete(self, cart_ids, reservations=None):
+        """Complete cart_ids; reservations maps a cart id to the ids of its inventory reservations."""
+        now = timezone.now()
+        claimed = list(
+            Cart.objects.select_for_update(skip_locked=True)
+            .filter(id__in=cart_ids, completed_at__isnull=True, deleted_at__isnull=True)
+            .values_list('id', flat=True)
+        )
+        rejected = {}
+        claimed_keys = {str(cart_id) for cart_id in claimed}
+        for cart_id in cart_ids:
+            if str(cart_id) not in claimed_keys:
+                rejected[cart_id] = 'Cart is already completed or being completed'
+
+        carts = list(CartTotalsCalculator.prefetch(Cart.objects.filter(id__in=claimed)).select_related('customer'))
+        discounts = defaultdict(list)
+        for cart_id, discount_id in CartDiscount.objects.filter(
+            cart_id__in=claimed, deleted_at__isnull=True
+        ).values_list('cart_id', 'discount_id'):
+            discounts[cart_id].append(discount_id)
+
+        pending = {}
+        for cart in carts:
+            reason = self._validate(cart)
+            if reason:
+                rejected[cart.id] = reason
+                continue
+            totals = CartTotalsCalculator.calculate(cart, now)
+            order_id = uuid.uuid4()
+            debits = [GiftCardDebit(spend.gift_card_id, order_id, spend.amount) for spend in totals.gift_cards]
+            pending[cart.id] = (cart, totals, order_id, debits)
+
+        debits = self._claim_gift_cards(pending, rejected, now)
+        self._claim_discounts(pending, discounts, debits, rejected)
+        if not pending:
+            return OrderCompletionResult({}, {}, rejected)
+
+        # Taken last, as the counter row stays locked until this transaction commits
+        display_ids = allocate_display_ids(len(pending))
+        orders = Order.objects.bulk_create([
+            self._build_order(cart, order_id, display_id, now)
+            for (cart, _, order_id, _), display_id in zip(pending.values(), display_ids)
+        ])
+        completed = list(pending)
+
+        Cart.objects.filter(id__in=completed).update(completed_at=now, updated_at=now)
+        order_for_cart = Subquery(Order.objects.filter(cart_id=OuterRef('cart_id')).values('id')[:1])
+        LineItem.objects.filter(cart_id__in=completed, deleted_at__isnull=True).update(order_id=order_for_cart, updated_at=now)
+        ShippingMethod.objects.filter(cart_id__in=completed, deleted_at__isnull=True).update(order_id=order_for_cart, updated_at=now)
+        Payment.objects.filter(cart_id__in=completed, canceled_at__isnull=True).update(order_id=order_for_cart, updated_at=now)
+
+        OrderDiscount.objects.bulk_create([
+            OrderDiscount(order_id=order_id, discount_id=discount_id)
+            for cart_id, (_, _, order_id, _) in pending.items()
+            for discount_id in discounts[cart_id]
+        ])
+        applied = [debit for cart_id in completed for debit in debits[cart_id]]
+        OrderGiftCard.objects.bulk_create([
+            OrderGiftCard(order_id=debit.order_id, gift_card_id=debit.gift_card_id) for debit in applied
+        ])
+        self.ledger.record(applied)
+        if reservations:
+            confirmed = [
+                reservation_id for cart_id in completed for reservation_id in reservations.get(cart_id, ())
+                if reservation_id is not None
+            ]
+            transaction.on_commit(lambda: self._confirm_reservations(confirmed))
+
+        logger.info(f"Completed {len(orders)} orders, rejected {len(rejected)} carts")
+        return OrderCompletionResult(
+            {cart_id: order for cart_id, order in zip(completed, orders)},
+            {cart_id: pending[cart_id][1] for cart_id in completed},
+            rejected,
+        )
+
+    def _confirm_reservations(self, reservation_ids):
+        for reservation_id in reservation_ids:
+            if not self.inventory.confirm(reservation_id):
+                logger.warning(f"Inventory reservation {reservation_id} had already expired or been released")
+
+    def _validate(self, cart):
+        if not cart.active_items:
+            return 'Cart has no items'
+        if cart.customer_id is None:
+            return 'Cart has no customer'
+        if not (cart.email or cart.customer.email):
+            return 'Cart has no email'
+        return None
+
+    def _claim_gift_cards(self, pending, rejected, now):
+        debits = {cart_id: entry[3] for cart_id, entry in pending.items()}
+        all_debits = [debit for cart_debits in debits.values() for debit in cart_debits]
+        if not all_debits:
+            return debits
+        applied, failed = self.ledger.take(all_debits, now)
+        failed_orders = {debit.order_id for debit in failed}
+        restore = []
+        for cart_id in list(pending):
+            order_id = pending[cart_id][2]
+            if order_id in failed_orders:
+                restore.extend(debit for debit in debits.pop(cart_id) if debit not in failed)
+                del pending[cart_id]
+                rejected[cart_id] = 'Gift card balance changed, recalculate the cart'
+        self.ledger.restore(restore)
+        return debits
+
+    def _claim_discounts(self, pending, discounts, debits, rejected):
+        carts_by_discount = defaultdict(list)
+        for cart_id in pending:
+            for discount_id in discounts[cart_id]:
+                carts_by_discount[discount_id].append(cart_id)
+
+        counted, failed = defaultdict(list), set()
+        for discount_id, cart_ids in carts_by_discount.items():
+            # One UPDATE counts every use in the batch when the usage limit allows it
+            if self._count_uses(discount_id, len(cart_ids)):
+                counted[discount_id].extend(cart_ids)
+                continue
+            for cart_id in cart_ids:
+                if self._count_uses(discount_id, 1):
+                    counted[discount_id].append(cart_id)
+                else:
+                    failed.add(cart_id)
+
+        if not failed:
+            return
+        for discount_id, cart_ids in counted.items():
+            uncounted = sum(1 for cart_id in cart_ids if cart_id in failed)
+            if uncounted:
+                Discount.objects.filter(id=discount_id).update(usage_count=F('usage_count') - uncounted)
+        restore = []
+        for cart_id in failed:
+            restore.extend(debits.pop(cart_id, ()))
+            del pending[cart_id]
+            rejected[cart_id] = 'Discount usage limit reached'
+        self.ledger.restore(restore)
+
+    def _count_uses(self, discount_id, uses):
+        return Discount.objects.filter(
+            Q(usage_limit__isnull=True) | Q(usage_count__lte=F('usage_limit') - uses), id=discount_id,
+        ).update(usage_count=F('usage_count') + uses) == 1
+
+    def _build_order(self, cart, order_id, display_id, now):
+        return Order(
+            id=order_id,
+            status=OrderStatusEnum.PENDING,
+            fulfillment_status='unfulfilled',
+            payment_status='pending',
+            display_id=display_id,
+            cart_id=cart.id,
+            customer_id=cart.customer_id,
+            email=cart.email or cart.customer.email,
+            billing_address_id=cart.billing_address_id,
+            shipping_address_id=cart.shipping_address_id,
+            region_id=cart.region_id,
+            currency_code=cart.region.currency_code,
+            tax_rate=cart.region.tax_rate,
+            idempotency_key=cart.idempotency_key,
+            sales_channel_id=cart.sales_channel_id,
+            created_at=now,
+        )
@@ -0,0 +1,291 @@
+# core/services/price_resolver.py
+
+import logging
+import threading
+from collections import defaultdict, namedtuple
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.utils import timezone
+from core.models.models import (
+    MoneyAmount,
+    PriceList,
+    PriceListCustomerGroup,
+    PriceListStatusEnum,
+    ProductVariantMoneyAmount,
+    Region,
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_JOURNAL_SEQ_KEY = 'prices:journal:seq'
+PRICE_JOURNAL_ENTRY_KEY = 'prices:journal:{}'
+PRICE_JOURNAL_TTL = 24 * 60 * 60
+# Journal entry meaning "base prices or regions changed, rebuild everything"
+FULL_REBUILD = '*'
+# Past this many pending changes a full rebuild is cheaper than replaying them
+MAX_INCREMENTAL_CHANGES = 50
+
+PriceCandidate = namedtuple('PriceCandidate', ['amount', 'min_quantity', 'max_quantity', 'price_list_id'])
+PriceListRule = namedtuple('PriceListRule', ['status', 'starts_at', 'ends_at', 'customer_group_ids'])
+ResolvedPrice = namedtuple('ResolvedPrice', ['currency_code', 'original_amount', 'calculated_amount', 'price_list_id'])
+# Everything resolve() reads, replaced as a whole so readers never see a half-applied change
+PriceState = namedtuple('PriceState', ['seq', 'indexes', 'price_lists', 'region_currencies'])
+
+
+def _price_rows(query):
+    return ProductVariantMoneyAmount.objects.filter(
+        query, deleted_at__isnull=True, money_amount__deleted_at__isnull=True
+    ).values_list(
+        'variant_id', 'money_amount__amount', 'money_amount__min_quantity',
+        'money_amount__max_quantity', 'money_amount__price_list_id', 'money_amount__region_id',
+    )
+
+
+def _fits(candidate, quantity):
+    if candidate.min_quantity is not None and quantity < candidate.min_quantity:
+        return False
+    return candidate.max_quantity is None or quantity <= candidate.max_quantity
+
+
+class RegionPriceIndex:
+    """
+    Every variant price that can apply in one (region, currency): base prices
+    split into region-specific and currency-wide, and price-list prices
+    grouped by list so a changed list can be swapped out on its own.
+    An index is not modified once published; changes build a new one.
+    """
+
+    def __init__(self, region_id, currency_code):
+        self.region_id = region_id
+        self.currency_code = currency_code
+        self.region_base = defaultdict(list)
+        self.currency_base = defaultdict(list)
+        self.lists = defaultdict(lambda: defaultdict(list))
+
+    @property
+    def scope(self):
+        return Q(money_amount__currency_code=self.currency_code) & (
+            Q(money_amount__region_id=self.region_id) | Q(money_amount__region__isnull=True)
+        )
+
+    def load(self, price_list_ids=None):
+        query = self.scope
+        if price_list_ids is not None:
+            query &= Q(money_amount__price_list_id__in=price_list_ids)
+        count = 0
+        for variant_id, amount, min_quantity, max_quantity, price_list_id, region_id in _price_rows(query):
+            if price_list_id is not None:
+                # Price list ids are kept as strings to match the journal entries
+                price_list_id = str(price_list_id)
+            candidate = PriceCandidate(amount, min_quantity, max_quantity, price_list_id)
+            if price_list_id is not None:
+                self.lists[price_list_id][variant_id].append(candidate)
+            elif region_id is not None:
+                self.region_base[variant_id].append(candidate)
+            else:
+                self.currency_base[variant_id].append(candidate)
+            count += 1
+        return count
+
+    def with_lists_reloaded(self, price_list_ids):
+        """A new index with price_list_ids read afresh; base prices and the other lists are shared."""
+        index = RegionPriceIndex(self.region_id, self.currency_code)
+        index.region_base = self.region_base
+        index.currency_base = self.currency_base
+        index.lists.update((k, v) for k, v in self.lists.items() if k not in price_list_ids)
+        index.load(price_list_ids)
+        return index
+
+    def resolve(self, variant_id, quantity, active_list_ids):
+        # Region-specific base prices win over currency-wide ones, as the original price
+        base = [c.amount for c in self.region_base.get(variant_id, ()) if _fits(c, quantity)]
+        if not base:
+            base = [c.amount for c in self.currency_base.get(variant_id, ()) if _fits(c, quantity)]
+        original = min(base) if base else None
+
+        calculated, source = original, None
+        for price_list_id in active_list_ids:
+            prices = self.lists.get(price_list_id)
+            if not prices:
+                continue
+            for candidate in prices.get(variant_id, ()):
+                if _fits(candidate, quantity) and (calculated is None or candidate.amount < calculated):
+                    calculated, source = candidate.amount, price_list_id
+        if calculated is None:
+            return None
+        return ResolvedPrice(self.currency_code, original, calculated, source)
+
+
+class PriceResolver:
+    """
+    Batch price resolution over per-region in-memory indexes. Each process
+    keeps its indexes in step through a short change journal in the shared
+    cache: a changed price list is reloaded on its own, and only base-price
+    or region changes rebuild from scratch. A change builds new indexes
+    beside the old ones and swaps them in with one assignment, so requests
+    in flight keep reading a consistent snapshot.
+    """
+
+    _lock = threading.Lock()
+    _state = PriceState(None, {}, {}, {})
+
+    @classmethod
+    def record_change(cls, price_list_id=None):
+        cache.add(PRICE_JOURNAL_SEQ_KEY, 0, timeout=None)
+        try:
+            seq = cache.incr(PRICE_JOURNAL_SEQ_KEY)
+        except ValueError:
+            cache.set(PRICE_JOURNAL_SEQ_KEY, 1, timeout=None)
+            seq = 1
+        entry = FULL_REBUILD if price_list_id is None else str(price_list_id)
+        cache.set(PRICE_JOURNAL_ENTRY_KEY.format(seq), entry, timeout=PRICE_JOURNAL_TTL)
+
+    @classmethod
+    def _reset(cls, seq):
+        cls._state = PriceState(
+            seq,
+            {},
+            cls._load_price_lists(),
+            dict(Region.objects.filter(deleted_at__isnull=True).values_list('id', 'currency_code')),
+        )
+
+    @classmethod
+    def _load_price_lists(cls, price_list_ids=None):
+        lists = PriceList.objects.filter(deleted_at__isnull=True)
+        groups = PriceListCustomerGroup.objects.all()
+        if price_list_ids is not None:
+            lists = lists.filter(id__in=price_list_ids)
+            groups = groups.filter(price_list_id__in=price_list_ids)
+        group_ids = defaultdict(set)
+        for price_list_id, group_id in groups.values_list('price_list_id', 'customer_group_id'):
+            group_ids[price_list_id].add(group_id)
+        return {
+            str(price_list_id): PriceListRule(status, starts_at, ends_at, frozenset(group_ids[price_list_id]))
+            for price_list_id, status, starts_at, ends_at in lists.values_list('id', 'status', 'starts_at', 'ends_at')
+        }
+
+    @classmethod
+    def _sync(cls):
+        seq = cache.get(PRICE_JOURNAL_SEQ_KEY, 0)
+        if seq == cls._state.seq:
+            return cls._state
+        with cls._lock:
+            state = cls._state
+            applied = state.seq
+            if seq == applied:
+                return state
+            if applied is None or seq < applied or seq - applied > MAX_INCREMENTAL_CHANGES:
+                cls._reset(seq)
+                return cls._state
+            entries = cache.get_many([PRICE_JOURNAL_ENTRY_KEY.format(n) for n in range(applied + 1, seq + 1)])
+            changed = set(entries.values())
+            # A missing entry is either expired or not written yet; rebuilding is the safe answer to both
+            if len(entries) < seq - applied or FULL_REBUILD in changed:
+                cls._reset(seq)
+                return cls._state
+
+            price_lists = {k: v for k, v in state.price_lists.items() if k not in changed}
+            price_lists.update(cls._load_price_lists(list(changed)))
+            indexes = {key: index.with_lists_reloaded(list(changed)) for key, index in state.indexes.items()}
+            cls._state = PriceState(seq, indexes, price_lists, state.region_currencies)
+            logger.debug(f"Applied {len(changed)} price list change(s) to {len(indexes)} price indexes")
+            return cls._state
+
+    @classmethod
+    def _index(cls, state, region_id, currency_code):
+        key = (region_id, currency_code)
+        index = state.indexes.get(key)
+        if index is None:
+            with cls._lock:
+                index = state.indexes.get(key)
+                if index is None:
+                    index = RegionPriceIndex(region_id, currency_code)
+                    count = index.load()
+                    state.indexes[key] = index
+                    logger.info(f"Built price index for region {region_id} / {currency_code} with {count} prices")
+        return index
+
+    @classmethod
+    def active_price_lists(cls, customer_group_ids=(), now=None, state=None):
+        now = now or timezone.now()
+        customer_group_ids = frozenset(customer_group_ids)
+        state = state or cls._state
+        return [
+            price_list_id
+            for price_list_id, rule in state.price_lists.items()
+            if rule.status == PriceListStatusEnum.ACTIVE
+            and (rule.starts_at is None or rule.starts_at <= now)
+            and (rule.ends_at is None or rule.ends_at > now)
+            and (not rule.customer_group_ids or rule.customer_group_ids & customer_group_ids)
+        ]
+
+    @classmethod
+    def resolve(cls, variant_ids, region_id, currency_code=None, customer_group_ids=(), quantity=1, now=None):
+        """
+        Price many variants for one (region, currency, customer groups,
+        quantity). Returns {variant_id: ResolvedPrice}; variants with no
+        applicable price are left out. currency_code defaults to the region's.
+        """
+        state = cls._sync()
+        currency_code = currency_code or state.region_currencies.get(region_id)
+        if currency_code is None:
+            raise ValueError(f"Unknown region: {region_id}")
+        index = cls._index(state, region_id, currency_code)
+        active = cls.active_price_lists(customer_group_ids, now, state)
+        prices = {}
+        for variant_id in variant_ids:
+            price = index.resolve(variant_id, quantity, active)
+            if price is not None:
+                prices[variant_id] = price
+        return prices
+
+    @classmethod
+    def resolve_many(cls, requests):
+        """Resolve a batch of requests, each a dict of resolve()'s keyword arguments."""
+        return [cls.resolve(**request) for request in requests]
+
+
+def _on_commit_change(price_list_id=None):
+    transaction.on_commit(lambda: PriceResolver.record_change(price_list_id))
+
+
+def _money_amount_moving(sender, instance, raw=False, **kwargs):
+    # A price moved off a list (or off the base prices) has to leave the old place too
+    if raw or instance._state.adding:
+        return
+    old = MoneyAmount.objects.filter(pk=instance.pk).values_list('price_list_id', flat=True)
+    for price_list_id in old:
+        if price_list_id != instance.price_list_id:
+            _on_commit_change(price_list_id)
+
+
+def _money_amount_changed(sender, instance, **kwargs):
+    _on_commit_change(instance.price_list_id)
+
+
+def _variant_money_amount_changed(sender, instance, **kwargs):
+    price_list_id = MoneyAmount.objects.filter(pk=instance.money_amount_id).values_list('price_list_id', flat=True).first()
+    _on_commit_change(price_list_id)
+
+
+def _price_list_changed(sender, instance, **kwargs):
+    _on_commit_change(instance.pk)
+
+
+def _price_list_group_changed(sender, instance, **kwargs):
+    _on_commit_change(instance.price_list_id)
+
+
+def _region_changed(sender, instance, **kwargs):
+    _on_commit_change()
+
+
+pre_save.connect(_money_amount_moving, sender=MoneyAmount, dispatch_uid='price_resolver_money_amount_moving')
+for _signal in (post_save, post_delete):
+    _signal.connect(_money_amount_changed, sender=MoneyAmount, dispatch_uid=f'price_resolver_money_amount_{_signal is post_save}')
+    _signal.connect(_variant_money_amount_changed, sender=ProductVariantMoneyAmount, dispatch_uid=f'price_resolver_variant_money_amount_{_signal is post_save}')
+    _signal.connect(_price_list_changed, sender=PriceList, dispatch_uid=f'price_resolver_price_list_{_signal is post_save}')
+    _signal.connect(_price_list_group_changed, sender=PriceListCustomerGroup, dispatch_uid=f'price_resolver_price_list_group_{_signal is post_save}')
+    _signal.connect(_region_changed, sender=Region, dispatch_uid=f'price_resolver_region_{_signal is post_save}')
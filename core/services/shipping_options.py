@@ -0,0 +1,147 @@
+# core/services/shipping_options.py
+
+import bisect
+import logging
+from collections import defaultdict, namedtuple
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.signals import post_save, post_delete
+from core.models.models import (
+    FulfillmentProvider,
+    LineItem,
+    ProductShippingProfile,
+    RegionFulfillmentProvider,
+    ShippingOption,
+    ShippingOptionRequirement,
+)
+from .snapshot_cache import VersionedSnapshot
+
+logger = logging.getLogger(__name__)
+
+MIN_SUBTOTAL = 'MIN'
+MAX_SUBTOTAL = 'MAX'
+
+EligibleOption = namedtuple('EligibleOption', ['id', 'name', 'profile_id', 'provider_id', 'price_type', 'amount', 'is_return', 'admin_only'])
+ShippingQuoteRequest = namedtuple('ShippingQuoteRequest', ['region_id', 'subtotal', 'profile_ids'])
+
+
+class ProfileOptions:
+    """
+    One region's options for one shipping profile, sorted by minimum
+    subtotal, so the options a subtotal clears are a bisect away and only
+    their maximums are left to check.
+    """
+
+    __slots__ = ('minimums', 'entries')
+
+    def __init__(self, entries):
+        entries = sorted(entries, key=lambda entry: entry[0])
+        self.minimums = [minimum for minimum, _, _ in entries]
+        self.entries = [(maximum, option) for _, maximum, option in entries]
+
+    def eligible(self, subtotal):
+        cleared = bisect.bisect_right(self.minimums, subtotal)
+        return [option for maximum, option in self.entries[:cleared] if maximum is None or subtotal <= maximum]
+
+
+def build_shipping_snapshot():
+    """Every region's shipping options grouped by profile, in three queries."""
+    enabled_providers = defaultdict(set)
+    for region_id, provider_id in RegionFulfillmentProvider.objects.filter(
+        deleted_at__isnull=True, provider__is_installed=True
+    ).values_list('region_id', 'provider_id'):
+        enabled_providers[region_id].add(provider_id)
+
+    minimums, maximums = defaultdict(int), {}
+    for option_id, kind, amount in ShippingOptionRequirement.objects.filter(
+        deleted_at__isnull=True
+    ).values_list('shipping_option_id', 'type', 'amount'):
+        # Several requirements of one kind narrow the range rather than widen it
+        if kind == MIN_SUBTOTAL:
+            minimums[option_id] = max(minimums[option_id], amount)
+        elif kind == MAX_SUBTOTAL:
+            maximums[option_id] = min(maximums.get(option_id, amount), amount)
+
+    grouped = defaultdict(lambda: defaultdict(list))
+    count = 0
+    for row in ShippingOption.objects.filter(deleted_at__isnull=True).values_list(
+        'id', 'name', 'profile_id', 'provider_id', 'price_type', 'amount', 'is_return', 'admin_only', 'region_id',
+    ):
+        option, region_id = EligibleOption(*row[:-1]), row[-1]
+        # Options whose fulfillment provider is not enabled in the region can never be fulfilled there
+        if option.provider_id not in enabled_providers[region_id]:
+            continue
+        grouped[region_id][option.profile_id].append((minimums[option.id], maximums.get(option.id), option))
+        count += 1
+
+    tables = {
+        region_id: {profile_id: ProfileOptions(entries) for profile_id, entries in profiles.items()}
+        for region_id, profiles in grouped.items()
+    }
+    logger.info(f"Built shipping option tables for {len(tables)} regions with {count} options")
+    return tables
+
+
+class ShippingOptionEngine:
+    """
+    Which shipping options a cart may use, from per-region tables held in
+    memory: a binary search on the cart subtotal per shipping profile in the
+    cart. Quoting needs no queries once the tables are built.
+    """
+
+    snapshot = VersionedSnapshot('shipping_options', build_shipping_snapshot)
+
+    @classmethod
+    def invalidate(cls):
+        cls.snapshot.invalidate()
+
+    @classmethod
+    def eligible(cls, region_id, subtotal, profile_ids, is_return=False, include_admin=False, tables=None):
+        tables = cls.snapshot.get() if tables is None else tables
+        profiles = tables.get(region_id, {})
+        options = []
+        for profile_id in profile_ids:
+            profile_options = profiles.get(profile_id)
+            if profile_options is None:
+                continue
+            options.extend(
+                option for option in profile_options.eligible(subtotal)
+                if option.is_return == is_return and (include_admin or not option.admin_only)
+            )
+        return options
+
+    @classmethod
+    def quote_many(cls, requests, is_return=False, include_admin=False):
+        """Eligible options for many ShippingQuoteRequests against one snapshot, in request order."""
+        tables = cls.snapshot.get()
+        return [
+            cls.eligible(request.region_id, request.subtotal, request.profile_ids, is_return, include_admin, tables)
+            for request in requests
+        ]
+
+
+def load_quote_requests(carts):
+    """ShippingQuoteRequests for a batch of Cart instances in two queries: subtotals and shipping profiles."""
+    cart_ids = [cart.id for cart in carts]
+    items = LineItem.objects.filter(cart_id__in=cart_ids, deleted_at__isnull=True)
+    subtotals = dict(
+        items.values('cart_id').annotate(subtotal=Sum(F('unit_price') * F('quantity'))).values_list('cart_id', 'subtotal')
+    )
+    profiles = defaultdict(set)
+    for cart_id, profile_id in ProductShippingProfile.objects.filter(
+        product__productvariant__lineitem__in=items
+    ).values_list('product__productvariant__lineitem__cart_id', 'profile_id').distinct():
+        profiles[cart_id].add(profile_id)
+    return [
+        ShippingQuoteRequest(cart.region_id, subtotals.get(cart.id) or 0, frozenset(profiles[cart.id]))
+        for cart in carts
+    ]
+
+
+def _invalidate_shipping_options(sender, **kwargs):
+    transaction.on_commit(ShippingOptionEngine.invalidate)
+
+
+for _model in (ShippingOption, ShippingOptionRequirement, RegionFulfillmentProvider, FulfillmentProvider):
+    post_save.connect(_invalidate_shipping_options, sender=_model, dispatch_uid=f'shipping_options_{_model.__name__}')
+    post_delete.connect(_invalidate_shipping_options, sender=_model, dispatch_uid=f'shipping_options_delete_{_model.__name__}')
@@ -0,0 +1,58 @@
+# core/services/snapshot_cache.py
+
+import logging
+import threading
+import time
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def _fresh_version():
+    # A counter that went missing restarts from the clock, never from a version some worker still holds
+    return time.time_ns()
+
+
+class VersionedSnapshot:
+    """
+    Per-process copy of an expensive, read-mostly structure, stamped with a
+    version counter kept in the shared cache. invalidate() bumps the counter,
+    so every worker rebuilds on its next get() instead of serving stale data;
+    between changes a get() costs one cache read.
+    """
+
+    def __init__(self, name, builder):
+        self.version_key = f"snapshot:{name}:version"
+        self.name = name
+        self.builder = builder
+        self._lock = threading.Lock()
+        # (version, snapshot), swapped as one reference so readers never pair mismatched halves
+        self._current = None
+
+    def current_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            fresh = _fresh_version()
+            cache.add(self.version_key, fresh, timeout=None)
+            version = cache.get(self.version_key, fresh)
+        return version
+
+    def invalidate(self):
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, _fresh_version(), timeout=None)
+        self._current = None
+
+    def get(self):
+        version = self.current_version()
+        current = self._current
+        if current is not None and current[0] == version:
+            return current[1]
+        with self._lock:
+            current = self._current
+            if current is None or current[0] != version:
+                current = (version, self.builder())
+                self._current = current
+                logger.debug(f"Rebuilt {self.name} snapshot at version {version}")
+            return current[1]
@@ -0,0 +1,123 @@
+# core/services/tax_rates.py
+
+import logging
+from collections import defaultdict, namedtuple
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from core.models.models import (
+    ProductTaxRate,
+    ProductTypeTaxRate,
+    Region,
+    ShippingTaxRate,
+    TaxRate,
+)
+from .snapshot_cache import VersionedSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_NAME = 'default'
+
+TaxLineRate = namedtuple('TaxLineRate', ['rate', 'name', 'code'])
+
+
+class RegionTaxTable:
+    """
+    One region's rates, keyed the way they are looked up: product overrides
+    first, then product-type overrides, then the region default. Shipping
+    options have their own overrides over the same default.
+    """
+
+    __slots__ = ('default', 'products', 'product_types', 'shipping_options')
+
+    def __init__(self, default):
+        self.default = (default,)
+        self.products = defaultdict(list)
+        self.product_types = defaultdict(list)
+        self.shipping_options = defaultdict(list)
+
+    def freeze(self):
+        for attr in ('products', 'product_types', 'shipping_options'):
+            setattr(self, attr, {key: tuple(rates) for key, rates in getattr(self, attr).items()})
+
+    def for_item(self, product_id, product_type_id):
+        return (
+            self.products.get(product_id)
+            or self.product_types.get(product_type_id)
+            or self.default
+        )
+
+    def for_shipping_option(self, shipping_option_id):
+        return self.shipping_options.get(shipping_option_id) or self.default
+
+
+def build_tax_snapshot():
+    """Every region's tax table in five queries."""
+    tables = {
+        region_id: RegionTaxTable(TaxLineRate(rate, DEFAULT_RATE_NAME, code))
+        for region_id, rate, code in Region.objects.filter(deleted_at__isnull=True).values_list('id', 'tax_rate', 'tax_code')
+    }
+    rates = {
+        rate_id: (region_id, TaxLineRate(0.0 if rate is None else rate, name, code))
+        for rate_id, region_id, rate, name, code in TaxRate.objects.filter(
+            deleted_at__isnull=True, region_id__in=list(tables)
+        ).values_list('id', 'region_id', 'rate', 'name', 'code')
+    }
+    overrides = (
+        (ProductTaxRate, 'product_id', 'tax_rate_id', 'products'),
+        (ProductTypeTaxRate, 'product_type_id', 'tax_rate_id', 'product_types'),
+        (ShippingTaxRate, 'shipping_option_id', 'rate_id', 'shipping_options'),
+    )
+    for model, target_column, rate_column, table_attr in overrides:
+        rows = model.objects.filter(deleted_at__isnull=True, **{f'{rate_column}__in': list(rates)})
+        for target_id, rate_id in rows.values_list(target_column, rate_column):
+            region_id, rate = rates[rate_id]
+            getattr(tables[region_id], table_attr)[target_id].append(rate)
+    for table in tables.values():
+        table.freeze()
+    logger.info(f"Built tax tables for {len(tables)} regions from {len(rates)} tax rates")
+    return tables
+
+
+class TaxRateResolver:
+    """
+    Tax rates for whole carts from in-memory per-region tables. Once the
+    snapshot is built, resolving a cart is O(items) dictionary lookups with
+    no queries; saves to any of the rate tables rebuild it on next use.
+    """
+
+    snapshot = VersionedSnapshot('tax_rates', build_tax_snapshot)
+
+    @classmethod
+    def invalidate(cls):
+        cls.snapshot.invalidate()
+
+    @classmethod
+    def table(cls, region_id):
+        table = cls.snapshot.get().get(region_id)
+        if table is None:
+            raise ValueError(f"Unknown region: {region_id}")
+        return table
+
+    @classmethod
+    def rates_for(cls, region_id, items):
+        """
+        {item.id: (TaxLineRate, ...)} for a cart's items. Items need id,
+        product_id and product_type_id, e.g. the DiscountItems from
+        discount_engine.load_cart_contexts.
+        """
+        table = cls.table(region_id)
+        return {item.id: table.for_item(item.product_id, item.product_type_id) for item in items}
+
+    @classmethod
+    def shipping_rates_for(cls, region_id, shipping_option_ids):
+        table = cls.table(region_id)
+        return {option_id: table.for_shipping_option(option_id) for option_id in shipping_option_ids}
+
+
+def _invalidate_tax_rates(sender, **kwargs):
+    transaction.on_commit(TaxRateResolver.invalidate)
+
+
+for _model in (Region, TaxRate, ProductTaxRate, ProductTypeTaxRate, ShippingTaxRate):
+    post_save.connect(_invalidate_tax_rates, sender=_model, dispatch_uid=f'tax_rates_{_model.__name__}')
+    post_delete.connect(_invalidate_tax_rates, sender=_model, dispatch_uid=f'tax_rates_delete_{_model.__name__}')
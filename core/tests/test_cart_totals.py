@@ -0,0 +1,95 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    CartGiftCard,
+    FulfillmentProvider,
+    GiftCard,
+    LineItem,
+    LineItemAdjustment,
+    LineItemTaxLine,
+    Region,
+    ShippingMethod,
+    ShippingMethodTaxLine,
+    ShippingOption,
+    ShippingProfile,
+)
+from core.services.cart_totals import CartTotalsCalculator, GiftCardSpend, ItemTotals
+
+
+class CartTotalsTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20, gift_cards_taxable=True)
+        self.other_region = Region.objects.create(name='US', currency_code='usd', tax_rate=0)
+        self.cart = Cart.objects.create(region=self.region, type='type1')
+
+        # 2 x 1000 with 200 off, taxed at 20%; 1 x 500 untaxed; 500 shipping taxed at 20%
+        self.shirt = LineItem.objects.create(cart=self.cart, title='Shirt', unit_price=1000, quantity=2)
+        LineItemAdjustment.objects.create(item=self.shirt, description='Sale', amount=200)
+        LineItemAdjustment.objects.create(item=self.shirt, description='Gone', amount=999, deleted_at=self.now)
+        LineItemTaxLine.objects.create(item=self.shirt, name='VAT', rate=20)
+        self.mug = LineItem.objects.create(cart=self.cart, title='Mug', unit_price=500, quantity=1)
+
+        option = ShippingOption.objects.create(
+            id='standard', name='Standard', region=self.region,
+            profile=ShippingProfile.objects.create(id='default', name='Default', type='STANDARD'),
+            provider=FulfillmentProvider.objects.create(is_installed=True),
+            price_type='FIXED', amount=500, is_return=False, data={}, admin_only=False,
+        )
+        method = ShippingMethod.objects.create(id='sm_1', shipping_option=option, cart=self.cart, price=500, data={})
+        ShippingMethodTaxLine.objects.create(id='smtl_1', shipping_method=method, name='VAT', rate=20)
+
+    def add_gift_card(self, code, balance, minutes, region=None, **fields):
+        card = GiftCard.objects.create(code=code, value=balance, balance=balance, region=region or self.region, **fields)
+        CartGiftCard.objects.create(cart=self.cart, gift_card=card, created_at=self.now + timedelta(minutes=minutes))
+        return card
+
+    def test_totals_without_gift_cards(self):
+        totals = CartTotalsCalculator.calculate_for(self.cart.id)
+        self.assertEqual(totals.items, {
+            self.shirt.id: ItemTotals(2000, 200, 360, 2160),
+            self.mug.id: ItemTotals(500, 0, 0, 500),
+        })
+        self.assertEqual(
+            (totals.subtotal, totals.discount_total, totals.shipping_total, totals.item_tax_total, totals.shipping_tax_total),
+            (2500, 200, 500, 360, 100),
+        )
+        self.assertEqual((totals.tax_total, totals.total), (460, 3260))
+        self.assertEqual(totals.gift_cards, [])
+
+    def test_gift_cards_are_spent_in_order_and_take_their_tax(self):
+        self.add_gift_card('FOREIGN', 1000, 1, region=self.other_region)
+        ten_percent = self.add_gift_card('TEN', 1000, 2, tax_rate=10)
+        self.add_gift_card('EXPIRED', 1000, 3, ends_at=self.now - timedelta(days=1))
+        self.add_gift_card('OFF', 1000, 4, is_disabled=True)
+        big = self.add_gift_card('BIG', 5000, 5)
+        self.add_gift_card('SPARE', 5000, 6)
+
+        totals = CartTotalsCalculator.calculate_for(self.cart.id)
+        # 2800 due before tax: 1000 at the card's 10%, then 1800 at the region's 20%
+        self.assertEqual(totals.gift_cards, [GiftCardSpend(ten_percent.id, 1000), GiftCardSpend(big.id, 1800)])
+        self.assertEqual((totals.gift_card_total, totals.gift_card_tax_total), (2800, 460))
+        self.assertEqual((totals.tax_total, totals.total), (0, 0))
+
+    def test_gift_cards_in_untaxed_regions_leave_tax_alone(self):
+        Region.objects.filter(id=self.region.id).update(gift_cards_taxable=False)
+        self.add_gift_card('SMALL', 1000, 1)
+
+        totals = CartTotalsCalculator.calculate_for(self.cart.id)
+        self.assertEqual((totals.gift_card_total, totals.gift_card_tax_total), (1000, 0))
+        self.assertEqual((totals.tax_total, totals.total), (460, 2260))
+
+    def test_many_carts_take_a_fixed_number_of_queries(self):
+        carts = [self.cart]
+        for _ in range(3):
+            cart = Cart.objects.create(region=self.region, type='type1')
+            item = LineItem.objects.create(cart=cart, title='Shirt', unit_price=100, quantity=1)
+            LineItemTaxLine.objects.create(item=item, name='VAT', rate=20)
+            carts.append(cart)
+
+        with self.assertNumQueries(7):
+            totals = CartTotalsCalculator.calculate_many([cart.id for cart in carts])
+        self.assertEqual(len(totals), 4)
+        self.assertEqual(totals[carts[-1].id].total, 120)
@@ -0,0 +1,148 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    Customer,
+    CustomerGroup,
+    CustomerGroupCustomers,
+    Discount,
+    DiscountCondition,
+    DiscountConditionCustomerGroup,
+    DiscountConditionProduct,
+    DiscountRegions,
+    DiscountRule,
+    LineItem,
+    Product,
+    ProductVariant,
+    Region,
+)
+from core.services.discount_engine import DiscountEngine, load_cart_contexts
+from core.services.snapshot_cache import VersionedSnapshot
+
+
+class DiscountEngineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20)
+        self.other_region = Region.objects.create(name='US', currency_code='usd', tax_rate=0)
+        self.shirt = Product.objects.create(title='Shirt', status='published')
+        self.mug = Product.objects.create(title='Mug', status='published')
+        self.customer = Customer.objects.create(email='reader@example.com')
+        self.cart = Cart.objects.create(region=self.region, customer=self.customer, type='type1')
+        self.shirt_line = self.add_line(self.shirt, 2000, 2)
+        self.mug_line = self.add_line(self.mug, 1000, 1)
+
+    def add_line(self, product, unit_price, quantity, cart=None):
+        variant = ProductVariant.objects.create(product=product, title=product.title)
+        return LineItem.objects.create(
+            cart=cart or self.cart, title=product.title, variant=variant, unit_price=unit_price, quantity=quantity,
+        )
+
+    def discount(self, code, type='percentage', value=10, allocation=None, **fields):
+        rule = DiscountRule.objects.create(type=type, value=value, allocation=allocation)
+        fields.setdefault('starts_at', self.now - timedelta(days=1))
+        return Discount.objects.create(code=code, rule=rule, **fields)
+
+    def evaluate(self, codes=None, cart=None):
+        [context] = load_cart_contexts([cart or self.cart])
+        return {result.code: result for result in DiscountEngine.evaluate(context, codes, self.now)}
+
+    def test_percentage_discount_applies_to_every_line(self):
+        self.discount('TEN')
+        result = self.evaluate(['ten'])['TEN']
+        self.assertEqual(result.item_amounts, {self.shirt_line.id: 400, self.mug_line.id: 100})
+        self.assertEqual(result.total, 500)
+
+    def test_fixed_total_discount_is_split_by_line_total(self):
+        self.discount('FIVE', type='fixed', value=1001, allocation='total')
+        result = self.evaluate(['FIVE'])['FIVE']
+        self.assertEqual(result.total, 1001)
+        self.assertEqual(result.item_amounts, {self.shirt_line.id: 800, self.mug_line.id: 201})
+
+    def test_fixed_each_discount_is_capped_at_the_line_total(self):
+        self.discount('EACH', type='fixed', value=1500, allocation='each')
+        result = self.evaluate(['EACH'])['EACH']
+        self.assertEqual(result.item_amounts, {self.shirt_line.id: 3000, self.mug_line.id: 1000})
+
+    def test_product_conditions_include_and_exclude(self):
+        only_shirts = self.discount('SHIRTS')
+        condition = DiscountCondition.objects.create(type='type_a', operator='equal', discount_rule=only_shirts.rule)
+        DiscountConditionProduct.objects.create(condition=condition, product=self.shirt)
+        not_shirts = self.discount('NOSHIRTS')
+        condition = DiscountCondition.objects.create(type='type_a', operator='not_equal', discount_rule=not_shirts.rule)
+        DiscountConditionProduct.objects.create(condition=condition, product=self.shirt)
+
+        results = self.evaluate(['SHIRTS', 'NOSHIRTS'])
+        self.assertEqual(list(results['SHIRTS'].item_amounts), [self.shirt_line.id])
+        self.assertEqual(list(results['NOSHIRTS'].item_amounts), [self.mug_line.id])
+
+    def test_region_and_customer_group_conditions(self):
+        DiscountRegions.objects.create(discount=self.discount('EU'), region=self.region)
+        DiscountRegions.objects.create(discount=self.discount('US'), region=self.other_region)
+        members = self.discount('MEMBERS')
+        group = CustomerGroup.objects.create(name='Members')
+        condition = DiscountCondition.objects.create(type='type_b', operator='equal', discount_rule=members.rule)
+        DiscountConditionCustomerGroup.objects.create(condition=condition, customer_group=group)
+
+        self.assertEqual(set(self.evaluate()), {'EU'})
+        CustomerGroupCustomers.objects.create(customer_group=group, customer=self.customer)
+        self.assertEqual(set(self.evaluate()), {'EU', 'MEMBERS'})
+
+    def test_inactive_and_used_up_discounts_are_skipped(self):
+        self.discount('LATER', starts_at=self.now + timedelta(days=1))
+        self.discount('OVER', ends_at=self.now - timedelta(hours=1))
+        self.discount('USED', usage_limit=5, usage_count=5)
+        self.discount('OFF', is_disabled=True)
+        self.discount('OPEN', usage_limit=5, usage_count=4)
+        self.assertEqual(set(self.evaluate()), {'OPEN'})
+
+    def test_lines_that_do_not_allow_discounts_are_skipped(self):
+        LineItem.objects.filter(id=self.mug_line.id).update(allow_discounts=False)
+        self.discount('TEN')
+        self.assertEqual(list(self.evaluate(['TEN'])['TEN'].item_amounts), [self.shirt_line.id])
+
+    def test_changes_are_picked_up_after_commit(self):
+        self.discount('TEN')
+        self.assertIn('TEN', self.evaluate())
+        with self.captureOnCommitCallbacks(execute=True):
+            Discount.objects.filter(code='TEN').update(is_disabled=True)
+            Discount.objects.get(code='TEN').save()
+        self.assertNotIn('TEN', self.evaluate())
+
+    def test_evaluate_many_keeps_cart_order(self):
+        self.discount('TEN')
+        empty = Cart.objects.create(region=self.region, type='type1')
+        contexts = load_cart_contexts([empty, self.cart])
+        results = DiscountEngine.evaluate_many(contexts)
+        self.assertEqual([[r.code for r in cart_results] for cart_results in results], [[], ['TEN']])
+
+
+class VersionedSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.builds = 0
+
+        def build():
+            self.builds += 1
+            return self.builds
+
+        self.snapshot = VersionedSnapshot('test', build)
+
+    def test_snapshot_is_built_once_per_version(self):
+        self.assertEqual(self.snapshot.get(), 1)
+        self.assertEqual(self.snapshot.get(), 1)
+        self.snapshot.invalidate()
+        self.assertEqual(self.snapshot.get(), 2)
+
+    def test_lost_counter_never_comes_back_as_a_version_already_served(self):
+        self.snapshot.get()
+        held = self.snapshot.current_version()
+        other_worker = VersionedSnapshot('test', lambda: 'rebuilt')
+        other_worker.get()
+        cache.clear()
+        other_worker.invalidate()
+        self.assertNotEqual(self.snapshot.current_version(), held)
+        self.assertEqual(self.snapshot.get(), 2)
@@ -0,0 +1,73 @@
+from django.test import TestCase
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+from core.common.fast_serializer import FastListMixin, FastReadSerializer, get_fast_serializer
+from core.models.models import Product, ProductTag, ProductTags, ProductType, Region
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = ['id', 'title', 'status', 'type', 'amazon_price', 'created_at']
+
+
+class RegionSerializer(serializers.ModelSerializer):
+    tax_code = serializers.ModelField(model_field=Region._meta.get_field('tax_code'))
+
+    class Meta:
+        model = Region
+        fields = ['id', 'name', 'tax_code']
+
+
+class ProductViewSet(FastListMixin, viewsets.ModelViewSet):
+    serializer_class = ProductSerializer
+    fast_list = True
+
+    def get_queryset(self):
+        return Product.objects.prefetch_related('producttags_set').order_by('title')
+
+
+class RegionViewSet(FastListMixin, viewsets.ModelViewSet):
+    serializer_class = RegionSerializer
+    fast_list = True
+
+    def get_queryset(self):
+        return Region.objects.order_by('name')
+
+
+class FastReadSerializerTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        books = ProductType.objects.create(value='Books')
+        tag = ProductTag.objects.create(value='print')
+        for title in ('Magazine', 'Book'):
+            product = Product.objects.create(title=title, status='published', type=books, amazon_price='9.99')
+            ProductTags.objects.create(product=product, product_tag=tag)
+        Product.objects.create(title='Poster', status='draft')
+
+    def list(self, viewset):
+        response = viewset.as_view({'get': 'list'})(self.factory.get('/'))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_list_matches_the_serializer_when_get_queryset_prefetches(self):
+        self.assertIsNotNone(get_fast_serializer(ProductSerializer))
+        expected = ProductSerializer(Product.objects.order_by('title'), many=True).data
+
+        # The prefetch is dropped with the instances, so it costs no extra query
+        with self.assertNumQueries(1):
+            data = self.list(ProductViewSet)
+        self.assertEqual(data, expected)
+
+    def test_model_field_falls_back_to_the_serializer(self):
+        Region.objects.create(name='EU', currency_code='eur', tax_rate=20, tax_code='STD')
+        Region.objects.create(name='US', currency_code='usd', tax_rate=0)
+
+        self.assertIsNone(FastReadSerializer.compile(RegionSerializer))
+        self.assertEqual(
+            self.list(RegionViewSet),
+            [
+                {'id': str(region.id), 'name': region.name, 'tax_code': region.tax_code}
+                for region in Region.objects.order_by('name')
+            ],
+        )
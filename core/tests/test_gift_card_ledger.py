@@ -0,0 +1,89 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import Customer, GiftCard, GiftCardTransaction, Order, Region
+from core.services.gift_card_ledger import GiftCardDebit, GiftCardLedger, InsufficientGiftCardBalance
+
+
+class GiftCardLedgerTests(TestCase):
+    def setUp(self):
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20, gift_cards_taxable=True)
+        self.card = self.gift_card('CARD', 1000)
+        self.other = self.gift_card('OTHER', 500, tax_rate=10)
+        customer = Customer.objects.create(email='reader@example.com')
+        self.orders = [
+            Order.objects.create(
+                status='pending', display_id=n, customer=customer, email=customer.email,
+                region=self.region, currency_code='eur',
+            )
+            for n in range(1, 4)
+        ]
+        self.ledger = GiftCardLedger()
+
+    def gift_card(self, code, balance, **fields):
+        return GiftCard.objects.create(code=code, value=balance, balance=balance, region=self.region, **fields)
+
+    def balance(self, card):
+        return GiftCard.objects.values_list('balance', flat=True).get(id=card.id)
+
+    def debits(self, card, amount):
+        return [GiftCardDebit(card.id, order.id, amount) for order in self.orders]
+
+    def test_apply_takes_balances_and_records_transactions(self):
+        result = self.ledger.apply(self.debits(self.card, 300) + [GiftCardDebit(self.other.id, self.orders[0].id, 200)])
+        self.assertEqual((len(result.applied), result.rejected), (4, []))
+        self.assertEqual((self.balance(self.card), self.balance(self.other)), (100, 300))
+
+        transactions = GiftCardTransaction.objects.order_by('amount')
+        self.assertEqual(
+            [(t.gift_card_id, t.amount, t.is_taxable, t.tax_rate) for t in transactions],
+            [(self.other.id, 200, True, 10)] + [(self.card.id, 300, True, 20)] * 3,
+        )
+
+    def test_debits_the_balance_cannot_cover_are_rejected(self):
+        debits = self.debits(self.card, 400)
+        result = self.ledger.apply(debits)
+        self.assertEqual((result.applied, result.rejected), (debits[:2], debits[2:]))
+        self.assertEqual(self.balance(self.card), 200)
+        self.assertEqual(GiftCardTransaction.objects.count(), 2)
+
+    def test_debits_on_one_card_are_taken_in_one_update(self):
+        with self.assertNumQueries(1):
+            applied, rejected = self.ledger.take(self.debits(self.card, 300))
+        self.assertEqual((len(applied), rejected), (3, []))
+        self.assertFalse(GiftCardTransaction.objects.exists())
+
+    def test_unusable_cards_are_rejected(self):
+        expired = self.gift_card('EXPIRED', 1000, ends_at=timezone.now() - timedelta(days=1))
+        disabled = self.gift_card('DISABLED', 1000, is_disabled=True)
+        deleted = self.gift_card('DELETED', 1000, deleted_at=timezone.now())
+        debits = [GiftCardDebit(card.id, self.orders[0].id, 100) for card in (expired, disabled, deleted)]
+        self.assertCountEqual(self.ledger.apply(debits).rejected, debits)
+        self.assertEqual({self.balance(card) for card in (expired, disabled, deleted)}, {1000})
+
+    def test_untaxed_regions_record_no_tax_rate(self):
+        Region.objects.filter(id=self.region.id).update(gift_cards_taxable=False)
+        self.ledger.debit(self.card.id, self.orders[0].id, 100)
+        transaction = GiftCardTransaction.objects.get()
+        self.assertEqual((transaction.is_taxable, transaction.tax_rate), (False, None))
+
+    def test_debit_raises_when_the_card_cannot_cover_it(self):
+        with self.assertRaises(InsufficientGiftCardBalance):
+            self.ledger.debit(self.card.id, self.orders[0].id, 1001)
+        self.assertEqual(self.balance(self.card), 1000)
+
+    def test_non_positive_debits_are_refused(self):
+        for amount in (0, -10):
+            with self.subTest(amount=amount), self.assertRaises(ValueError):
+                self.ledger.apply([GiftCardDebit(self.card.id, self.orders[0].id, amount)])
+        self.assertEqual(self.balance(self.card), 1000)
+
+    def test_restore_puts_back_what_take_took(self):
+        applied, _ = self.ledger.take(self.debits(self.card, 300) + [GiftCardDebit(self.other.id, self.orders[0].id, 50)])
+        self.ledger.restore(applied)
+        self.assertEqual((self.balance(self.card), self.balance(self.other)), (1000, 500))
+
+    def test_small_chunks_give_the_same_result(self):
+        result = GiftCardLedger(chunk_size=1).apply(self.debits(self.card, 400))
+        self.assertEqual((len(result.applied), len(result.rejected)), (2, 1))
+        self.assertEqual(self.balance(self.card), 200)
@@ -0,0 +1,109 @@
+from datetime import timedelta
+from unittest import mock
+import redis
+from django.db import OperationalError
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from core.common.idempotency import FINISHED, STARTED, IdempotentRequest, idempotent
+from core.models.models import IdempotencyKey
+
+
+class ChargeView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+    response_status = 201
+
+    @idempotent
+    def post(self, request):
+        ChargeView.calls += 1
+        if request.data.get('explode'):
+            raise RuntimeError('charge failed')
+        return Response({'charged': request.data['amount'], 'call': ChargeView.calls}, status=ChargeView.response_status)
+
+
+class IdempotentDatabaseStoreTests(TestCase):
+    def setUp(self):
+        ChargeView.calls = 0
+        ChargeView.response_status = 201
+        patcher = mock.patch('core.common.idempotency.get_redis_connection', return_value=None)
+        self.get_redis_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, data=None, key='key-1'):
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        request = APIRequestFactory().post('/payments/', data or {'amount': 10}, format='json', **headers)
+        return ChargeView.as_view()(request)
+
+    def test_retry_replays_the_stored_response(self):
+        first = self.post()
+        retry = self.post()
+        self.assertEqual((first.status_code, first.data), (201, {'charged': 10, 'call': 1}))
+        self.assertEqual((retry.status_code, retry.data), (201, {'charged': 10, 'call': 1}))
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(ChargeView.calls, 1)
+        self.assertEqual(IdempotencyKey.objects.get().recovery_point, FINISHED)
+
+    def test_requests_without_a_key_are_not_tracked(self):
+        self.post(key=None)
+        self.post(key=None)
+        self.assertEqual(ChargeView.calls, 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_overlong_key_is_rejected(self):
+        self.assertEqual(self.post(key='k' * 256).status_code, 400)
+        self.assertEqual(ChargeView.calls, 0)
+
+    def test_key_reused_for_another_request_is_rejected(self):
+        self.post()
+        self.assertEqual(self.post({'amount': 99}).status_code, 422)
+        self.assertEqual(ChargeView.calls, 1)
+
+    def test_request_in_progress_conflicts_until_its_lock_goes_stale(self):
+        self.post()
+        IdempotencyKey.objects.update(recovery_point=STARTED, locked_at=timezone.now())
+        self.assertEqual(self.post().status_code, 409)
+
+        IdempotencyKey.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(self.post().data['call'], 2)
+
+    def test_server_errors_and_exceptions_release_the_key(self):
+        ChargeView.response_status = 502
+        self.post()
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        with self.assertRaises(RuntimeError):
+            self.post({'amount': 10, 'explode': True}, key='key-2')
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        ChargeView.response_status = 201
+        self.assertEqual(self.post().data['call'], 3)
+
+    def test_redis_errors_fall_back_to_the_database(self):
+        client = mock.Mock()
+        client.set.side_effect = redis.ConnectionError('down')
+        self.get_redis_connection.return_value = client
+        with self.assertLogs('core.common.idempotency', 'ERROR'):
+            self.post()
+            self.assertEqual(self.post().data['call'], 1)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_no_working_store_refuses_the_request(self):
+        with mock.patch.object(IdempotencyKey.objects, 'create', side_effect=OperationalError('down')), \
+                self.assertLogs('core.common.idempotency', 'ERROR'):
+            response = self.post()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(ChargeView.calls, 0)
+
+    def test_store_errors_after_the_view_ran_are_raised(self):
+        request = APIRequestFactory().post('/payments/', {'amount': 10}, format='json')
+        request.user = None
+        request.data = {'amount': 10}
+        idempotent_request = IdempotentRequest(request, 'key-1')
+        with mock.patch.object(IdempotencyKey.objects, 'filter', side_effect=OperationalError('down')):
+            with self.assertRaises(OperationalError):
+                idempotent_request.run(lambda: Response({'ok': True}, status=201))
+        self.assertTrue(idempotent_request.view_started)
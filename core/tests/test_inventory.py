@@ -0,0 +1,122 @@
+import time
+from datetime import timedelta
+from unittest import mock
+import redis
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import InventoryReservation, Product, ProductVariant
+from core.services.inventory import InsufficientInventory, InventoryService
+
+
+class InventoryTestCase(TestCase):
+    def setUp(self):
+        product = Product.objects.create(title='Magazine', status='published')
+        self.variant = ProductVariant.objects.create(product=product, title='Print', inventory_quantity=5)
+        self.other_variant = ProductVariant.objects.create(product=product, title='Poster', inventory_quantity=1)
+
+    def stock(self, variant=None):
+        return ProductVariant.objects.values_list('inventory_quantity', flat=True).get(id=(variant or self.variant).id)
+
+
+class InventoryWithoutRedisTests(InventoryTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch('core.services.inventory.get_redis_connection', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = InventoryService(use_counter=True)
+
+    def test_counter_is_off_without_redis(self):
+        self.assertFalse(self.service.use_counter)
+        self.assertEqual(self.service.reconcile(), 0)
+
+    def test_confirm_keeps_the_stock_taken(self):
+        reservation = self.service.reserve(self.variant.id, 2)
+        self.assertEqual(self.stock(), 3)
+        self.assertTrue(InventoryReservation.objects.filter(id=reservation.id).exists())
+
+        self.assertTrue(self.service.confirm(reservation.id))
+        self.assertFalse(self.service.confirm(reservation.id))
+        self.assertFalse(self.service.release(reservation.id))
+        self.assertEqual(self.stock(), 3)
+        self.assertFalse(InventoryReservation.objects.exists())
+
+    def test_release_puts_the_stock_back_once(self):
+        reservation = self.service.reserve(self.variant.id, 2)
+        self.assertTrue(self.service.release(reservation.id))
+        self.assertFalse(self.service.release(reservation.id))
+        self.assertEqual(self.stock(), 5)
+
+    def test_insufficient_stock(self):
+        with self.assertRaises(InsufficientInventory):
+            self.service.reserve(self.variant.id, 6)
+        self.assertEqual(self.stock(), 5)
+        self.assertFalse(InventoryReservation.objects.exists())
+
+    def test_backordered_and_unmanaged_variants_reserve_nothing(self):
+        ProductVariant.objects.filter(id=self.variant.id).update(allow_backorder=True)
+        ProductVariant.objects.filter(id=self.other_variant.id).update(manage_inventory=False)
+        for variant in (self.variant, self.other_variant):
+            reservation = self.service.reserve(variant.id, 10)
+            self.assertEqual((reservation.id, reservation.quantity), (None, 0))
+        self.assertEqual((self.stock(), self.stock(self.other_variant)), (5, 1))
+
+    def test_reserve_many_is_all_or_nothing(self):
+        with self.assertRaises(InsufficientInventory):
+            self.service.reserve_many([(self.variant.id, 2), (self.other_variant.id, 2)])
+        self.assertEqual((self.stock(), self.stock(self.other_variant)), (5, 1))
+        self.assertFalse(InventoryReservation.objects.exists())
+
+    def test_rolled_back_reservation_leaves_no_ledger_entry(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.service.reserve(self.variant.id, 2)
+            raise RuntimeError
+        self.assertEqual(self.stock(), 5)
+        self.assertFalse(InventoryReservation.objects.exists())
+
+    def test_sweep_releases_only_expired_reservations(self):
+        expired = self.service.reserve(self.variant.id, 2)
+        live = self.service.reserve(self.variant.id, 1)
+        InventoryReservation.objects.filter(id=expired.id).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        self.assertEqual(self.service.release_expired(), 1)
+        self.assertEqual(self.stock(), 4)
+        self.assertEqual([str(pk) for pk in InventoryReservation.objects.values_list('id', flat=True)], [live.id])
+
+        self.assertEqual(self.service.release_expired(now=time.time() + self.service.ttl + 1), 1)
+        self.assertEqual(self.stock(), 5)
+
+
+class InventoryRedisFailureTests(InventoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = mock.Mock()
+        self.client.pipeline.return_value.execute.side_effect = redis.ConnectionError('down')
+        self.service = InventoryService(client=self.client, use_counter=False)
+
+    def test_failed_ledger_write_keeps_the_reservation_in_the_database(self):
+        with self.assertLogs('core.services.inventory', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+            reservation = self.service.reserve(self.variant.id, 2)
+        self.assertEqual(InventoryReservation.objects.get().quantity, 2)
+
+        self.client.zrem.return_value = 0
+        self.assertTrue(self.service.release(reservation.id))
+        self.assertEqual(self.stock(), 5)
+
+    def test_claim_during_an_outage_leaves_the_reservation_for_the_sweep(self):
+        with self.assertLogs('core.services.inventory', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+            reservation = self.service.reserve(self.variant.id, 2)
+        self.client.zrem.side_effect = redis.ConnectionError('down')
+        with self.assertLogs('core.services.inventory', 'ERROR'):
+            self.assertFalse(self.service.release(reservation.id))
+        self.assertEqual(self.stock(), 3)
+
+    def test_sweep_releases_database_reservations_when_redis_is_down(self):
+        with self.assertLogs('core.services.inventory', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+            self.service.reserve(self.variant.id, 2)
+        self.client.zrangebyscore.side_effect = redis.ConnectionError('down')
+        self.client.zrem.return_value = 0
+        with self.assertLogs('core.services.inventory', 'ERROR'):
+            self.assertEqual(self.service.release_expired(now=time.time() + self.service.ttl + 1), 1)
+        self.assertEqual(self.stock(), 5)
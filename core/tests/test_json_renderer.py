@@ -0,0 +1,80 @@
+import io
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock, skipIf
+from django.test import SimpleTestCase
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from core.common.parsers import ORJSONParser
+from core.common.renderers import ORJSONRenderer, orjson
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class ORJSONRendererTests(SimpleTestCase):
+    payloads = {
+        'plain': {'id': 1, 'title': 'Spring issue', 'price': 12.5, 'tags': ['a', 'b'], 'active': True, 'note': None},
+        'native types': {'id': uuid.UUID(int=7), 'at': datetime(2024, 5, 1, 9, 0, tzinfo=timezone.utc), 'total': Decimal('9.90')},
+        'exponent floats': {'tiny': 1e-05, 'huge': 1e16, 'negative': -2.5e-07, 'nested': [{'v': 3e20}]},
+        'plain small float': [1.23e-05],
+        'exponent decimal': {'total': Decimal('1E+20')},
+        'wide ints': {'id': 2 ** 64, 'negative': -(2 ** 63) - 1},
+        'line separators': {'text': 'one\u2028two\u2029three'},
+    }
+
+    def test_output_matches_json_renderer(self):
+        for label, payload in self.payloads.items():
+            with self.subTest(label):
+                self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+
+    def test_non_finite_floats_are_written_as_null(self):
+        for value in (float('nan'), float('inf'), float('-inf')):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({'value': value})
+                self.assertEqual(ORJSONRenderer().render({'value': value}), b'{"value":null}')
+
+    def test_json_renderer_is_only_used_for_floats_orjson_writes_differently(self):
+        plain = {
+            'ids': [uuid.UUID('12e45678-1234-5678-1234-56781e345678'), '3e4', 'x:1e5'],
+            'values': [1, 0.0, 1e-4, 9.99e15, 10.00001],
+        }
+        with mock.patch.object(JSONRenderer, 'render') as render:
+            ORJSONRenderer().render(plain)
+        render.assert_not_called()
+        for data in ({'a': [{'b': 1e16}]}, [2e-05], 1e-07):
+            with self.subTest(data=data), mock.patch.object(JSONRenderer, 'render') as render:
+                ORJSONRenderer().render(data)
+                render.assert_called_once()
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), parser_context={})
+
+    def test_result_matches_json_parser(self):
+        bodies = [
+            b'{"id": 1, "title": "Spring issue", "price": 12.5, "tags": ["a"]}',
+            b'{"id": 18446744073709551616, "small": 1}',
+            b'[{"nested": {"value": -9223372036854775809}}]',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                parsed = self.parse(ORJSONParser(), body)
+                self.assertEqual(parsed, self.parse(JSONParser(), body))
+                self.assertEqual([type(v) for v in _leaves(parsed)], [type(v) for v in _leaves(self.parse(JSONParser(), body))])
+
+    def test_malformed_body_raises_the_json_parser_error(self):
+        with self.assertRaises(Exception) as expected:
+            self.parse(JSONParser(), b'{"id": ')
+        with self.assertRaises(type(expected.exception)):
+            self.parse(ORJSONParser(), b'{"id": ')
+
+
+def _leaves(value):
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return [leaf for item in value for leaf in _leaves(item)]
+    return [value]
@@ -0,0 +1,55 @@
+import base64
+import uuid
+from datetime import datetime, timezone
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.common.keyset_pagination import KeysetPagination
+
+
+class KeysetCursorTests(SimpleTestCase):
+    def setUp(self):
+        self.paginator = KeysetPagination()
+        self.created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        self.pk = uuid.uuid4()
+
+    def test_cursor_round_trip_from_dict_row(self):
+        cursor = self.paginator.encode_cursor({'created_at': self.created_at, 'id': self.pk})
+        self.assertEqual(self.paginator.decode_cursor(cursor), (self.created_at, self.pk))
+
+    def test_cursor_round_trip_from_instance(self):
+        row = type('Row', (), {'created_at': self.created_at, 'pk': self.pk})()
+        cursor = self.paginator.encode_cursor(row)
+        self.assertEqual(self.paginator.decode_cursor(cursor), (self.created_at, self.pk))
+
+    def test_cursor_is_url_safe(self):
+        cursor = self.paginator.encode_cursor({'created_at': self.created_at, 'id': self.pk})
+        self.assertNotRegex(cursor, r'[+/]')
+
+    def test_invalid_cursors_are_rejected(self):
+        bad = [
+            'not base64 at all',
+            base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+            base64.urlsafe_b64encode(b'["yesterday", "x"]').decode(),
+            base64.urlsafe_b64encode(f'["{self.created_at.isoformat()}", "not-a-uuid"]'.encode()).decode(),
+        ]
+        for cursor in bad:
+            with self.subTest(cursor=cursor), self.assertRaises(ParseError):
+                self.paginator.decode_cursor(cursor)
+
+
+class KeysetPageSizeTests(SimpleTestCase):
+    def page_size(self, query):
+        request = Request(APIRequestFactory().get('/orders/', query))
+        return KeysetPagination().get_page_size(request)
+
+    def test_default_page_size(self):
+        self.assertEqual(self.page_size({}), KeysetPagination.page_size)
+
+    def test_page_size_is_clamped(self):
+        self.assertEqual(self.page_size({'page_size': 1000}), KeysetPagination.max_page_size)
+        self.assertEqual(self.page_size({'page_size': 0}), 1)
+
+    def test_unparseable_page_size_falls_back_to_default(self):
+        self.assertEqual(self.page_size({'page_size': 'many'}), KeysetPagination.page_size)
@@ -0,0 +1,188 @@
+import threading
+import uuid
+from unittest import mock
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    CartDiscount,
+    CartGiftCard,
+    Customer,
+    Discount,
+    DiscountRule,
+    GiftCard,
+    GiftCardTransaction,
+    InventoryReservation,
+    LineItem,
+    Order,
+    OrderDiscount,
+    OrderGiftCard,
+    Product,
+    ProductVariant,
+    Region,
+)
+from core.services.inventory import InventoryService
+from core.services.order_completion import OrderCompletionService, allocate_display_ids
+
+
+class CompletionFixtures:
+    def create_fixtures(self):
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20)
+        self.customer = Customer.objects.create(email='reader@example.com')
+        product = Product.objects.create(title='Magazine', status='published')
+        self.variant = ProductVariant.objects.create(product=product, title='Print', inventory_quantity=10)
+
+    def cart(self, unit_price=1000, **fields):
+        fields.setdefault('customer', self.customer)
+        cart = Cart.objects.create(region=self.region, type='type1', **fields)
+        if unit_price:
+            LineItem.objects.create(cart=cart, title='Magazine', variant=self.variant, unit_price=unit_price, quantity=1)
+        return cart
+
+
+class OrderCompletionTests(CompletionFixtures, TestCase):
+    def setUp(self):
+        self.create_fixtures()
+        patcher = mock.patch('core.services.inventory.get_redis_connection', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = OrderCompletionService()
+
+    def discount(self, code, usage_limit=None):
+        rule = DiscountRule.objects.create(type='percentage', value=10)
+        return Discount.objects.create(code=code, rule=rule, starts_at=timezone.now(), usage_limit=usage_limit)
+
+    def gift_card(self, code, balance, *carts):
+        card = GiftCard.objects.create(code=code, value=balance, balance=balance, region=self.region)
+        for cart in carts:
+            CartGiftCard.objects.create(cart=cart, gift_card=card)
+        return card
+
+    def balance(self, card):
+        return GiftCard.objects.values_list('balance', flat=True).get(id=card.id)
+
+    def test_carts_become_orders_with_consecutive_display_ids(self):
+        Order.objects.create(
+            status='completed', display_id=41, customer=self.customer, email=self.customer.email,
+            region=self.region, currency_code='eur',
+        )
+        first, second = self.cart(email='first@example.com'), self.cart(unit_price=2500)
+
+        result = self.service.complete([first.id, second.id])
+        self.assertEqual(result.rejected, {})
+        self.assertEqual(sorted(order.display_id for order in result.orders.values()), [42, 43])
+        self.assertEqual(result.orders[first.id].email, 'first@example.com')
+        self.assertEqual(result.orders[second.id].email, self.customer.email)
+        self.assertEqual(result.totals[second.id].subtotal, 2500)
+
+        self.assertFalse(Cart.objects.filter(completed_at__isnull=True).exists())
+        for cart in (first, second):
+            order = Order.objects.get(cart=cart)
+            self.assertEqual(order.currency_code, 'eur')
+            self.assertEqual(list(LineItem.objects.filter(cart=cart).values_list('order_id', flat=True)), [order.id])
+
+    def test_carts_that_cannot_be_completed_are_rejected(self):
+        good = self.cart()
+        empty = self.cart(unit_price=0)
+        anonymous = self.cart(customer=None)
+        done = self.cart(completed_at=timezone.now())
+        unknown = uuid.uuid4()
+
+        result = self.service.complete([good.id, empty.id, anonymous.id, done.id, unknown])
+        self.assertEqual(list(result.orders), [good.id])
+        self.assertEqual(result.rejected, {
+            empty.id: 'Cart has no items',
+            anonymous.id: 'Cart has no customer',
+            done.id: 'Cart is already completed or being completed',
+            unknown: 'Cart is already completed or being completed',
+        })
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_a_cart_is_completed_once(self):
+        cart = self.cart()
+        self.service.complete([cart.id])
+        result = self.service.complete([cart.id])
+        self.assertEqual((result.orders, list(result.rejected)), ({}, [cart.id]))
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_gift_cards_are_debited_once_per_order(self):
+        carts = [self.cart(), self.cart()]
+        card = self.gift_card('SHARED', 1500, *carts)
+
+        result = self.service.complete([cart.id for cart in carts])
+        [completed] = result.orders
+        [rejected] = result.rejected
+        self.assertEqual(result.rejected[rejected], 'Gift card balance changed, recalculate the cart')
+        self.assertEqual(self.balance(card), 500)
+        self.assertEqual(
+            list(GiftCardTransaction.objects.values_list('order_id', 'amount')),
+            [(result.orders[completed].id, 1000)],
+        )
+        self.assertEqual(OrderGiftCard.objects.get().order_id, result.orders[completed].id)
+        self.assertIsNone(Cart.objects.get(id=rejected).completed_at)
+
+    def test_carts_past_a_discount_limit_are_rejected_and_their_gift_cards_restored(self):
+        once = self.discount('ONCE', usage_limit=1)
+        always = self.discount('ALWAYS')
+        carts = [self.cart(), self.cart()]
+        cards = {cart.id: self.gift_card(f'CARD-{n}', 300, cart) for n, cart in enumerate(carts)}
+        for cart in carts:
+            CartDiscount.objects.create(cart=cart, discount=once)
+            CartDiscount.objects.create(cart=cart, discount=always)
+
+        result = self.service.complete([cart.id for cart in carts])
+        [completed] = result.orders
+        [rejected] = result.rejected
+        self.assertEqual(result.rejected[rejected], 'Discount usage limit reached')
+        self.assertEqual((self.balance(cards[completed]), self.balance(cards[rejected])), (0, 300))
+        self.assertEqual(dict(Discount.objects.values_list('code', 'usage_count')), {'ONCE': 1, 'ALWAYS': 1})
+        self.assertEqual(OrderDiscount.objects.filter(order=result.orders[completed]).count(), 2)
+        self.assertEqual(GiftCardTransaction.objects.get().gift_card_id, cards[completed].id)
+
+    def test_reservations_of_completed_carts_are_confirmed_after_commit(self):
+        inventory = InventoryService()
+        cart, empty = self.cart(), self.cart(unit_price=0)
+        reservations = {cart.id: [inventory.reserve(self.variant.id, 2).id], empty.id: [inventory.reserve(self.variant.id, 1).id]}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.complete([cart.id, empty.id], reservations)
+        self.assertEqual(
+            [str(pk) for pk in InventoryReservation.objects.values_list('id', flat=True)], reservations[empty.id],
+        )
+        self.assertEqual(ProductVariant.objects.get(id=self.variant.id).inventory_quantity, 7)
+
+    def test_display_ids_are_allocated_in_blocks(self):
+        self.assertEqual(list(allocate_display_ids(3)), [1, 2, 3])
+        self.assertEqual(list(allocate_display_ids(2)), [4, 5])
+
+
+@skipUnlessDBFeature('has_select_for_update_skip_locked')
+class ConcurrentCompletionTests(CompletionFixtures, TransactionTestCase):
+    def setUp(self):
+        self.create_fixtures()
+
+    def test_cart_locked_by_another_worker_is_skipped(self):
+        locked, free = self.cart(), self.cart()
+        holding, release = threading.Event(), threading.Event()
+
+        def other_worker():
+            try:
+                with transaction.atomic():
+                    list(Cart.objects.select_for_update().filter(id=locked.id))
+                    holding.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        worker = threading.Thread(target=other_worker)
+        worker.start()
+        try:
+            holding.wait(10)
+            result = OrderCompletionService().complete([locked.id, free.id])
+        finally:
+            release.set()
+            worker.join()
+
+        self.assertEqual(list(result.orders), [free.id])
+        self.assertEqual(result.rejected, {locked.id: 'Cart is already completed or being completed'})
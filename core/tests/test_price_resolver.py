@@ -0,0 +1,121 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import (
+    CustomerGroup,
+    MoneyAmount,
+    PriceList,
+    PriceListCustomerGroup,
+    Product,
+    ProductVariant,
+    ProductVariantMoneyAmount,
+    Region,
+)
+from core.services.price_resolver import PriceResolver, PriceState
+
+
+class PriceResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Indexes live on the class; start every test from an unsynced resolver
+        PriceResolver._state = PriceState(None, {}, {}, {})
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20)
+        self.other_region = Region.objects.create(name='DE', currency_code='eur', tax_rate=19)
+        product = Product.objects.create(title='Magazine', status='published')
+        self.variant = ProductVariant.objects.create(product=product, title='Print')
+        self.other_variant = ProductVariant.objects.create(product=product, title='Digital')
+
+    def price(self, amount, variant=None, region=None, price_list=None, **fields):
+        money_amount = MoneyAmount.objects.create(
+            currency_code='eur', amount=amount, region=region, price_list=price_list, **fields,
+        )
+        ProductVariantMoneyAmount.objects.create(money_amount=money_amount, variant=variant or self.variant)
+        return money_amount
+
+    def price_list(self, status='active', **fields):
+        return PriceList.objects.create(name='Sale', description='', type='static', status=status, **fields)
+
+    def resolve(self, **kwargs):
+        return PriceResolver.resolve([self.variant.id, self.other_variant.id], self.region.id, **kwargs)
+
+    def test_region_price_wins_over_currency_price(self):
+        self.price(1200)
+        self.price(1000, region=self.region)
+        self.price(500, region=self.other_region)
+        self.price(800, variant=self.other_variant)
+
+        prices = self.resolve()
+        self.assertEqual(prices[self.variant.id].original_amount, 1000)
+        self.assertEqual(prices[self.variant.id].currency_code, 'eur')
+        self.assertEqual(prices[self.other_variant.id].calculated_amount, 800)
+
+    def test_variants_without_a_price_are_left_out(self):
+        self.price(1000)
+        self.assertEqual(list(self.resolve()), [self.variant.id])
+
+    def test_quantity_tiers(self):
+        self.price(1000)
+        self.price(900, min_quantity=10, max_quantity=49)
+        self.price(800, min_quantity=50)
+
+        self.assertEqual(self.resolve(quantity=1)[self.variant.id].original_amount, 1000)
+        self.assertEqual(self.resolve(quantity=10)[self.variant.id].original_amount, 900)
+        self.assertEqual(self.resolve(quantity=50)[self.variant.id].original_amount, 800)
+
+    def test_active_price_list_lowers_the_calculated_price(self):
+        self.price(1000)
+        sale = self.price_list()
+        self.price(700, price_list=sale)
+        self.price(600, price_list=self.price_list(status='inactive'))
+        self.price(500, price_list=self.price_list(ends_at=timezone.now() - timedelta(days=1)))
+
+        price = self.resolve()[self.variant.id]
+        self.assertEqual((price.original_amount, price.calculated_amount), (1000, 700))
+        self.assertEqual(price.price_list_id, str(sale.id))
+
+    def test_customer_group_price_list(self):
+        self.price(1000)
+        members = CustomerGroup.objects.create(name='Members')
+        sale = self.price_list()
+        PriceListCustomerGroup.objects.create(price_list=sale, customer_group=members)
+        self.price(700, price_list=sale)
+
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 1000)
+        self.assertEqual(self.resolve(customer_group_ids=[members.id])[self.variant.id].calculated_amount, 700)
+
+    def test_committed_changes_are_picked_up(self):
+        base = self.price(1000)
+        sale = self.price_list()
+        listed = self.price(900, price_list=sale)
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 900)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            listed.amount = 700
+            listed.save()
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 700)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            sale.status = 'inactive'
+            sale.save()
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 1000)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            base.amount = 1100
+            base.save()
+        self.assertEqual(self.resolve()[self.variant.id].original_amount, 1100)
+
+    def test_price_moved_off_a_list_leaves_it(self):
+        self.price(1000)
+        listed = self.price(700, price_list=self.price_list())
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 700)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            listed.price_list = None
+            listed.min_quantity = 100
+            listed.save()
+        self.assertEqual(self.resolve()[self.variant.id].calculated_amount, 1000)
+
+    def test_unknown_region(self):
+        with self.assertRaises(ValueError):
+            PriceResolver.resolve([self.variant.id], 0)
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase, override_settings
+from core.common.request_logging import DEFAULTS, REDACTED, PayloadSummary, get_config, should_log
+
+
+class PayloadSummaryTests(SimpleTestCase):
+    def summary(self, data, **overrides):
+        return PayloadSummary(data, {**DEFAULTS, **overrides})
+
+    def test_sensitive_keys_are_redacted_by_whole_word_and_case(self):
+        data = {
+            'password_confirmation': 'x', 'X-Api-Key': 'x', 'Authorization': 'x', 'refresh_token': 'x',
+            'stripe_secret': 'x', 'Card-Number': 'x', 'accessToken': 'x', 'sessionId': 'x', 'APIKey': 'x',
+            'access': 'x',
+        }
+        trimmed = self.summary(data)._trim(data, 3)
+        self.assertEqual(set(trimmed.values()), {REDACTED})
+
+    def test_words_that_only_contain_a_sensitive_name_are_kept(self):
+        data = {'email': 'x', 'accessibility': 'x', 'sessions_total': 'x', 'tokenizer': 'x', 'secretary': 'x', 'card': 'x'}
+        self.assertEqual(self.summary(data)._trim(data, 3), data)
+
+    def test_nested_keys_are_redacted(self):
+        data = {'payment': {'card': {'cvc': '123', 'brand': 'visa'}}}
+        trimmed = self.summary(data)._trim(data, 3)
+        self.assertEqual(trimmed['payment']['card'], {'cvc': REDACTED, 'brand': 'visa'})
+
+    def test_items_and_depth_are_capped(self):
+        data = {'rows': [{'id': n} for n in range(25)], 'deep': {'a': {'b': {'c': 1}}}}
+        trimmed = self.summary(data, MAX_ITEMS=10)._trim(data, 3)
+        self.assertEqual(len(trimmed['rows']), 11)
+        self.assertEqual(trimmed['rows'][-1], '... 15 more items')
+        self.assertEqual(trimmed['deep']['a']['b'], '<dict of 1>')
+
+    def test_str_is_truncated(self):
+        text = str(self.summary({'body': 'x' * 5000}, MAX_PAYLOAD_CHARS=100))
+        self.assertTrue(text.endswith('chars)'))
+        self.assertLess(len(text), 200)
+
+    @override_settings(API_REQUEST_LOGGING={'REDACT_FIELDS': ('pin',)})
+    def test_redact_fields_from_settings_are_added_to_the_defaults(self):
+        data = {'PIN_code': '0000', 'password': 'x', 'spinner': 'x'}
+        self.assertEqual(
+            PayloadSummary(data, get_config())._trim(data, 3), {'PIN_code': REDACTED, 'password': REDACTED, 'spinner': 'x'},
+        )
+
+
+class ShouldLogTests(SimpleTestCase):
+    def test_errors_and_slow_requests_are_always_logged(self):
+        config = {**DEFAULTS, 'SAMPLE_RATE': 0}
+        self.assertTrue(should_log('orders-list', 500, 5, config))
+        self.assertTrue(should_log('orders-list', 200, config['SLOW_REQUEST_MS'], config))
+        self.assertFalse(should_log('orders-list', 200, 5, config))
+
+    def test_route_sample_rate_overrides_default(self):
+        config = {**DEFAULTS, 'SAMPLE_RATE': 0, 'ROUTE_SAMPLE_RATES': {'payments-list': 1}}
+        self.assertTrue(should_log('payments-list', 200, 5, config))
+        self.assertFalse(should_log('orders-list', 200, 5, config))
@@ -0,0 +1,150 @@
+import uuid
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    FulfillmentProvider,
+    LineItem,
+    Product,
+    ProductShippingProfile,
+    ProductVariant,
+    Region,
+    RegionFulfillmentProvider,
+    ShippingOption,
+    ShippingOptionRequirement,
+    ShippingProfile,
+)
+from core.services.shipping_options import (
+    MAX_SUBTOTAL,
+    MIN_SUBTOTAL,
+    EligibleOption,
+    ProfileOptions,
+    ShippingOptionEngine,
+    ShippingQuoteRequest,
+    load_quote_requests,
+)
+
+
+def option(option_id, provider_id=None, is_return=False, admin_only=False):
+    return EligibleOption(option_id, option_id, 'default', provider_id, 'FIXED', 500, is_return, admin_only)
+
+
+def ids(options):
+    return sorted(o.id for o in options)
+
+
+class ProfileOptionsTests(SimpleTestCase):
+    def setUp(self):
+        self.table = ProfileOptions([
+            (5000, None, option('free')),
+            (0, None, option('standard')),
+            (0, 2000, option('small')),
+            (1000, 3000, option('medium')),
+        ])
+
+    def test_subtotal_picks_the_ranges_it_falls_in(self):
+        cases = {
+            0: ['small', 'standard'],
+            999: ['small', 'standard'],
+            2500: ['medium', 'standard'],
+            6000: ['free', 'standard'],
+        }
+        for subtotal, expected in cases.items():
+            with self.subTest(subtotal=subtotal):
+                self.assertEqual(ids(self.table.eligible(subtotal)), expected)
+
+    def test_range_bounds_are_inclusive(self):
+        self.assertEqual(ids(self.table.eligible(1000)), ['medium', 'small', 'standard'])
+        self.assertEqual(ids(self.table.eligible(2000)), ['medium', 'small', 'standard'])
+        self.assertEqual(ids(self.table.eligible(3000)), ['medium', 'standard'])
+        self.assertEqual(ids(self.table.eligible(5000)), ['free', 'standard'])
+
+    def test_empty_table(self):
+        self.assertEqual(ProfileOptions([]).eligible(100), [])
+
+
+class ShippingOptionEngineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20)
+        self.other_region = Region.objects.create(name='US', currency_code='usd', tax_rate=0)
+        self.provider = FulfillmentProvider.objects.create(is_installed=True)
+        self.uninstalled = FulfillmentProvider.objects.create(is_installed=False)
+        self.not_in_region = FulfillmentProvider.objects.create(is_installed=True)
+        for provider in (self.provider, self.uninstalled):
+            RegionFulfillmentProvider.objects.create(region=self.region, provider=provider)
+        RegionFulfillmentProvider.objects.create(region=self.other_region, provider=self.not_in_region)
+
+        self.default = ShippingProfile.objects.create(id='default', name='Default', type='STANDARD')
+        self.gift = ShippingProfile.objects.create(id='gift', name='Gift', type='STANDARD')
+        self.add_option('standard')
+        self.add_option('narrowed', requirements=[(MIN_SUBTOTAL, 1000), (MIN_SUBTOTAL, 1500), (MAX_SUBTOTAL, 5000), (MAX_SUBTOTAL, 4000)])
+        self.add_option('free', requirements=[(MIN_SUBTOTAL, 5000)])
+        self.add_option('returns', is_return=True)
+        self.add_option('courier', admin_only=True)
+        self.add_option('gift-wrap', profile=self.gift)
+        self.add_option('uninstalled', provider=self.uninstalled)
+        self.add_option('not-in-region', provider=self.not_in_region)
+        self.add_option('deleted', deleted_at=timezone.now())
+
+    def add_option(self, option_id, profile=None, provider=None, requirements=(), **fields):
+        option = ShippingOption.objects.create(
+            id=option_id, name=option_id, region=self.region, profile=profile or self.default,
+            provider=provider or self.provider, price_type='FIXED', amount=500, data={},
+            is_return=fields.pop('is_return', False), admin_only=fields.pop('admin_only', False), **fields,
+        )
+        for n, (kind, amount) in enumerate(requirements):
+            ShippingOptionRequirement.objects.create(id=f'{option_id}-{n}', shipping_option=option, type=kind, amount=amount)
+        return option
+
+    def eligible(self, subtotal, profile_ids=('default',), **kwargs):
+        return ids(ShippingOptionEngine.eligible(self.region.id, subtotal, profile_ids, **kwargs))
+
+    def test_requirements_narrow_ranges_and_unusable_providers_are_dropped(self):
+        self.assertEqual(self.eligible(1200), ['standard'])
+        self.assertEqual(self.eligible(1500), ['narrowed', 'standard'])
+        self.assertEqual(self.eligible(4500), ['standard'])
+        self.assertEqual(self.eligible(5000), ['free', 'standard'])
+
+    def test_profiles_in_the_cart_are_combined(self):
+        self.assertEqual(self.eligible(100, ['default', 'gift', 'unknown']), ['gift-wrap', 'standard'])
+
+    def test_return_and_admin_options_are_opt_in(self):
+        self.assertEqual(self.eligible(100, is_return=True), ['returns'])
+        self.assertEqual(self.eligible(100, include_admin=True), ['courier', 'standard'])
+
+    def test_unknown_region_has_no_options(self):
+        self.assertEqual(ShippingOptionEngine.eligible(uuid.uuid4(), 100, ['default']), [])
+
+    def test_quotes_for_carts(self):
+        shirt = Product.objects.create(title='Shirt', status='published')
+        card = Product.objects.create(title='Card', status='published')
+        ProductShippingProfile.objects.create(product=shirt, profile=self.default)
+        ProductShippingProfile.objects.create(product=card, profile=self.gift)
+        carts = [Cart.objects.create(region=self.region, type='type1') for _ in range(3)]
+        for cart, lines in zip(carts, [[(shirt, 800, 2)], [(shirt, 500, 1), (card, 200, 1)], []]):
+            for product, unit_price, quantity in lines:
+                variant = ProductVariant.objects.create(product=product, title=product.title)
+                LineItem.objects.create(cart=cart, title=product.title, variant=variant, unit_price=unit_price, quantity=quantity)
+
+        with self.assertNumQueries(2):
+            requests = load_quote_requests(carts)
+        self.assertEqual(requests, [
+            ShippingQuoteRequest(self.region.id, 1600, frozenset(['default'])),
+            ShippingQuoteRequest(self.region.id, 700, frozenset(['default', 'gift'])),
+            ShippingQuoteRequest(self.region.id, 0, frozenset()),
+        ])
+        quotes = ShippingOptionEngine.quote_many(requests)
+        self.assertEqual([ids(options) for options in quotes], [['narrowed', 'standard'], ['gift-wrap', 'standard'], []])
+
+    def test_committed_changes_rebuild_the_tables(self):
+        self.assertEqual(self.eligible(100), ['standard'])
+        with self.captureOnCommitCallbacks(execute=True):
+            FulfillmentProvider.objects.filter(id=self.uninstalled.id).update(is_installed=True)
+            FulfillmentProvider.objects.get(id=self.uninstalled.id).save()
+        self.assertEqual(self.eligible(100), ['standard', 'uninstalled'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ShippingOptionRequirement.objects.create(id='standard-0', shipping_option_id='standard', type=MIN_SUBTOTAL, amount=200)
+        self.assertEqual(self.eligible(100), ['uninstalled'])
@@ -0,0 +1,105 @@
+import uuid
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from core.models.models import (
+    Cart,
+    FulfillmentProvider,
+    LineItem,
+    Product,
+    ProductTaxRate,
+    ProductType,
+    ProductTypeTaxRate,
+    ProductVariant,
+    Region,
+    ShippingOption,
+    ShippingProfile,
+    ShippingTaxRate,
+    TaxRate,
+)
+from core.services.discount_engine import load_cart_contexts
+from core.services.tax_rates import DEFAULT_RATE_NAME, TaxLineRate, TaxRateResolver
+
+
+class TaxRateResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name='EU', currency_code='eur', tax_rate=20, tax_code='STD')
+        self.other_region = Region.objects.create(name='US', currency_code='usd', tax_rate=0)
+        self.books = ProductType.objects.create(value='Books')
+        self.magazine = Product.objects.create(title='Magazine', status='published', type=self.books)
+        self.book = Product.objects.create(title='Book', status='published', type=self.books)
+        self.poster = Product.objects.create(title='Poster', status='published')
+        self.cart = Cart.objects.create(region=self.region, type='type1')
+        self.lines = {
+            product.title: LineItem.objects.create(
+                cart=self.cart, title=product.title, unit_price=1000, quantity=1,
+                variant=ProductVariant.objects.create(product=product, title=product.title),
+            ).id
+            for product in (self.magazine, self.book, self.poster)
+        }
+
+    def tax_rate(self, id, rate, region=None, code=None):
+        return TaxRate.objects.create(id=id, rate=rate, name=id, code=code, region=region or self.region)
+
+    def rates(self):
+        [context] = load_cart_contexts([self.cart])
+        rates = TaxRateResolver.rates_for(self.region.id, context.items)
+        return {title: rates[item_id] for title, item_id in self.lines.items()}
+
+    def test_product_rates_win_over_product_type_rates_over_the_default(self):
+        reduced = self.tax_rate('reduced', 7, code='RED')
+        print_rate = self.tax_rate('print', 5)
+        surcharge = self.tax_rate('surcharge', 1)
+        ProductTypeTaxRate.objects.create(product_type=self.books, tax_rate=reduced)
+        ProductTaxRate.objects.create(product=self.magazine, tax_rate=print_rate)
+        ProductTaxRate.objects.create(product=self.magazine, tax_rate=surcharge)
+
+        rates = self.rates()
+        self.assertCountEqual(rates['Magazine'], [TaxLineRate(5, 'print', None), TaxLineRate(1, 'surcharge', None)])
+        self.assertEqual(rates['Book'], (TaxLineRate(7, 'reduced', 'RED'),))
+        self.assertEqual(rates['Poster'], (TaxLineRate(20, DEFAULT_RATE_NAME, 'STD'),))
+
+    def test_rates_of_other_regions_and_deleted_overrides_are_ignored(self):
+        ProductTaxRate.objects.create(product=self.magazine, tax_rate=self.tax_rate('us', 8, region=self.other_region))
+        ProductTypeTaxRate.objects.create(product_type=self.books, tax_rate=self.tax_rate('old', 7), deleted_at=timezone.now())
+        self.assertEqual(set(self.rates().values()), {(TaxLineRate(20, DEFAULT_RATE_NAME, 'STD'),)})
+
+    def test_rate_without_a_value_is_zero(self):
+        ProductTaxRate.objects.create(product=self.poster, tax_rate=self.tax_rate('exempt', None))
+        self.assertEqual(self.rates()['Poster'], (TaxLineRate(0.0, 'exempt', None),))
+
+    def test_shipping_option_rates(self):
+        option = ShippingOption.objects.create(
+            id='express', name='Express', region=self.region,
+            profile=ShippingProfile.objects.create(id='default', name='Default', type='STANDARD'),
+            provider=FulfillmentProvider.objects.create(is_installed=True),
+            price_type='FIXED', amount=500, is_return=False, data={}, admin_only=False,
+        )
+        ShippingTaxRate.objects.create(shipping_option=option, rate=self.tax_rate('shipping', 10))
+        rates = TaxRateResolver.shipping_rates_for(self.region.id, ['express', 'standard'])
+        self.assertEqual(rates, {
+            'express': (TaxLineRate(10, 'shipping', None),),
+            'standard': (TaxLineRate(20, DEFAULT_RATE_NAME, 'STD'),),
+        })
+
+    def test_resolving_from_the_snapshot_does_not_query(self):
+        [context] = load_cart_contexts([self.cart])
+        TaxRateResolver.rates_for(self.region.id, context.items)
+        with self.assertNumQueries(0):
+            TaxRateResolver.rates_for(self.region.id, context.items)
+
+    def test_committed_changes_rebuild_the_tables(self):
+        self.assertEqual(self.rates()['Poster'][0].rate, 20)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductTaxRate.objects.create(product=self.poster, tax_rate=self.tax_rate('art', 10))
+        self.assertEqual(self.rates()['Poster'][0].rate, 10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.region.tax_rate = 19
+            self.region.save()
+        self.assertEqual(self.rates()['Book'][0].rate, 19)
+
+    def test_unknown_region(self):
+        with self.assertRaises(ValueError):
+            TaxRateResolver.rates_for(uuid.uuid4(), [])
@@ -0,0 +1,70 @@
+import tempfile
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from core.common.vector_index import CachedVectorIndex, LocalVectorIndex, VectorIndex
+
+
+class LocalVectorIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.index = LocalVectorIndex()
+        self.index.upsert(['a', 'b'], [[1, 0], [0, 1]], [{'n': 1}, {'n': 2}])
+
+    def test_vector_index_is_abstract(self):
+        with self.assertRaises(TypeError):
+            VectorIndex()
+
+    def test_saved_index_loads_and_refreshes_when_saved_again(self):
+        self.index.save(self.path)
+        loaded = LocalVectorIndex.load(self.path)
+        self.assertEqual(loaded.query([1, 0.1], top_k=1)['matches'][0]['id'], 'a')
+        self.assertFalse(loaded.refresh())
+
+        self.index.upsert(['c'], [[1, 1]])
+        self.index.save(self.path)
+        self.assertTrue(loaded.refresh())
+        self.assertEqual(len(loaded), 3)
+        self.assertEqual(loaded.query([1, 1], top_k=1)['matches'][0]['id'], 'c')
+
+
+class CachedVectorIndexTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.backend = LocalVectorIndex()
+        self.backend.upsert(['a', 'b'], [[1, 0], [0, 1]], [{'n': 1}, {'n': 2}])
+        self.index = CachedVectorIndex(self.backend, check_interval=60)
+
+    def test_callers_get_their_own_copy(self):
+        first = self.index.query([1, 0], top_k=1)
+        first['matches'][0]['metadata']['n'] = 99
+        second = self.index.query([1, 0], top_k=1)
+        second['matches'].clear()
+        self.assertEqual(self.index.query([1, 0], top_k=1)['matches'][0]['metadata'], {'n': 1})
+
+    def test_own_upserts_clear_the_cache_at_once(self):
+        self.index.query([1, 0], top_k=1)
+        self.index.upsert(['a'], [[1, 0]], [{'n': 3}])
+        self.assertEqual(self.index.query([1, 0], top_k=1)['matches'][0]['metadata'], {'n': 3})
+
+    def test_other_processes_changes_are_seen_after_the_check_interval(self):
+        other_process = CachedVectorIndex(self.backend, check_interval=60)
+        self.index.query([1, 0], top_k=1)
+        other_process.upsert(['a'], [[1, 0]], [{'n': 3}])
+        self.assertEqual(self.index.query([1, 0], top_k=1)['matches'][0]['metadata'], {'n': 1})
+
+        with mock.patch('core.common.vector_index.time.monotonic', return_value=time.monotonic() + 61):
+            self.assertEqual(self.index.query([1, 0], top_k=1)['matches'][0]['metadata'], {'n': 3})
+
+    def test_new_version_reloads_a_rebuilt_local_index(self):
+        path = tempfile.mkdtemp()
+        self.backend.save(path)
+        index = CachedVectorIndex(LocalVectorIndex.load(path), check_interval=0)
+        self.assertEqual(index.query([1, 1], top_k=1)['matches'][0]['id'], 'a')
+
+        rebuilt = LocalVectorIndex()
+        rebuilt.upsert(['c'], [[1, 1]])
+        rebuilt.save(path)
+        CachedVectorIndex.invalidate()
+        self.assertEqual(index.query([1, 1], top_k=1)['matches'][0]['id'], 'c')
@@ -1,7 +1,69 @@
 # core/dynamic_utils.py or wherever your dynamic serializer logic is placed
 
+import copy
+import threading
 from django.conf import settings
 from importlib import import_module
+from rest_framework import serializers
+
+
+class FrozenFieldsMixin:
+    """
+    Run ModelSerializer field introspection once per class. The resulting
+    field map is frozen on the class and each instance gets a deep copy, which
+    is what DRF needs for binding but skips the model metadata walk.
+    """
+    _frozen_fields = None
+
+    def get_fields(self):
+        cls = type(self)
+        frozen = cls.__dict__.get('_frozen_fields')
+        if frozen is None:
+            frozen = super().get_fields()
+            cls._frozen_fields = frozen
+        return copy.deepcopy(frozen)
+
+
+_serializer_registry = {}
+_registry_lock = threading.Lock()
+
+
+def _registry_key(model_class, depth, exclude_fields, include_fields):
+    include = tuple(include_fields) if include_fields and include_fields != '__all__' else None
+    exclude = tuple(sorted(exclude_fields)) if exclude_fields else ()
+    return (model_class._meta.label, depth, include, exclude)
+
+
+def build_serializer_class(model_class, depth=0, exclude_fields=None, include_fields=None):
+    """
+    Return the dynamic ModelSerializer for this (model, depth, include,
+    exclude) combination, building it on first use and reusing it afterwards.
+    """
+    key = _registry_key(model_class, depth, exclude_fields, include_fields)
+    serializer_class = _serializer_registry.get(key)
+    if serializer_class is not None:
+        return serializer_class
+
+    with _registry_lock:
+        serializer_class = _serializer_registry.get(key)
+        if serializer_class is None:
+            meta_attrs = {'model': model_class, 'depth': depth}
+            # DRF rejects a Meta that sets both fields and exclude
+            if exclude_fields:
+                meta_attrs['exclude'] = list(exclude_fields)
+            else:
+                meta_attrs['fields'] = include_fields or '__all__'
+            serializer_attrs = {
+                'Meta': type('Meta', (object,), meta_attrs)
+            }
+            serializer_class = type(
+                f"{model_class.__name__}Serializer",
+                (FrozenFieldsMixin, serializers.ModelSerializer),
+                serializer_attrs
+            )
+            _serializer_registry[key] = serializer_class
+    return serializer_class
+
 
 def get_serializer_class(model_class, depth=1, exclude_fields=None, include_fields=None):
     class_name = model_class.__name__
@@ -9,7 +71,7 @@ def get_serializer_class(model_class, depth=1, exclude_fields=None, include_fiel
     full_model_name = f"{app_label}.{class_name}"
 
     # Check settings for predefined serializer or instruction for dynamic generation
-    serializer_path = settings.DJANGO_SERIALIZER_CONFIG.get(full_model_name)
+    serializer_path = getattr(settings, 'DJANGO_SERIALIZER_CONFIG', {}).get(full_model_name)
 
     if serializer_path:
         # Import and return the predefined serializer
@@ -18,19 +80,4 @@ def get_serializer_class(model_class, depth=1, exclude_fields=None, include_fiel
         return getattr(module, class_name)
 
     # If None or not specified, proceed with dynamic generation
-    if exclude_fields is None:
-        exclude_fields = []
-
-    # Dynamically create a serializer class
-    meta_attrs = {
-        'model': model_class,
-        'fields': include_fields or '__all__',
-        'exclude': exclude_fields,
-        'depth': depth
-    }
-    serializer_attrs = {
-        'Meta': type('Meta', (object,), meta_attrs)
-    }
-    serializer_class_name = f"{class_name}Serializer"
-    serializer_class = type(serializer_class_name, (serializers.ModelSerializer,), serializer_attrs)
-    return serializer_class
\ No newline at end of file
+    return build_serializer_class(model_class, depth, exclude_fields, include_fields)
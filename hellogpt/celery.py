@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_init
 from dotenv import load_dotenv
 
 # Load the environment variables
@@ -20,6 +21,14 @@ print(f"Celery Broker URL: {app.conf.broker_url}")
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+@worker_init.connect
+def preload_embedding_model(**kwargs):
+    # worker_init runs in the parent before the prefork pool starts
+    from django.conf import settings
+    if getattr(settings, 'EMBEDDING_PRELOAD', False):
+        from core.common.embedding_service import EmbeddingService
+        EmbeddingService.preload()
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
\ No newline at end of file
@@ -227,6 +227,18 @@ REST_FRAMEWORK = {
     ),
 }
 
+# orjson-backed JSON renderer/parser, opt-in; both fall back to DRF's stdlib versions when orjson is not installed
+if os.getenv('ORJSON_ENABLED', 'False') == 'True':
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'core.common.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    )
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = (
+        'core.common.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    )
+
 # -------------------------------------------------------------------
 # Simple JWT Configuration
 # -------------------------------------------------------------------
@@ -338,6 +350,25 @@ CHANNEL_LAYERS = {
     },
 }
 
+# -------------------------------------------------------------------
+# Cache Configuration
+# -------------------------------------------------------------------
+
+# Shared cache so version stamps and cached payloads are visible to every worker
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 # -------------------------------------------------------------------
 # Supabase Configuration
 # -------------------------------------------------------------------
@@ -361,6 +392,39 @@ GOOGLE_PLACES_API_KEY = os.getenv('GOOGLE_PLACES_API_KEY')
 MAPBOX_API_KEY = os.getenv('MAPBOX_API_KEY')
 SUPABASE_PUBLIC_BUCKET_NAME = os.getenv('SUPABASE_PUBLIC_BUCKET_NAME')
 
+# -------------------------------------------------------------------
+# Embeddings
+# -------------------------------------------------------------------
+
+EMBEDDING_MODEL_NAME = os.getenv('EMBEDDING_MODEL_NAME', 'all-MiniLM-L6-v2')
+EMBEDDING_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', '64'))
+# Load the embedding model in the gunicorn (--preload) / celery parent so forked workers share it
+EMBEDDING_PRELOAD = os.getenv('EMBEDDING_PRELOAD', 'False') == 'True'
+# Cache embeddings in Redis keyed by model and text hash so repeat texts skip inference
+EMBEDDING_CACHE_ENABLED = os.getenv('EMBEDDING_CACHE_ENABLED', 'True') == 'True'
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '100000'))
+
+# 'pinecone' for the hosted index, 'local' for the in-process NumPy index (offline runs, benchmarks)
+VECTOR_INDEX_BACKEND = os.getenv('VECTOR_INDEX_BACKEND', 'pinecone')
+# Written by `manage.py build_vector_index`; workers reload it once the build bumps the index version
+VECTOR_INDEX_PATH = os.getenv('VECTOR_INDEX_PATH', str(BASE_DIR / 'vector_index'))
+VECTOR_QUERY_CACHE_SIZE = int(os.getenv('VECTOR_QUERY_CACHE_SIZE', '1024'))
+# How often each process checks the shared index version; cached results can be this many seconds stale
+VECTOR_INDEX_CHECK_SECONDS = int(os.getenv('VECTOR_INDEX_CHECK_SECONDS', '5'))
+PINECONE_API_KEY = os.getenv('PINECONE_API_KEY')
+
+# Serve the generated /api list endpoints from .values() rows instead of ModelSerializer instances
+DYNAMIC_API_FAST_LIST = os.getenv('DYNAMIC_API_FAST_LIST', 'False') == 'True'
+
+# Seconds a stock reservation holds before release_inventory_reservations puts it back
+INVENTORY_RESERVATION_TTL = int(os.getenv('INVENTORY_RESERVATION_TTL', '900'))
+# Turn away unfillable reservations at a Redis counter before they reach the database
+INVENTORY_REDIS_COUNTER = os.getenv('INVENTORY_REDIS_COUNTER', 'False') == 'True'
+
+# Idempotency-Key handling: how long a running request holds its key, and how long its response is replayed
+IDEMPOTENCY_LOCK_TTL = int(os.getenv('IDEMPOTENCY_LOCK_TTL', '60'))
+IDEMPOTENCY_RESPONSE_TTL = int(os.getenv('IDEMPOTENCY_RESPONSE_TTL', str(24 * 60 * 60)))
+
 # -------------------------------------------------------------------
 # Base URL
 # -------------------------------------------------------------------
@@ -440,6 +504,16 @@ SPECTACULAR_SETTINGS = {
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 
+# Sampled API request/response logging (core.common.request_logging)
+API_REQUEST_LOGGING = {
+    'SAMPLE_RATE': float(os.getenv('API_LOG_SAMPLE_RATE', '0.05')),
+    # URL name -> sample rate, e.g. {'magazine-list': 0.01}
+    'ROUTE_SAMPLE_RATES': {},
+    'SLOW_REQUEST_MS': int(os.getenv('API_LOG_SLOW_REQUEST_MS', '1000')),
+    'LOG_PAYLOADS': os.getenv('API_LOG_PAYLOADS', 'False') == 'True',
+    'MAX_PAYLOAD_CHARS': 1024,
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -475,6 +549,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        'api.requests': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         # Add other loggers as needed
     },
 }
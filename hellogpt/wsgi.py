@@ -5,4 +5,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "hellogpt.settings")
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+from django.conf import settings
+
+if settings.EMBEDDING_PRELOAD:
+    # With gunicorn --preload this runs once in the master before workers fork
+    from core.common.embedding_service import EmbeddingService
+    EmbeddingService.preload()
@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from core.models import BaseModel
+from core.models.fields import JSONField
 
 class MagazineType(BaseModel):
     name = models.CharField(max_length=255)
@@ -15,7 +16,7 @@ class Template(BaseModel):
     magazine_type = models.ForeignKey(MagazineType, on_delete=models.SET_NULL, null=True, related_name='templates')
     thumbnail_image = models.ImageField(upload_to='templates/thumbnails/')
     image = models.ImageField(upload_to='templates/images/')
-    structure = models.JSONField()
+    structure = JSONField()
 
     def __str__(self):
         return f"Template {self.id}: {self.name}"
@@ -95,7 +96,7 @@ class AIProcess(BaseModel):
 
 class Page(BaseModel):
     magazine = models.ForeignKey(Magazine, on_delete=models.CASCADE, related_name='pages')
-    content = models.JSONField()
+    content = JSONField()
     accepted = models.BooleanField(default=False)
 
     def __str__(self):
@@ -122,7 +123,7 @@ class CTA(BaseModel):
 
 class GeneratedContent(BaseModel):
     page = models.OneToOneField(Page, on_delete=models.CASCADE, related_name='generated_content')
-    content = models.JSONField()
+    content = JSONField()
     accepted = models.BooleanField(default=False)
 
     def __str__(self):
@@ -74,6 +74,12 @@ class UpdatePageContentResponseSerializer(serializers.Serializer):
     success = serializers.BooleanField()
     message = serializers.CharField()
 
+class StreamPageContentRequestSerializer(serializers.Serializer):
+    prompt = serializers.CharField()
+    provider = serializers.CharField(required=False, default="openai")
+    model = serializers.CharField(required=False, default="gpt-3.5-turbo")
+    max_tokens = serializers.IntegerField(required=False, min_value=1)
+
 class AddPageRequestSerializer(serializers.Serializer):
     content = serializers.JSONField()
 
@@ -0,0 +1,103 @@
+# magazines/services/page_generation_service.py
+
+import json
+import logging
+import time
+from core.common.ai_service import AIService
+from magazines.models import GeneratedContent
+
+logger = logging.getLogger(__name__)
+
+# Partial content is written to the database at most this often while streaming
+PERSIST_INTERVAL_SECONDS = 0.5
+
+
+class PageGenerationService:
+    def __init__(self, page, ai_service=None):
+        self.page = page
+        self._ai_service = ai_service
+
+    def get_ai_service(self, provider):
+        if self._ai_service is None:
+            self._ai_service = AIService(providers=[provider])
+        return self._ai_service
+
+    def build_messages(self, prompt):
+        magazine = self.page.magazine
+        return [
+            {
+                "role": "system",
+                "content": f"You write page content for the magazine '{magazine.title}'.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    def stream(self, prompt, provider="openai", model="gpt-3.5-turbo", max_tokens=None):
+        """
+        Yield text chunks as the model produces them while persisting the
+        accumulated text to the page's GeneratedContent along the way. The
+        page's existing content is left alone until the provider sends its
+        first chunk, so a bad provider or model, or a failed request, never
+        blanks it.
+        """
+        # Raises ValueError for an unknown provider or model before anything is written
+        chunks = self.get_ai_service(provider).stream_chat_response(
+            provider, model, self.build_messages(prompt), max_tokens=max_tokens
+        )
+        generated = None
+        parts = []
+        last_persist = time.monotonic()
+        try:
+            for chunk in chunks:
+                if generated is None:
+                    generated = self._start()
+                parts.append(chunk)
+                yield chunk
+                now = time.monotonic()
+                if now - last_persist >= PERSIST_INTERVAL_SECONDS:
+                    self._persist(generated, parts, complete=False)
+                    last_persist = now
+        except GeneratorExit:
+            # The client went away mid-stream; keep what was generated so far
+            logger.info(f"Client disconnected while streaming page {self.page.id}")
+            self._persist(generated, parts, complete=False)
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming content for page {self.page.id}: {e}", exc_info=True)
+            self._persist(generated, parts, complete=False)
+            raise
+        if generated is None:
+            # An empty completion still replaces the previous content
+            generated = self._start()
+        self._persist(generated, parts, complete=True)
+
+    def stream_events(self, prompt, **kwargs):
+        """Wrap stream() as server-sent events for StreamingHttpResponse."""
+        chunks = self.stream(prompt, **kwargs)
+        try:
+            for chunk in chunks:
+                yield f"event: chunk\ndata: {json.dumps({'text': chunk})}\n\n"
+        except Exception:
+            # stream() has logged the details; they are not for the client
+            yield f"event: error\ndata: {json.dumps({'error': 'Content generation failed.'})}\n\n"
+            return
+        finally:
+            # Closing on disconnect lets stream() save the partial text and release the provider connection
+            chunks.close()
+        yield f"event: done\ndata: {json.dumps({'page_id': str(self.page.id)})}\n\n"
+
+    def _start(self):
+        generated, _ = GeneratedContent.objects.update_or_create(
+            page=self.page,
+            defaults={"content": {"text": "", "complete": False}, "accepted": False},
+        )
+        return generated
+
+    def _persist(self, generated, parts, complete):
+        if generated is None:
+            # Generation never started, so there is nothing to save
+            return
+        # Use a queryset update so each flush is a single UPDATE without model save hooks
+        GeneratedContent.objects.filter(pk=generated.pk).update(
+            content={"text": "".join(parts), "complete": complete}
+        )
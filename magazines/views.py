@@ -13,6 +13,7 @@ from .serializers import (
     GetGeneratedContentResponseSerializer,
     UpdatePageContentRequestSerializer,
     UpdatePageContentResponseSerializer,
+    StreamPageContentRequestSerializer,
     AddPageRequestSerializer,
     AddPageResponseSerializer,
     DeletePageResponseSerializer,
@@ -24,6 +25,8 @@ from .serializers import (
     UpdateCTAResponseSerializer
 )
 from .models import Magazine, Template, AIProcess, Page, QRCode, CTA
+from .services.page_generation_service import PageGenerationService
+from django.http import StreamingHttpResponse
 
 class TemplateViewSet(viewsets.ViewSet):
     permission_classes = [AllowAny]
@@ -194,6 +197,29 @@ class PageViewSet(viewsets.ViewSet):
         except Page.DoesNotExist:
             return Response({"success": False, "error": "Page not found."}, status=status.HTTP_404_NOT_FOUND)
 
+    @action(detail=True, methods=['post'], url_path='magazines/(?P<magazine_id>[^/.]+)/pages/(?P<page_id>[^/.]+)/generate-stream')
+    def stream_page_content(self, request, magazine_id=None, page_id=None):
+        serializer = StreamPageContentRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            page = Page.objects.select_related('magazine').get(id=page_id, magazine__id=magazine_id, magazine__user=request.user)
+        except Page.DoesNotExist:
+            return Response({"success": False, "error": "Page not found."}, status=status.HTTP_404_NOT_FOUND)
+        service = PageGenerationService(page)
+        response = StreamingHttpResponse(
+            service.stream_events(
+                data['prompt'],
+                provider=data['provider'],
+                model=data['model'],
+                max_tokens=data.get('max_tokens'),
+            ),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Stop nginx from buffering the stream
+        return response
+
     @action(detail=True, methods=['post'], url_path='magazines/(?P<magazine_id>[^/.]+)/pages')
     def add_new_page(self, request, magazine_id=None):
         serializer = AddPageRequestSerializer(data=request.data)
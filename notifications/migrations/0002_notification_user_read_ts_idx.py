@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-19 10:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notifications", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "read", "timestamp"], name="notification_user_read_ts_idx"
+            ),
+        ),
+    ]
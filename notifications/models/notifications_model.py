@@ -2,12 +2,13 @@
 from django.db import models
 from django.conf import settings
 from core.models import BaseModel
+from core.models.fields import JSONField
 
 
 class NotificationPreferences(BaseModel):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notification_preferences')
-    email_notifications = models.JSONField(default=dict)
-    sms_notifications = models.JSONField(default=dict)
+    email_notifications = JSONField(default=dict)
+    sms_notifications = JSONField(default=dict)
 
     def __str__(self):
         return f"NotificationPreferences {self.id} for {self.user.email}"
@@ -24,5 +25,10 @@ class Notification(BaseModel):
     timestamp = models.DateTimeField(auto_now_add=True)
     read = models.BooleanField(default=False)
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['user', 'read', 'timestamp'], name='notification_user_read_ts_idx'),
+        ]
+
     def __str__(self):
         return f"Notification {self.id}: {self.type} for {self.user.email} at {self.timestamp}"
\ No newline at end of file
@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 class NotificationSerializer(serializers.Serializer):
-    notification_id = serializers.CharField()
+    notification_id = serializers.CharField(source='id')
     type = serializers.ChoiceField(choices=["Message", "Alert"])
     content = serializers.CharField()
     timestamp = serializers.DateTimeField()
@@ -10,6 +10,16 @@ class NotificationSerializer(serializers.Serializer):
 class NotificationsResponseSerializer(serializers.Serializer):
     success = serializers.BooleanField()
     notifications = NotificationSerializer(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
+
+class UnreadCountResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    unread_count = serializers.IntegerField()
+
+class MarkAllNotificationsReadResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    updated = serializers.IntegerField()
+    message = serializers.CharField()
 
 class MarkNotificationReadResponseSerializer(serializers.Serializer):
     success = serializers.BooleanField()
@@ -0,0 +1,171 @@
+# notifications/services/notification_counters.py
+
+import json
+import logging
+import redis
+from core.common.redis_utils import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+UNREAD_KEY = "notifications:unread:{user_id}"
+RECENT_KEY = "notifications:recent:{user_id}"
+RECENT_SIZE = 50
+PREVIEW_LENGTH = 200
+# Seeded counters expire so any drift from a seed/increment race heals itself
+UNREAD_TTL_SECONDS = 60 * 60
+
+# Counters are only adjusted while the key exists. A missing key means the
+# counter is cold and gets reseeded from the database on the next read,
+# which keeps an INCR on a missing key from producing a wrong badge.
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+_DECR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('DECRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0)
+    value = 0
+end
+return value
+"""
+
+# Rewrite the recent-list entries for one notification id (or every entry, for '*'):
+# ARGV[2] 'read' marks them read, 'delete' drops them. The list is at most RECENT_SIZE long.
+_UPDATE_RECENT = """
+local entries = redis.call('LRANGE', KEYS[1], 0, -1)
+local dropped = false
+for i, raw in ipairs(entries) do
+    local entry = cjson.decode(raw)
+    if ARGV[1] == '*' or entry['notification_id'] == ARGV[1] then
+        if ARGV[2] == 'delete' then
+            redis.call('LSET', KEYS[1], i - 1, '')
+            dropped = true
+        elseif not entry['read'] then
+            entry['read'] = true
+            redis.call('LSET', KEYS[1], i - 1, cjson.encode(entry))
+        end
+    end
+end
+if dropped then
+    redis.call('LREM', KEYS[1], 0, '')
+end
+return 1
+"""
+
+
+class NotificationCounters:
+    """
+    Per-user unread badge counter and recent-items ring buffer in Redis.
+    Recent entries carry the fields of NotificationSerializer (content cut
+    to a preview) and are updated when notifications are read or deleted.
+    Without Redis configured, updates are skipped and reads come from the
+    database.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_connection()
+
+    def notification_created(self, notification):
+        if self.client is None:
+            return
+        entry = json.dumps({
+            "notification_id": str(notification.id),
+            "type": notification.type,
+            "content": notification.content[:PREVIEW_LENGTH],
+            "timestamp": notification.timestamp.isoformat(),
+            "read": notification.read,
+        })
+        unread_key = UNREAD_KEY.format(user_id=notification.user_id)
+        recent_key = RECENT_KEY.format(user_id=notification.user_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            if not notification.read:
+                pipe.eval(_INCR_IF_EXISTS, 1, unread_key, 1)
+            pipe.lpush(recent_key, entry)
+            pipe.ltrim(recent_key, 0, RECENT_SIZE - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Redis error updating notification counters for user {notification.user_id}: {e}")
+
+    def notifications_read(self, user_id, count, notification_id=None):
+        if self.client is None:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            if count > 0:
+                pipe.eval(_DECR_IF_EXISTS, 1, UNREAD_KEY.format(user_id=user_id), count)
+            if notification_id is not None:
+                pipe.eval(_UPDATE_RECENT, 1, RECENT_KEY.format(user_id=user_id), str(notification_id), 'read')
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Redis error marking notifications read for user {user_id}: {e}")
+
+    def all_read(self, user_id):
+        if self.client is None:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.set(UNREAD_KEY.format(user_id=user_id), 0, ex=UNREAD_TTL_SECONDS)
+            pipe.eval(_UPDATE_RECENT, 1, RECENT_KEY.format(user_id=user_id), '*', 'read')
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Redis error resetting unread count for user {user_id}: {e}")
+
+    def notification_deleted(self, notification):
+        if self.client is None:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            if not notification.read:
+                pipe.eval(_DECR_IF_EXISTS, 1, UNREAD_KEY.format(user_id=notification.user_id), 1)
+            pipe.eval(_UPDATE_RECENT, 1, RECENT_KEY.format(user_id=notification.user_id), str(notification.id), 'delete')
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Redis error removing notification {notification.id} from counters: {e}")
+
+    def unread_count(self, user_id):
+        if self.client is None:
+            return self._count_unread(user_id)
+        key = UNREAD_KEY.format(user_id=user_id)
+        try:
+            value = self.client.get(key)
+            if value is not None:
+                return int(value)
+        except redis.RedisError as e:
+            logger.error(f"Redis error reading unread count for user {user_id}: {e}")
+            return self._count_unread(user_id)
+        count = self._count_unread(user_id)
+        try:
+            # NX so a value written by a concurrent seed or all_read is kept
+            self.client.set(key, count, nx=True, ex=UNREAD_TTL_SECONDS)
+        except redis.RedisError as e:
+            logger.error(f"Redis error seeding unread count for user {user_id}: {e}")
+        return count
+
+    def recent(self, user_id, limit=RECENT_SIZE):
+        if self.client is None:
+            return None
+        key = RECENT_KEY.format(user_id=user_id)
+        try:
+            entries = [json.loads(entry) for entry in self.client.lrange(key, 0, limit - 1)]
+            if any('read' not in entry for entry in entries):
+                # Written before entries carried their read state; start the list over
+                self.client.delete(key)
+                return None
+        except redis.RedisError as e:
+            logger.error(f"Redis error reading recent notifications for user {user_id}: {e}")
+            return None
+        return entries
+
+    def _count_unread(self, user_id):
+        from notifications.models import Notification
+
+        # Answered from the (user, read, timestamp) index
+        return Notification.objects.filter(user_id=user_id, read=False).count()
@@ -0,0 +1,32 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+from .models import Notification
+from .services.notification_counters import NotificationCounters
+
+# Sent after queryset updates that mark notifications read, since
+# QuerySet.update() does not fire post_save. Provides user_id and count, plus
+# notification_id when a single notification was marked read.
+notifications_marked_read = Signal()
+
+
+@receiver(post_save, sender=Notification)
+def track_created_notification(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: NotificationCounters().notification_created(instance))
+
+
+@receiver(post_delete, sender=Notification)
+def track_deleted_notification(sender, instance, **kwargs):
+    transaction.on_commit(lambda: NotificationCounters().notification_deleted(instance))
+
+
+@receiver(notifications_marked_read)
+def track_read_notifications(sender, user_id, count, all_read=False, notification_id=None, **kwargs):
+    def update_counters():
+        counters = NotificationCounters()
+        if all_read:
+            counters.all_read(user_id)
+        else:
+            counters.notifications_read(user_id, count, notification_id)
+    transaction.on_commit(update_counters)
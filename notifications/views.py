@@ -1,13 +1,23 @@
+import uuid
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .serializers import (
+    NotificationSerializer,
     NotificationsResponseSerializer,
+    UnreadCountResponseSerializer,
+    MarkAllNotificationsReadResponseSerializer,
     MarkNotificationReadResponseSerializer,
     UpdateNotificationPreferencesRequestSerializer,
     UpdateNotificationPreferencesResponseSerializer
 )
 from .models import Notification, NotificationPreferences
+from .services.notification_counters import NotificationCounters
+from .signals import notifications_marked_read
+from core.common.keyset_pagination import KeysetPagination
+
+class NotificationPagination(KeysetPagination):
+    timestamp_field = 'timestamp'
 
 class NotificationViewSet(viewsets.ViewSet):
     def get_permissions(self):
@@ -16,25 +26,67 @@ class NotificationViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['get'], url_path='notifications')
     def list_notifications(self, request):
-        notifications = Notification.objects.filter(user=request.user)
-        serializer = NotificationSerializer(notifications, many=True)
+        notifications = Notification.objects.filter(user=request.user).only(
+            'id', 'type', 'content', 'timestamp', 'read'
+        )
+        if request.query_params.get('unread') in ('1', 'true'):
+            notifications = notifications.filter(read=False)
+        notifications, next_cursor = NotificationPagination().paginate_queryset(notifications, request)
+        serializer = NotificationsResponseSerializer({
+            "success": True,
+            "notifications": notifications,
+            "next_cursor": next_cursor
+        })
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='notifications/unread-count')
+    def unread_count(self, request):
+        serializer = UnreadCountResponseSerializer({
+            "success": True,
+            "unread_count": NotificationCounters().unread_count(request.user.id)
+        })
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='notifications/recent')
+    def recent_notifications(self, request):
+        recent = NotificationCounters().recent(request.user.id)
+        if not recent:
+            # Cold or unavailable ring buffer; serve the newest rows from the database
+            rows = Notification.objects.filter(user=request.user).order_by('-timestamp')[:10]
+            recent = NotificationSerializer(rows, many=True).data
         return Response({
             "success": True,
-            "notifications": serializer.data
+            "notifications": recent
         }, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], url_path='notifications/(?P<notification_id>[^/.]+)/read')
     def mark_as_read(self, request, notification_id=None):
         try:
-            notification = Notification.objects.get(notification_id=notification_id, user=request.user)
-            notification.read = True
-            notification.save()
-            return Response({
-                "success": True,
-                "message": "Notification marked as read."
-            }, status=status.HTTP_200_OK)
-        except Notification.DoesNotExist:
+            notification_id = uuid.UUID(notification_id)
+        except ValueError:
+            return Response({"success": False, "error": "Notification not found."}, status=status.HTTP_404_NOT_FOUND)
+        # Only an unread -> read transition touches the counter
+        updated = Notification.objects.filter(id=notification_id, user=request.user, read=False).update(read=True)
+        if not updated and not Notification.objects.filter(id=notification_id, user=request.user).exists():
             return Response({"success": False, "error": "Notification not found."}, status=status.HTTP_404_NOT_FOUND)
+        notifications_marked_read.send(
+            sender=Notification, user_id=request.user.id, count=updated, notification_id=notification_id,
+        )
+        return Response({
+            "success": True,
+            "message": "Notification marked as read."
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='notifications/read-all')
+    def mark_all_as_read(self, request):
+        updated = Notification.objects.filter(user=request.user, read=False).update(read=True)
+        notifications_marked_read.send(sender=Notification, user_id=request.user.id, count=updated, all_read=True)
+        serializer = MarkAllNotificationsReadResponseSerializer({
+            "success": True,
+            "updated": updated,
+            "message": "All notifications marked as read."
+        })
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['put'], url_path='notifications/preferences')
     def update_preferences(self, request):
@@ -9,6 +9,7 @@ from .serializers import (
 )
 from .models import Payment, PromoCode
 from django.conf import settings
+from core.common.idempotency import idempotent
 
 class PaymentViewSet(viewsets.ViewSet):
     def get_permissions(self):
@@ -16,6 +17,7 @@ class PaymentViewSet(viewsets.ViewSet):
         return [IsAuthenticated()]
 
     @action(detail=False, methods=['post'], url_path='payments')
+    @idempotent
     def process_payment(self, request):
         serializer = ProcessPaymentRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-19 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("print_orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="printorder",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="print_order_user_created_idx"
+            ),
+        ),
+    ]
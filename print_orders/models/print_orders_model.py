@@ -1,10 +1,10 @@
 # print_orders/models.py
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from core.models import BaseModel
 from magazines.models import Magazine
 from payments.models import PaymentMethod, Address, PromoCode
-import datetime
 
 class PrintOption(BaseModel):
     OPTION_TYPES = [
@@ -52,21 +52,35 @@ class PrintOrder(BaseModel):
     carrier = models.CharField(max_length=100, null=True, blank=True)
     total_cost = models.FloatField(default=0.0)
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Serves the keyset-paginated order history, newest first
+            models.Index(fields=['user', 'created_at', 'id'], name='print_order_user_created_idx'),
+        ]
+
     def __str__(self):
         return f"PrintOrder {self.id} by {self.user.email}"
 
     def calculate_total_cost(self):
-        base_cost = self.quantity * self.paper_type.price_per_unit
-        finish_cost = self.quantity * self.finish.additional_cost
-        shipping_cost = self.shipping_method.cost
-        taxes = (base_cost + finish_cost + shipping_cost) * 0.1
-        discount = 0.0
-        if self.promo_code and self.promo_code.is_active and self.promo_code.valid_from <= datetime.datetime.now() <= self.promo_code.valid_to:
-            discount = base_cost * (self.promo_code.discount_percentage / 100)
-        self.total_cost = base_cost + finish_cost + shipping_cost + taxes - discount
-        self.save()
+        from print_orders.services.pricing_engine import PrintPricingEngine
+
+        discount_percentage = 0.0
+        if self.promo_code_id:
+            promo = self.promo_code
+            if promo.is_active and promo.valid_from <= timezone.now() <= promo.valid_to:
+                discount_percentage = promo.discount_percentage
+        # Options are resolved by FK id against the cached price table; only options it does not know yet are fetched
+        quote = PrintPricingEngine.quote(
+            quantity=self.quantity,
+            paper_type=self.paper_type_id,
+            finish=self.finish_id,
+            shipping_method=self.shipping_method_id,
+            discount_percentage=discount_percentage,
+        )
+        self.total_cost = quote["total_cost"]
+        return self.total_cost
 
     def save(self, *args, **kwargs):
         if not self.total_cost:
             self.calculate_total_cost()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
@@ -47,6 +47,21 @@ class CalculatePrintCostResponseSerializer(serializers.Serializer):
     cost_breakdown = PrintCostBreakdownSerializer()
     message = serializers.CharField()
 
+class PrintCostQuoteItemSerializer(serializers.Serializer):
+    quantity = serializers.IntegerField(min_value=1)
+    paper_type = serializers.CharField()
+    finish = serializers.CharField(required=False, allow_null=True, default=None)
+    shipping_method = serializers.CharField(required=False, allow_null=True, default=None)
+
+class CalculatePrintCostBatchRequestSerializer(serializers.Serializer):
+    quotes = PrintCostQuoteItemSerializer(many=True)
+    promo_code = serializers.CharField(required=False)
+
+class CalculatePrintCostBatchResponseSerializer(serializers.Serializer):
+    success = serializers.BooleanField()
+    quotes = PrintCostBreakdownSerializer(many=True)
+    message = serializers.CharField()
+
 class PlacePrintOrderRequestSerializer(serializers.Serializer):
     magazine_id = serializers.CharField()
     quantity = serializers.IntegerField()
@@ -84,4 +99,5 @@ class PrintOrderHistoryItemSerializer(serializers.Serializer):
 
 class PrintOrderHistoryResponseSerializer(serializers.Serializer):
     success = serializers.BooleanField()
-    orders = PrintOrderHistoryItemSerializer(many=True)
\ No newline at end of file
+    orders = PrintOrderHistoryItemSerializer(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
\ No newline at end of file
@@ -0,0 +1,149 @@
+# print_orders/services/pricing_engine.py
+
+import logging
+import threading
+import uuid
+from collections import namedtuple
+from types import MappingProxyType
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+TAX_RATE = 0.1
+PRICE_TABLE_VERSION_KEY = "print_orders:price_table:version"
+
+PriceEntry = namedtuple(
+    "PriceEntry",
+    ["id", "option_type", "name", "price_per_unit", "additional_cost", "cost"],
+)
+
+
+class PriceTable:
+    """
+    Immutable snapshot of every PrintOption, keyed by id and by
+    (option_type, name). Quotes computed from a table never touch the database
+    unless an option is missing and a fallback is given.
+    """
+
+    def __init__(self, entries, version):
+        self.version = version
+        self._by_id = MappingProxyType({entry.id: entry for entry in entries})
+        self._by_name = MappingProxyType(
+            {(entry.option_type, entry.name): entry for entry in entries}
+        )
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def resolve(self, option_type, key, fallback=None):
+        """
+        Look up an option by id (UUID or string) or by its display name.
+        Options missing from the snapshot, e.g. created earlier in the current
+        transaction, are passed to fallback(option_type, key) when given.
+        """
+        if key is None:
+            return None
+        entry = self._by_id.get(str(key))
+        if entry is None:
+            entry = self._by_name.get((option_type, key))
+        if entry is None and fallback is not None:
+            entry = fallback(option_type, key)
+        if entry is None or entry.option_type != option_type:
+            raise ValueError(f"Unknown {option_type} option: {key}")
+        return entry
+
+    def quote(self, quantity, paper_type, finish, shipping_method, discount_percentage=0.0, fallback=None):
+        paper = self.resolve("paper_type", paper_type, fallback)
+        finish_option = self.resolve("finish", finish, fallback)
+        shipping = self.resolve("shipping", shipping_method, fallback)
+
+        base_cost = quantity * (paper.price_per_unit or 0.0) if paper else 0.0
+        finish_cost = quantity * (finish_option.additional_cost or 0.0) if finish_option else 0.0
+        shipping_cost = (shipping.cost or 0.0) if shipping else 0.0
+        taxes = (base_cost + finish_cost + shipping_cost) * TAX_RATE
+        discount = base_cost * ((discount_percentage or 0.0) / 100)
+        return {
+            "base_cost": base_cost,
+            "finish_cost": finish_cost,
+            "shipping_cost": shipping_cost,
+            "taxes": taxes,
+            "discount": discount,
+            "total_cost": base_cost + finish_cost + shipping_cost + taxes - discount,
+        }
+
+    def quote_many(self, requests, fallback=None):
+        """
+        Quote a batch of option combinations against this one snapshot.
+        Each request is a dict with the keyword arguments of quote().
+        """
+        return [self.quote(**request, fallback=fallback) for request in requests]
+
+
+class PrintPricingEngine:
+    """
+    Process-wide holder for the current PriceTable. The version stamp lives in
+    the shared cache, so a PrintOption change in any worker invalidates the
+    table everywhere on the next lookup.
+    """
+
+    _lock = threading.Lock()
+    _table = None
+
+    @classmethod
+    def current_version(cls):
+        version = cache.get(PRICE_TABLE_VERSION_KEY)
+        if version is None:
+            cache.add(PRICE_TABLE_VERSION_KEY, 1, timeout=None)
+            version = cache.get(PRICE_TABLE_VERSION_KEY, 1)
+        return version
+
+    @classmethod
+    def invalidate(cls):
+        try:
+            cache.incr(PRICE_TABLE_VERSION_KEY)
+        except ValueError:
+            cache.set(PRICE_TABLE_VERSION_KEY, 1, timeout=None)
+        cls._table = None
+
+    @classmethod
+    def get_table(cls):
+        version = cls.current_version()
+        table = cls._table
+        if table is not None and table.version == version:
+            return table
+        with cls._lock:
+            if cls._table is None or cls._table.version != version:
+                cls._table = cls._load(version)
+            return cls._table
+
+    @classmethod
+    def _load(cls, version):
+        from print_orders.models import PrintOption
+
+        rows = PrintOption.objects.values_list(*PriceEntry._fields)
+        entries = [PriceEntry(str(row[0]), *row[1:]) for row in rows]
+        logger.debug(f"Loaded print price table version {version} with {len(entries)} options")
+        return PriceTable(entries, version)
+
+    @classmethod
+    def _load_option(cls, option_type, key):
+        """Read one option the cached table does not know yet straight from the database."""
+        from print_orders.models import PrintOption
+
+        try:
+            lookup = {"id": uuid.UUID(str(key))}
+        except ValueError:
+            lookup = {"name": key}
+        row = PrintOption.objects.filter(option_type=option_type, **lookup).values_list(*PriceEntry._fields).first()
+        if row is None:
+            return None
+        logger.debug(f"Print option {key} is not in the cached price table yet, read it from the database")
+        return PriceEntry(str(row[0]), *row[1:])
+
+    @classmethod
+    def quote(cls, **kwargs):
+        return cls.get_table().quote(**kwargs, fallback=cls._load_option)
+
+    @classmethod
+    def quote_many(cls, requests):
+        return cls.get_table().quote_many(requests, fallback=cls._load_option)
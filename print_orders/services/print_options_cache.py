@@ -0,0 +1,74 @@
+# print_orders/services/print_options_cache.py
+
+import hashlib
+import json
+import logging
+from django.core.cache import cache
+from django.utils.http import parse_etags
+from .pricing_engine import PrintPricingEngine
+
+logger = logging.getLogger(__name__)
+
+PRINT_OPTIONS_CACHE_KEY = "print_orders:print_options_etag:v{version}"
+PRINT_OPTIONS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# How each option type is grouped and which columns it exposes in the payload
+OPTION_GROUPS = {
+    "paper_type": ("paper_types", lambda o: {"type": o["name"], "price_per_unit": o["price_per_unit"]}),
+    "finish": ("finish_options", lambda o: {"type": o["name"], "additional_cost": o["additional_cost"]}),
+    "size": ("sizes", lambda o: {"size": o["name"], "dimensions": o["dimensions"]}),
+    "shipping": ("shipping_options", lambda o: {
+        "method": o["name"],
+        "estimated_delivery": o["estimated_delivery"],
+        "cost": o["cost"],
+    }),
+}
+
+
+def get_print_options_version():
+    # PrintOption changes bump this version through print_orders.signals
+    return PrintPricingEngine.current_version()
+
+
+def get_print_options_etag(payload):
+    # Hash the content itself, so the ETag only changes when the response body does
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f'"print-options-{digest[:32]}"'
+
+
+def etag_matches(request, etag):
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return "*" in etags or etag in etags
+
+
+def build_print_options_payload():
+    """Group every PrintOption by type using a single query."""
+    from print_orders.models import PrintOption
+
+    payload = {group: [] for group, _ in OPTION_GROUPS.values()}
+    options = PrintOption.objects.order_by("option_type", "name").values(
+        "option_type", "name", "price_per_unit", "additional_cost",
+        "dimensions", "estimated_delivery", "cost",
+    )
+    for option in options:
+        group = OPTION_GROUPS.get(option["option_type"])
+        if group is None:
+            continue
+        key, project = group
+        payload[key].append(project(option))
+    return payload
+
+
+def get_print_options(version):
+    """The grouped payload and its ETag, cached together per version."""
+    key = PRINT_OPTIONS_CACHE_KEY.format(version=version)
+    cached = cache.get(key)
+    if cached is None:
+        logger.debug(f"Print options cache miss for version {version}")
+        payload = build_print_options_payload()
+        cached = (payload, get_print_options_etag(payload))
+        cache.set(key, cached, timeout=PRINT_OPTIONS_CACHE_TIMEOUT)
+    return cached
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import PrintOption
+from .services.pricing_engine import PrintPricingEngine
+
+
+@receiver([post_save, post_delete], sender=PrintOption)
+def invalidate_print_price_table(sender, **kwargs):
+    # The version stamps both the price table and the cached print-options payload.
+    # Bump it after commit so no worker reloads the pre-change rows.
+    transaction.on_commit(PrintPricingEngine.invalidate)
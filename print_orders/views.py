@@ -5,14 +5,24 @@ from .serializers import (
     PrintOptionsResponseSerializer,
     CalculatePrintCostRequestSerializer,
     CalculatePrintCostResponseSerializer,
+    CalculatePrintCostBatchRequestSerializer,
+    CalculatePrintCostBatchResponseSerializer,
     PlacePrintOrderRequestSerializer,
     PlacePrintOrderResponseSerializer,
     PrintOrderStatusResponseSerializer,
     PrintOrderHistoryResponseSerializer
 )
 from .models import PrintOrder, PrintOption
+from .services.pricing_engine import PrintPricingEngine
+from .services.print_options_cache import (
+    etag_matches,
+    get_print_options as build_print_options,
+    get_print_options_version
+)
+from core.common.idempotency import idempotent
+from core.common.keyset_pagination import KeysetPagination
 from magazines.models import Magazine
-from payments.models import PaymentMethod, Address
+from payments.models import PaymentMethod, Address, PromoCode
 from django.utils import timezone
 import datetime
 
@@ -23,45 +33,42 @@ class PrintOrderViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['get'], url_path='print-options')
     def get_print_options(self, request):
-        paper_types = PrintOption.objects.filter(option_type='paper_type')
-        finish_options = PrintOption.objects.filter(option_type='finish')
-        sizes = PrintOption.objects.filter(option_type='size')
-        shipping_options = PrintOption.objects.filter(option_type='shipping')
+        payload, etag = build_print_options(get_print_options_version())
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
         serializer = PrintOptionsResponseSerializer({
             "success": True,
-            "paper_types": paper_types.values('type', 'price_per_unit'),
-            "finish_options": finish_options.values('type', 'additional_cost'),
-            "sizes": sizes.values('size', 'dimensions'),
-            "shipping_options": shipping_options.values('method', 'estimated_delivery', 'cost')
+            **payload
         })
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.data, status=status.HTTP_200_OK, headers=headers)
+
+    def _get_promo_discount(self, code):
+        if not code:
+            return 0.0
+        now = timezone.now()
+        promo = PromoCode.objects.get(code=code, is_active=True, valid_from__lte=now, valid_to__gte=now)
+        return promo.discount_percentage
 
     @action(detail=False, methods=['post'], url_path='print-orders/calculate')
     def calculate_print_cost(self, request):
         serializer = CalculatePrintCostRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
-        # Implement cost calculation logic based on options
-        base_cost = data['quantity'] * 3.00  # Placeholder
-        finish_cost = data['quantity'] * 0.75  # Placeholder
-        shipping_cost = 15.00  # Placeholder
-        taxes = (base_cost + finish_cost + shipping_cost) * 0.1  # 10% tax
-        discount = 0.0
-        if data.get('promo_code'):
-            try:
-                promo = PromoCode.objects.get(code=data['promo_code'], is_active=True)
-                discount = base_cost * (promo.discount_percentage / 100)
-            except PromoCode.DoesNotExist:
-                return Response({"success": False, "message": "Invalid promo code."}, status=status.HTTP_404_NOT_FOUND)
-        total_cost = base_cost + finish_cost + shipping_cost + taxes - discount
-        cost_breakdown = {
-            "base_cost": base_cost,
-            "finish_cost": finish_cost,
-            "shipping_cost": shipping_cost,
-            "taxes": taxes,
-            "discount": discount,
-            "total_cost": total_cost
-        }
+        try:
+            discount_percentage = self._get_promo_discount(data.get('promo_code'))
+        except PromoCode.DoesNotExist:
+            return Response({"success": False, "message": "Invalid promo code."}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            cost_breakdown = PrintPricingEngine.quote(
+                quantity=data['quantity'],
+                paper_type=data['paper_type'],
+                finish=data['finish'],
+                shipping_method=data['shipping_method'],
+                discount_percentage=discount_percentage,
+            )
+        except ValueError as e:
+            return Response({"success": False, "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         response_serializer = CalculatePrintCostResponseSerializer({
             "success": True,
             "cost_breakdown": cost_breakdown,
@@ -69,7 +76,30 @@ class PrintOrderViewSet(viewsets.ViewSet):
         })
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['post'], url_path='print-orders/calculate-batch')
+    def calculate_print_cost_batch(self, request):
+        serializer = CalculatePrintCostBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            discount_percentage = self._get_promo_discount(data.get('promo_code'))
+        except PromoCode.DoesNotExist:
+            return Response({"success": False, "message": "Invalid promo code."}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            quotes = PrintPricingEngine.quote_many([
+                dict(item, discount_percentage=discount_percentage) for item in data['quotes']
+            ])
+        except ValueError as e:
+            return Response({"success": False, "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        response_serializer = CalculatePrintCostBatchResponseSerializer({
+            "success": True,
+            "quotes": quotes,
+            "message": "Costs calculated successfully."
+        })
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
     @action(detail=False, methods=['post'], url_path='print-orders')
+    @idempotent
     def place_print_order(self, request):
         serializer = PlacePrintOrderRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -107,19 +137,25 @@ class PrintOrderViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['get'], url_path='print-orders/history')
     def order_history(self, request):
-        orders = PrintOrder.objects.filter(user=request.user)
+        orders = (
+            PrintOrder.objects.filter(user=request.user)
+            .select_related('magazine')
+            .only('id', 'created_at', 'quantity', 'status', 'total_cost', 'magazine__title')
+        )
+        orders, next_cursor = KeysetPagination().paginate_queryset(orders, request)
         serializer = PrintOrderHistoryResponseSerializer({
             "success": True,
             "orders": [
                 {
-                    "order_id": order.order_id,
+                    "order_id": order.id,
                     "magazine_title": order.magazine.title,
                     "quantity": order.quantity,
-                    "order_date": order.order_date,
+                    "order_date": order.created_at.date(),
                     "status": order.status,
                     "total_cost": order.total_cost
                 } for order in orders
-            ]
+            ],
+            "next_cursor": next_cursor
         })
         return Response(serializer.data, status=status.HTTP_200_OK)
 
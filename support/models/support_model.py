@@ -2,6 +2,7 @@
 from django.db import models
 from django.conf import settings
 from core.models import BaseModel
+from core.models.fields import JSONField
 
 class FAQ(BaseModel):
     CATEGORY_CHOICES = [
@@ -46,7 +47,7 @@ class SupportTicket(BaseModel):
     subject = models.CharField(max_length=255)
     description = models.TextField()
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
-    attachments = models.JSONField(null=True, blank=True)
+    attachments = JSONField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Open')
     response = models.TextField(null=True, blank=True)
     responded_at = models.DateTimeField(null=True, blank=True)